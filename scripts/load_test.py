@@ -0,0 +1,147 @@
+"""Local load test for the rooms server: ``python -m scripts.load_test --rooms 250``.
+
+Starts ``term_catan.server`` in a subprocess (or targets ``--url``) and fills
+``--rooms`` rooms with ``--seats`` websocket clients each. Every client plays
+its seat as fast as the server answers: a settlement and road in setup,
+then roll, move the robber and end the turn. At the end it checks that all
+seats of each room hold the same version and state, and reports accepted
+actions, refusals, action-to-delta latency and the server's memory.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import websockets
+
+from term_catan.core.game import Game
+from term_catan.core.topology import NUM_TILES
+from term_catan.services.sync import SyncState, decode_message, encode_message, hello_message, resync_message
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.actions = 0
+        self.messages = 0
+        self.errors: List[str] = []
+        self.latency: List[float] = []
+
+
+def choose_action(state: Dict, seat: int) -> Optional[Tuple[str, List]]:
+    """The next action for ``seat``, or None if it is not that seat's turn."""
+    if state["current_player"] != seat:
+        return None
+    phase = state["phase"]
+    if phase == "setup":
+        game = Game.from_dict(state)
+        if state["setup_pointer"] % 2 == 0:
+            return "setup_place_settlement", [game.setup_settlement_spots()[0]]
+        return "setup_place_road", [game.setup_road_spots()[0]]
+    if phase == "turn_roll":
+        return "roll", []
+    if phase == "robber":
+        return "move_robber", [(state["robber_index"] + 1) % NUM_TILES]
+    return "end_turn", []
+
+
+async def play_seat(url: str, room: str, seat: int, stop: float, stats: Stats) -> SyncState:
+    """Play one seat until ``stop``, then keep reading until the room goes quiet."""
+    sync = SyncState()
+    async with websockets.connect(url, max_queue=None) as ws:
+        await ws.send(encode_message(hello_message(-1, room, seat)))
+        pending: Optional[Tuple[float, int]] = None  # (sent at, version it was sent on)
+        while True:
+            now = time.perf_counter()
+            if pending is None and now < stop and sync.state is not None:
+                action = choose_action(sync.state, seat)
+                if action is not None:
+                    pending = (now, sync.version)
+                    await ws.send(encode_message({"type": "action", "name": action[0], "args": action[1]}))
+                    stats.actions += 1
+            try:
+                data = await asyncio.wait_for(ws.recv(), timeout=max(0.05, stop - now + 1))
+            except asyncio.TimeoutError:
+                if time.perf_counter() > stop + 1:
+                    return sync
+                continue
+            message = decode_message(data)
+            if message["type"] == "error":
+                stats.errors.append(message["message"])
+                pending = None
+                continue
+            if message["type"] == "delta" and message["version"] <= sync.version:
+                continue  # already caught up past it
+            if not sync.receive(message, data):
+                await ws.send(encode_message(resync_message(sync.version)))
+                continue
+            stats.messages += 1
+            if pending is not None and sync.version > pending[1]:
+                stats.latency.append(time.perf_counter() - pending[0])
+                pending = None
+
+
+async def run(url: str, rooms: int, seats: int, duration: float) -> Stats:
+    stats = Stats()
+    stop = time.perf_counter() + duration
+    tasks = []
+    for r in range(rooms):
+        tasks += [asyncio.ensure_future(play_seat(url, f"room{r}", s, stop, stats)) for s in range(seats)]
+        if r % 25 == 24:
+            await asyncio.sleep(0.05)  # stagger connects past the listen backlog
+    syncs = await asyncio.gather(*tasks)
+    for r in range(rooms):
+        group = syncs[r * seats:(r + 1) * seats]
+        if any(s.version != group[0].version or s.state != group[0].state for s in group):
+            raise AssertionError(f"room{r} did not converge")
+    versions = [syncs[r * seats].version for r in range(rooms)]
+    print(f"connections {rooms * seats}, actions sent {stats.actions}, states received {stats.messages}")
+    print(f"refused {len(stats.errors)} {sorted(set(stats.errors))}")
+    print(f"room versions: min {min(versions)}, mean {statistics.mean(versions):.0f}; all rooms converged")
+    if stats.latency:
+        lat = sorted(stats.latency)
+        print(
+            f"action->delta latency ms: p50 {1e3 * lat[len(lat) // 2]:.1f}, p99 {1e3 * lat[int(len(lat) * 0.99)]:.1f}; "
+            f"accepted actions/s {len(lat) / duration:.0f}"
+        )
+    return stats
+
+
+def server_memory(pid: int) -> str:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            return next(line.split(":", 1)[1].strip() for line in f if line.startswith("VmRSS"))
+    except (OSError, StopIteration):
+        return "unknown"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m scripts.load_test", description="Load-test the rooms server locally.")
+    parser.add_argument("--rooms", type=int, default=250)
+    parser.add_argument("--seats", type=int, default=4, help="clients per room")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds of play")
+    parser.add_argument("--port", type=int, default=8790, help="port for the spawned server")
+    parser.add_argument("--url", help="test a running server instead of spawning one")
+    args = parser.parse_args(argv)
+    if args.url:
+        asyncio.run(run(args.url, args.rooms, args.seats, args.duration))
+        return
+    server = subprocess.Popen(
+        [sys.executable, "-m", "term_catan.server", "--port", str(args.port), "--seats", str(args.seats)],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        time.sleep(1.0)
+        asyncio.run(run(f"ws://localhost:{args.port}", args.rooms, args.seats, args.duration))
+        print(f"server memory {server_memory(server.pid)}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,5 +2,13 @@ __all__ = [
     "game",
     "models",
     "ai",
+    "topology",
+    "compact",
+    "movegen",
+    "roads",
+    "evaluation",
+    "evaluation_python",
+    "batched",
+    "replay",
 ]
 
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+import math
 import random
+import time
 
-from term_catan.core.game import Game
+from term_catan.core.game import VICTORY_POINTS_TO_WIN, Game
+from term_catan.core.models import BANK_TRADE_RATE, BUILD_COSTS, PIECE_LIMITS, RESOURCES, Player
+from term_catan.core.movegen import Action, apply_action, legal_actions
+from term_catan.core.topology import NUM_TILES
+
+
+# Ways to roll each number with two dice
+DICE_PIPS: Dict[int, int] = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 8: 5, 9: 4, 10: 3, 11: 2, 12: 1}
 
 
 class SimpleAI:
@@ -14,12 +23,311 @@ class SimpleAI:
         player = self.game.state.players[self.game.state.current_player]
         if not player.is_ai:
             return None
-        self.game.roll_and_distribute()
-        try:
-            self.game.demo_build()
-            action = "build_road"
-        except Exception:
-            action = "skip"
+        return self.play_turn()
+
+    def play_turn(self) -> str:
+        """Play the current seat's whole turn, whoever sits there."""
+        if self.game.state.phase == "setup":
+            return self.take_setup_turn()
+        player = self.game.state.players[self.game.state.current_player]
+        if self.game.state.phase == "turn_roll":
+            self.game.roll_and_distribute()
+        if self.game.state.phase == "robber":
+            self.game.move_robber(self.robber_target(player.id))
+        actions = self.build_greedy(player)
         self.game.end_turn()
-        return action
+        return ", ".join(actions) if actions else "skip"
+
+    def take_setup_turn(self) -> str:
+        """Place one starting settlement and its road, then pass setup on."""
+        spots = self.game.setup_settlement_spots()
+        vertex = max(spots, key=lambda v: (self.vertex_score(v), self.game.rng.random()))
+        self.game.setup_place_settlement(vertex)
+        self.game.setup_place_road(self.game.rng.choice(self.game.setup_road_spots()))
+        self.game.advance_setup_pointer(2)
+        self.game.setup_next()
+        return "setup"
+
+    def vertex_score(self, vertex_id: int) -> float:
+        """Expected resource cards per roll from the vertex, robber included."""
+        return self.game.board_evaluator().value(vertex_id)
+
+    def robber_target(self, player_id: int) -> int:
+        """Tile that blocks the most opponent production and none of ours."""
+        state = self.game.state
+        units = state.production_index().tile_units
+        best, best_score = None, None
+        for tidx in range(NUM_TILES):
+            if tidx == state.robber_index or units[tidx].get(player_id):
+                continue
+            score = sum(units[tidx].values()) * DICE_PIPS.get(state.board.tiles[tidx].number, 0)
+            if best_score is None or score > best_score:
+                best, best_score = tidx, score
+        return best if best is not None else (state.robber_index + 1) % NUM_TILES
+
+    def build_greedy(self, player: Player) -> List[str]:
+        """Build the most valuable affordable piece until nothing fits."""
+        game = self.game
+        actions: List[str] = []
+        while True:
+            city_spots = game.city_spots(player.id)
+            settlement_spots = game.settlement_spots(player.id)
+            road_spots = game.road_spots(player.id)
+            saving_for_city = bool(city_spots) and game.pieces_left(player, "city") > 0
+            if city_spots and self._ready(player, "city"):
+                game.build_city(max(city_spots, key=self.vertex_score))
+                actions.append("build_city")
+            elif settlement_spots and self._ready(player, "settlement"):
+                game.build_settlement(max(settlement_spots, key=self.vertex_score))
+                actions.append("build_settlement")
+            elif road_spots and not settlement_spots and self._ready(player, "road"):
+                game.build_road(game.rng.choice(road_spots))
+                actions.append("build_road")
+            elif game.state.dev_deck and not saving_for_city and game.can_afford(player, "dev_card"):
+                game.buy_dev_card()
+                actions.append("buy_dev_card")
+            else:
+                return actions
+
+    def plan_trades(self, player: Player, piece: str) -> Optional[List[Tuple[str, str]]]:
+        """Bank trades (give, get) that make the piece affordable; None if out of reach."""
+        if piece in PIECE_LIMITS and self.game.pieces_left(player, piece) <= 0:
+            return None
+        cost = BUILD_COSTS[piece]
+        have = dict(player.resources)
+        trades: List[Tuple[str, str]] = []
+        for res, need in cost.items():
+            while have[res] < need:
+                give = max(RESOURCES, key=lambda r: have[r] - cost.get(r, 0))
+                if have[give] - cost.get(give, 0) < BANK_TRADE_RATE:
+                    return None
+                have[give] -= BANK_TRADE_RATE
+                have[res] += 1
+                trades.append((give, res))
+        if any(self.game.state.bank[res] < sum(1 for _, r in trades if r == res) for _, res in trades):
+            return None
+        return trades
+
+    def _ready(self, player: Player, piece: str) -> bool:
+        """Whether the piece can be built now, bank-trading surplus for any shortfall."""
+        trades = self.plan_trades(player, piece)
+        if trades is None:
+            return False
+        for give, get in trades:
+            self.game.bank_trade(give, get)
+        return True
+
+
+# Rollout value of one expected resource per roll, in victory points
+PRODUCTION_WEIGHT = 1.0
+
+# Settlement spots the search considers during setup
+SETUP_CANDIDATES = 6
+
+
+def _position_key(game: Game) -> Tuple:
+    state = game.state
+    return (
+        state.current_player,
+        state.phase,
+        state.has_rolled,
+        state.robber_index,
+        len(state.dev_deck),
+        tuple(state.settlements),
+        tuple(state.cities),
+        tuple(state.roads),
+        tuple(tuple(p.resources.values()) for p in state.players),
+        tuple(len(p.dev_cards) for p in state.players),
+    )
+
+
+class _Node:
+    __slots__ = ("seat", "visits", "totals", "children")
+
+    def __init__(self, seat: int, num_players: int) -> None:
+        self.seat = seat  # player who chose the action leading here
+        self.visits = 0
+        self.totals = [0.0] * num_players
+        self.children: Dict[Action, "_Node"] = {}
+
+
+class MCTSAI:
+    """Open-loop UCT search over ``candidate_actions`` with randomized rollouts.
+
+    Each iteration replays the tree from a clone of the live game with fresh
+    dice, so chance outcomes are averaged rather than branched on. The search
+    stops at ``time_budget`` seconds or ``iterations`` iterations, whichever
+    comes first, and the subtree under a chosen action is kept for the next
+    decision when the game is still where the search left it. Searching only
+    reads the live game, so it can run on a worker thread.
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        time_budget: Optional[float] = 0.5,
+        iterations: Optional[int] = None,
+        exploration: float = 0.7,
+        rollout_turns: int = 8,
+        seed: Optional[int] = None,
+    ) -> None:
+        if time_budget is None and iterations is None:
+            raise ValueError("MCTSAI needs a time budget or an iteration budget")
+        self.game = game
+        self.time_budget = time_budget
+        self.iterations = iterations
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns
+        self.rng = random.Random(seed)
+        self._root: Optional[_Node] = None
+        self._root_key: Optional[Tuple] = None
+        self._stopped = False
+
+    def take_turn_if_ai(self) -> Optional[str]:
+        player = self.game.state.players[self.game.state.current_player]
+        if not player.is_ai:
+            return None
+        actions: List[str] = []
+        while self.game.state.current_player == player.id and self.game.winner() is None:
+            action = self.choose_action()
+            self.play(action)
+            actions.append(str(action[0]))
+            if action[0] == "setup":
+                break
+        return ", ".join(actions)
+
+    def candidate_actions(self, game: Game) -> List[Action]:
+        """Moves the search branches on: legal actions, narrowed to keep the tree shallow.
+
+        Setup considers only the best-scoring spots. During a turn, bank trades
+        are folded into the build they pay for (see ``_apply``), so a trade and
+        the piece it funds are one decision instead of several.
+        """
+        state = game.state
+        planner = SimpleAI(game)
+        if state.phase == "setup":
+            actions = legal_actions(game)
+            best = sorted({a[1] for a in actions}, key=planner.vertex_score, reverse=True)[:SETUP_CANDIDATES]
+            return [a for a in actions if a[1] in best]
+        if state.phase != "turn_actions":
+            return legal_actions(game)
+        player = state.players[state.current_player]
+        actions: List[Action] = [("end",)]
+        for piece, spots in (("city", game.city_spots), ("settlement", game.settlement_spots), ("road", game.road_spots)):
+            if planner.plan_trades(player, piece) is not None:
+                actions += [(piece, spot) for spot in spots(player.id)]
+        if state.dev_deck and planner.plan_trades(player, "dev_card") is not None:
+            actions.append(("dev_card",))
+        if "knight" in player.dev_cards:
+            actions += [("knight", t) for t in range(NUM_TILES) if t != state.robber_index]
+        return actions
+
+    @staticmethod
+    def _apply(game: Game, action: Action) -> None:
+        kind = action[0]
+        if kind in BUILD_COSTS:
+            # Make any bank trades the candidate move assumed
+            SimpleAI(game)._ready(game.state.players[game.state.current_player], str(kind))
+        apply_action(game, action)
+
+    def choose_action(self) -> Action:
+        self._check_running()
+        actions = self.candidate_actions(self.game)
+        key = _position_key(self.game)
+        if self._root is None or self._root_key != key:
+            self._root = _Node(self.game.state.current_player, len(self.game.state.players))
+            self._root_key = key
+        if len(actions) == 1:
+            return actions[0]
+        self.search()
+        children = self._root.children
+        return max(actions, key=lambda a: children[a].visits if a in children else -1)
+
+    def play(self, action: Action) -> None:
+        """Apply a chosen action to the live game and keep its subtree."""
+        self._apply(self.game, action)
+        self.advance(action)
+
+    def advance(self, action: Action) -> None:
+        """Move the root to the subtree of an action just applied to the game."""
+        root = self._root
+        self._root = root.children.get(action) if root is not None else None
+        self._root_key = _position_key(self.game)
+
+    def stop(self) -> None:
+        """Retire this AI once its move is no longer wanted.
+
+        A search running on another thread returns after its current
+        iteration, and any later search raises ValueError.
+        """
+        self._stopped = True
+
+    def _check_running(self) -> None:
+        if self._stopped:
+            raise ValueError("This AI was stopped")
+
+    def search(self) -> int:
+        """Run iterations within the budget (or until ``stop``); returns how many ran."""
+        self._check_running()
+        if self._root is None:
+            self._root = _Node(self.game.state.current_player, len(self.game.state.players))
+            self._root_key = _position_key(self.game)
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        count = 0
+        while (self.iterations is None or count < self.iterations) and not self._stopped:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self._iterate(self._root)
+            count += 1
+        return count
+
+    def _iterate(self, root: _Node) -> None:
+        sim = self.game.clone()
+        sim.rng.seed(self.rng.getrandbits(64))
+        num_players = len(sim.state.players)
+        node = root
+        path = [root]
+        while sim.winner() is None:
+            actions = self.candidate_actions(sim)
+            seat = sim.state.current_player
+            untried = [a for a in actions if a not in node.children]
+            if untried:
+                action = self.rng.choice(untried)
+                node.children[action] = node = _Node(seat, num_players)
+                self._apply(sim, action)
+                path.append(node)
+                break
+            log_n = math.log(node.visits)
+            action = max(actions, key=lambda a: self._uct(node.children[a], log_n))
+            node = node.children[action]
+            self._apply(sim, action)
+            path.append(node)
+        rewards = self._rollout(sim)
+        for visited in path:
+            visited.visits += 1
+            totals = visited.totals
+            for i, r in enumerate(rewards):
+                totals[i] += r
+
+    def _uct(self, child: _Node, log_parent_visits: float) -> float:
+        mean = child.totals[child.seat] / child.visits
+        return mean + self.exploration * math.sqrt(log_parent_visits / child.visits)
 
+    def _rollout(self, sim: Game) -> List[float]:
+        policy = SimpleAI(sim)
+        for _ in range(self.rollout_turns):
+            if sim.winner() is not None:
+                break
+            policy.play_turn()
+        winner = sim.winner()
+        if winner is not None:
+            return [1.0 if p.id == winner else 0.0 for p in sim.state.players]
+        # Unfinished: points plus expected production per roll, kept below a win
+        production = [0.0] * len(sim.state.players)
+        for number, per_player in sim.state.production_index().by_number.items():
+            for pid, vec in per_player.items():
+                production[pid] += DICE_PIPS.get(number, 0) / 36 * sum(vec)
+        return [
+            min((p.victory_points + PRODUCTION_WEIGHT * production[p.id]) / VICTORY_POINTS_TO_WIN, 1.0) * 0.9
+            for p in sim.state.players
+        ]
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+import random
+
+import numpy as np
+
+from term_catan.core.compact import CITY, EMPTY, PHASE_CODES, PHASES, SETTLEMENT
+from term_catan.core.game import LONGEST_ROAD_POINTS, VICTORY_POINTS_TO_WIN, Game
+from term_catan.core.models import BUILD_COSTS, PIECE_LIMITS, RESOURCE_INDEX, RESOURCES
+from term_catan.core.movegen import NO_OWNER
+from term_catan.core.roads import RoadNetwork, longest_road_holder
+from term_catan.core.topology import EDGE_VERTICES, NUM_EDGES, NUM_TILES, NUM_VERTICES, VERTEX_NEIGHBORS, VERTEX_TILES
+
+
+# Many games stepped together, for training and bulk evaluation.
+#
+# State is held structure-of-arrays: axis 0 is the game, so a roll, a build
+# or an end of turn is one array operation across every selected game.
+# Dice come from each game's own random.Random, drawn exactly as Game draws
+# them, so a batch replays the same games its Game sources would. Longest
+# road stays on a per-game RoadNetwork, since trail search does not vectorize.
+
+PIECES: Tuple[str, ...] = ("road", "settlement", "city")
+PIECE_INDEX = {piece: i for i, piece in enumerate(PIECES)}
+COST_MATRIX = {
+    piece: np.array([cost.get(r, 0) for r in RESOURCES], dtype=np.int64) for piece, cost in BUILD_COSTS.items()
+}
+
+PHASE_SETUP = PHASE_CODES["setup"]
+PHASE_ROLL = PHASE_CODES["turn_roll"]
+PHASE_ACTIONS = PHASE_CODES["turn_actions"]
+PHASE_ROBBER = PHASE_CODES["robber"]
+
+# vertex x vertex: the vertex and its neighbours (spots a building there rules out)
+VERTEX_BLOCKS = np.eye(NUM_VERTICES, dtype=bool)
+for _vid, _neighbors in enumerate(VERTEX_NEIGHBORS):
+    VERTEX_BLOCKS[_vid, list(_neighbors)] = True
+# edge x vertex incidence
+EDGE_VERTEX = np.zeros((NUM_EDGES, NUM_VERTICES), dtype=bool)
+for _eid, _ends in enumerate(EDGE_VERTICES):
+    EDGE_VERTEX[_eid, list(_ends)] = True
+VERTEX_EDGE = EDGE_VERTEX.T.copy()
+# vertex x tile production units of a settlement
+VERTEX_TILE_UNITS = np.zeros((NUM_VERTICES, NUM_TILES), dtype=np.int64)
+for _vid, _tiles in enumerate(VERTEX_TILES):
+    VERTEX_TILE_UNITS[_vid, list(_tiles)] = 1
+for _table in (VERTEX_BLOCKS, EDGE_VERTEX, VERTEX_EDGE, VERTEX_TILE_UNITS):
+    _table.setflags(write=False)
+
+
+class BatchedGame:
+    """N games of the same seat count as NumPy arrays over a leading game axis.
+
+    Covers the turn loop after setup: rolling and paying out production,
+    moving the robber, building against costs and piece limits, and ending
+    the turn. Every step takes an optional boolean ``mask`` of the games it
+    applies to (default: all) and raises ``ValueError`` like ``Game`` would
+    if any selected game breaks a rule, leaving the batch unchanged. Dev
+    cards and bank trades are not batched; ``to_game`` hands a single game
+    back for those.
+    """
+
+    def __init__(self, games: Sequence[Game]) -> None:
+        if not games:
+            raise ValueError("BatchedGame needs at least one game")
+        num_players = len(games[0].state.players)
+        if any(len(g.state.players) != num_players for g in games):
+            raise ValueError("All games in a batch need the same number of players")
+        n = len(games)
+        self.num_games = n
+        self.num_players = num_players
+        self._templates = [g.clone() for g in games]
+        self.rngs: List[random.Random] = [t.rng for t in self._templates]
+
+        self.resources = np.zeros((n, num_players, len(RESOURCES)), dtype=np.int64)
+        self.bank = np.zeros((n, len(RESOURCES)), dtype=np.int64)
+        self.pieces = np.zeros((n, num_players, len(PIECES)), dtype=np.int64)  # built, in PIECES order
+        self.victory_points = np.zeros((n, num_players), dtype=np.int64)
+        self.current_player = np.zeros(n, dtype=np.int64)
+        self.phase = np.zeros(n, dtype=np.int64)  # compact.PHASE_CODES
+        self.has_rolled = np.zeros(n, dtype=bool)
+        self.robber_index = np.zeros(n, dtype=np.int64)
+        self.tile_resource = np.full((n, NUM_TILES), -1, dtype=np.int64)  # RESOURCES index, -1 for desert
+        self.tile_number = np.zeros((n, NUM_TILES), dtype=np.int64)
+        self.vertex_owner = np.full((n, NUM_VERTICES), NO_OWNER, dtype=np.int64)
+        self.vertex_kind = np.full((n, NUM_VERTICES), EMPTY, dtype=np.int64)
+        self.edge_owner = np.full((n, NUM_EDGES), NO_OWNER, dtype=np.int64)
+        self.tile_units = np.zeros((n, num_players, NUM_TILES), dtype=np.int64)  # settlement 1, city 2
+        self.longest_road_owner = np.full(n, NO_OWNER, dtype=np.int64)
+        self.road_networks: List[RoadNetwork] = []
+        # Build order, kept so to_game reproduces the GameState lists exactly
+        self._placements: List[Tuple[List[Tuple[int, int]], List[Tuple[int, int]], List[Tuple[int, int]]]] = []
+
+        for i, game in enumerate(self._templates):
+            state = game.state
+            for pid, player in enumerate(state.players):
+                self.resources[i, pid] = [player.resources[r] for r in RESOURCES]
+                self.pieces[i, pid] = (player.roads, player.settlements, player.cities)
+                self.victory_points[i, pid] = player.victory_points
+            self.bank[i] = [state.bank[r] for r in RESOURCES]
+            self.current_player[i] = state.current_player
+            self.phase[i] = PHASE_CODES[state.phase]
+            self.has_rolled[i] = state.has_rolled
+            self.robber_index[i] = state.robber_index
+            for tidx, tile in enumerate(state.board.tiles):
+                self.tile_resource[i, tidx] = RESOURCE_INDEX.get(tile.resource, -1)
+                self.tile_number[i, tidx] = tile.number
+            for pid, vid in state.settlements:
+                self.vertex_owner[i, vid] = pid
+                self.vertex_kind[i, vid] = SETTLEMENT
+            for pid, vid in state.cities:
+                self.vertex_owner[i, vid] = pid
+                self.vertex_kind[i, vid] = CITY
+            for pid, eid in state.roads:
+                self.edge_owner[i, eid] = pid
+            for tidx, units in enumerate(state.production_index().tile_units):
+                for pid, count in units.items():
+                    self.tile_units[i, pid, tidx] = count
+            if state.longest_road_owner is not None:
+                self.longest_road_owner[i] = state.longest_road_owner
+            self.road_networks.append(game.road_network().clone())
+            self._placements.append((list(state.settlements), list(state.cities), list(state.roads)))
+        # tile x resource one-hot per game; the board never changes
+        self._tile_onehot = (self.tile_resource[:, :, None] == np.arange(len(RESOURCES))).astype(np.int64)
+
+    # --- helpers ---
+
+    def _select(self, mask: Optional[np.ndarray]) -> np.ndarray:
+        if mask is None:
+            return np.ones(self.num_games, dtype=bool)
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (self.num_games,):
+            raise ValueError(f"mask must have shape ({self.num_games},)")
+        return mask
+
+    @staticmethod
+    def _require(ok: np.ndarray, mask: np.ndarray, message: str) -> None:
+        bad = np.flatnonzero(mask & ~ok)
+        if len(bad):
+            raise ValueError(f"{message} (games {bad.tolist()})")
+
+    def _require_build_phase(self, mask: np.ndarray) -> None:
+        self._require(self.phase != PHASE_SETUP, mask, "Place starting settlements/roads during setup")
+        self._require((self.phase == PHASE_ACTIONS) & self.has_rolled, mask, "Roll before building")
+
+    def _current(self, table: np.ndarray) -> np.ndarray:
+        """Rows of a (game, player, ...) table for each game's current player."""
+        return table[np.arange(self.num_games), self.current_player]
+
+    # --- queries ---
+
+    def pieces_left(self, piece: str) -> np.ndarray:
+        return PIECE_LIMITS[piece] - self._current(self.pieces)[:, PIECE_INDEX[piece]]
+
+    def can_afford(self, piece: str) -> np.ndarray:
+        return (self._current(self.resources) >= COST_MATRIX[piece]).all(axis=1)
+
+    def settlement_spots(self) -> np.ndarray:
+        """(games, vertices) open spots at the end of the current player's roads."""
+        blocked = (self.vertex_owner != NO_OWNER) @ VERTEX_BLOCKS
+        road_ends = (self.edge_owner == self.current_player[:, None]) @ EDGE_VERTEX
+        return road_ends & ~blocked
+
+    def road_spots(self) -> np.ndarray:
+        """(games, edges) free edges touching the current player's network; opponents' buildings cut it."""
+        mine = self.current_player[:, None]
+        road_ends = (self.edge_owner == mine) @ EDGE_VERTEX
+        owner = self.vertex_owner
+        anchors = (owner == mine) | (road_ends & ((owner == NO_OWNER) | (owner == mine)))
+        return (anchors @ VERTEX_EDGE) & (self.edge_owner == NO_OWNER)
+
+    def city_spots(self) -> np.ndarray:
+        """(games, vertices) the current player's settlements."""
+        return (self.vertex_owner == self.current_player[:, None]) & (self.vertex_kind == SETTLEMENT)
+
+    def winner(self) -> np.ndarray:
+        """Winning seat per game, ``NO_OWNER`` while undecided (lowest seat first, as in ``Game``)."""
+        won = self.victory_points >= VICTORY_POINTS_TO_WIN
+        return np.where(won.any(axis=1), won.argmax(axis=1), NO_OWNER)
+
+    # --- turn steps ---
+
+    def roll_and_distribute(self, mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Roll for each selected game and pay out production.
+
+        Returns the rolls (0 for games not selected) and the (games, players,
+        resources) production owed, before the bank runs short, as ``Game``
+        reports its gains.
+        """
+        mask = self._select(mask)
+        self._require((self.phase == PHASE_ROLL) | (self.phase == PHASE_ACTIONS), mask, "Cannot roll now")
+        rolls = np.zeros(self.num_games, dtype=np.int64)
+        for i in np.flatnonzero(mask):
+            rng = self.rngs[i]
+            rolls[i] = rng.randint(1, 6) + rng.randint(1, 6)
+        seven = mask & (rolls == 7)
+        paying = mask & ~seven
+        producing = (self.tile_number == rolls[:, None]) & paying[:, None]
+        producing[np.arange(self.num_games), self.robber_index] = False
+        gains = (self.tile_units * producing[:, None, :]) @ self._tile_onehot
+        # The bank pays in seat order and runs out mid-way as in Game
+        for pid in range(self.num_players):
+            take = np.minimum(gains[:, pid], self.bank)
+            self.bank -= take
+            self.resources[:, pid] += take
+        self.phase[seven] = PHASE_ROBBER
+        self.has_rolled[paying] = True
+        self.phase[paying] = PHASE_ACTIONS
+        return rolls, gains
+
+    def move_robber(self, tiles: np.ndarray, mask: Optional[np.ndarray] = None) -> None:
+        mask = self._select(mask)
+        tiles = np.asarray(tiles, dtype=np.int64)
+        self._require(self.phase == PHASE_ROBBER, mask, "Robber can only be moved during robber phase")
+        self._require((tiles >= 0) & (tiles < NUM_TILES), mask, "Invalid tile index")
+        self.robber_index[mask] = tiles[mask]
+        self.has_rolled[mask] = True
+        self.phase[mask] = PHASE_ACTIONS
+
+    def end_turn(self, mask: Optional[np.ndarray] = None) -> None:
+        mask = self._select(mask)
+        self.current_player[mask] = (self.current_player[mask] + 1) % self.num_players
+        self.has_rolled[mask] = False
+        self.phase[mask] = PHASE_ROLL
+
+    def _pay(self, piece: str, mask: np.ndarray) -> None:
+        games = np.flatnonzero(mask)
+        cost = COST_MATRIX[piece]
+        self.resources[games, self.current_player[games]] -= cost
+        self.bank[games] += cost
+
+    def _check_build(self, piece: str, mask: np.ndarray, spots: np.ndarray, targets: np.ndarray, where: str) -> None:
+        self._require_build_phase(mask)
+        names = {"road": "roads", "settlement": "settlements", "city": "cities"}
+        self._require(self.pieces_left(piece) > 0, mask, f"No {names[piece]} left")
+        in_range = (targets >= 0) & (targets < spots.shape[1])
+        legal = in_range & spots[np.arange(self.num_games), np.where(in_range, targets, 0)]
+        self._require(legal, mask, where)
+        self._require(self.can_afford(piece), mask, f"Not enough resources to build a {piece}")
+
+    def build_road(self, edges: np.ndarray, mask: Optional[np.ndarray] = None) -> None:
+        mask = self._select(mask)
+        edges = np.asarray(edges, dtype=np.int64)
+        self._check_build("road", mask, self.road_spots(), edges, "Road must connect to your network")
+        self._pay("road", mask)
+        games = np.flatnonzero(mask)
+        players = self.current_player[games]
+        self.edge_owner[games, edges[games]] = players
+        self.pieces[games, players, PIECE_INDEX["road"]] += 1
+        for i, pid, eid in zip(games.tolist(), players.tolist(), edges[games].tolist()):
+            self.road_networks[i].add_road(pid, eid)
+            self._placements[i][2].append((pid, eid))
+            self._update_longest_road(i)
+
+    def build_settlement(self, vertices: np.ndarray, mask: Optional[np.ndarray] = None) -> None:
+        mask = self._select(mask)
+        vertices = np.asarray(vertices, dtype=np.int64)
+        self._check_build(
+            "settlement",
+            mask,
+            self.settlement_spots(),
+            vertices,
+            "Settlement must be on your road and away from other buildings",
+        )
+        self._pay("settlement", mask)
+        games = np.flatnonzero(mask)
+        players = self.current_player[games]
+        self.vertex_owner[games, vertices[games]] = players
+        self.vertex_kind[games, vertices[games]] = SETTLEMENT
+        self.tile_units[games, players] += VERTEX_TILE_UNITS[vertices[games]]
+        self.pieces[games, players, PIECE_INDEX["settlement"]] += 1
+        self.victory_points[games, players] += 1
+        for i, pid, vid in zip(games.tolist(), players.tolist(), vertices[games].tolist()):
+            self.road_networks[i].add_building(pid, vid)
+            self._placements[i][0].append((pid, vid))
+            self._update_longest_road(i)
+
+    def build_city(self, vertices: np.ndarray, mask: Optional[np.ndarray] = None) -> None:
+        mask = self._select(mask)
+        vertices = np.asarray(vertices, dtype=np.int64)
+        self._check_build("city", mask, self.city_spots(), vertices, "City must replace one of your settlements")
+        self._pay("city", mask)
+        games = np.flatnonzero(mask)
+        players = self.current_player[games]
+        self.vertex_kind[games, vertices[games]] = CITY
+        self.tile_units[games, players] += VERTEX_TILE_UNITS[vertices[games]]
+        self.pieces[games, players, PIECE_INDEX["settlement"]] -= 1
+        self.pieces[games, players, PIECE_INDEX["city"]] += 1
+        self.victory_points[games, players] += 1
+        for i, pid, vid in zip(games.tolist(), players.tolist(), vertices[games].tolist()):
+            settlements, cities, _ = self._placements[i]
+            settlements.remove((pid, vid))
+            cities.append((pid, vid))
+
+    def _update_longest_road(self, i: int) -> None:
+        holder = None if self.longest_road_owner[i] == NO_OWNER else int(self.longest_road_owner[i])
+        new_holder = longest_road_holder(self.road_networks[i].longest, holder)
+        if new_holder == holder:
+            return
+        if holder is not None:
+            self.victory_points[i, holder] -= LONGEST_ROAD_POINTS
+        if new_holder is not None:
+            self.victory_points[i, new_holder] += LONGEST_ROAD_POINTS
+        self.longest_road_owner[i] = NO_OWNER if new_holder is None else new_holder
+
+    # --- back to single games ---
+
+    def to_game(self, i: int) -> Game:
+        """Game ``i`` as a standalone ``Game``, random stream included."""
+        game = self._templates[i].clone()  # the template's rng is the one the batch rolls with
+        state = game.state
+        for pid, player in enumerate(state.players):
+            player.resources = dict(zip(RESOURCES, self.resources[i, pid].tolist()))
+            player.roads, player.settlements, player.cities = self.pieces[i, pid].tolist()
+            player.victory_points = int(self.victory_points[i, pid])
+        state.bank = dict(zip(RESOURCES, self.bank[i].tolist()))
+        state.current_player = int(self.current_player[i])
+        state.phase = PHASES[self.phase[i]]
+        state.has_rolled = bool(self.has_rolled[i])
+        state.robber_index = int(self.robber_index[i])
+        settlements, cities, roads = self._placements[i]
+        state.settlements, state.cities, state.roads = list(settlements), list(cities), list(roads)
+        state.longest_road_owner = None if self.longest_road_owner[i] == NO_OWNER else int(self.longest_road_owner[i])
+        tiles = state.board_for_write().tiles
+        for pid, vid in settlements:
+            for tidx in VERTEX_TILES[vid]:
+                tiles[tidx].buildings.setdefault(pid, "settlement")
+        for pid, vid in cities:
+            for tidx in VERTEX_TILES[vid]:
+                tiles[tidx].buildings[pid] = "city"
+        # Placement indexes are rebuilt from the lists on first use
+        state._production = state._movegen = state._road_network = state._evaluator = None
+        return game
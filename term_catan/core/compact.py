@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from term_catan.core.dev_cards import DEV_CARD_TYPES
+from term_catan.core.models import BUILD_COSTS, RESOURCES, GameState
+from term_catan.core.topology import NUM_EDGES, NUM_VERTICES, VERTEX_TILES
+
+
+# Compact, array-backed mirror of GameState for simulation/AI rollouts.
+#
+# Resources are fixed-index int arrays (RESOURCES order), board occupancy is a
+# flat bytearray over the canonical vertex/edge ids of core.topology, and every
+# string field is a small integer code. Tiles never change after setup, so
+# copies share them. Round-trips losslessly through GameState.to_dict().
+# A state takes about a quarter of GameState's memory, and a copy about a
+# third of a Game.clone() (tests/test_compact.py measures both).
+
+PHASES: Tuple[str, ...] = ("setup", "turn_roll", "turn_actions", "robber")
+PHASE_CODES: Dict[str, int] = {p: i for i, p in enumerate(PHASES)}
+TILE_RESOURCES: Tuple[str, ...] = RESOURCES + ("desert",)
+TILE_RESOURCE_CODES: Dict[str, int] = {r: i for i, r in enumerate(TILE_RESOURCES)}
+DEV_CARD_CODES: Dict[str, int] = {c: i for i, c in enumerate(DEV_CARD_TYPES)}
+# Piece/card costs as vectors in RESOURCES order
+COST_VECTORS: Dict[str, Tuple[int, ...]] = {
+    name: tuple(cost.get(r, 0) for r in RESOURCES) for name, cost in BUILD_COSTS.items()
+}
+
+# vertex_kind values
+EMPTY = 0
+SETTLEMENT = 1
+CITY = 2
+# vertex_owner / edge_owner value for an unoccupied spot
+NO_OWNER = 0xFF
+
+
+class CompactPlayer:
+    __slots__ = (
+        "id",
+        "name",
+        "is_ai",
+        "resources",
+        "roads",
+        "settlements",
+        "cities",
+        "victory_points",
+        "dev_cards",
+        "played_knights",
+    )
+
+    def __init__(self, pid: int, name: str, is_ai: bool) -> None:
+        self.id = pid
+        self.name = name
+        self.is_ai = is_ai
+        self.resources = array("i", bytes(4 * len(RESOURCES)))
+        self.roads = 0
+        self.settlements = 0
+        self.cities = 0
+        self.victory_points = 0
+        self.dev_cards = bytearray()  # DEV_CARD_TYPES codes
+        self.played_knights = 0
+
+    def copy(self) -> "CompactPlayer":
+        other = CompactPlayer.__new__(CompactPlayer)
+        other.id = self.id
+        other.name = self.name
+        other.is_ai = self.is_ai
+        other.resources = array("i", self.resources)
+        other.roads = self.roads
+        other.settlements = self.settlements
+        other.cities = self.cities
+        other.victory_points = self.victory_points
+        other.dev_cards = bytearray(self.dev_cards)
+        other.played_knights = self.played_knights
+        return other
+
+    def can_afford(self, cost: Tuple[int, ...]) -> bool:
+        res = self.resources
+        for i, c in enumerate(cost):
+            if res[i] < c:
+                return False
+        return True
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "is_ai": self.is_ai,
+            "resources": dict(zip(RESOURCES, self.resources)),
+            "roads": self.roads,
+            "settlements": self.settlements,
+            "cities": self.cities,
+            "victory_points": self.victory_points,
+            "dev_cards": [DEV_CARD_TYPES[c] for c in self.dev_cards],
+            "played_knights": self.played_knights,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict) -> "CompactPlayer":
+        p = CompactPlayer(data["id"], data["name"], data.get("is_ai", False))
+        resources = data.get("resources", {})
+        p.resources = array("i", [resources.get(r, 0) for r in RESOURCES])
+        p.roads = data.get("roads", 0)
+        p.settlements = data.get("settlements", 0)
+        p.cities = data.get("cities", 0)
+        p.victory_points = data.get("victory_points", 0)
+        p.dev_cards = bytearray(DEV_CARD_CODES[c] for c in data.get("dev_cards", []))
+        p.played_knights = data.get("played_knights", 0)
+        return p
+
+
+class CompactTile:
+    __slots__ = ("resource", "number")
+
+    def __init__(self, resource: int, number: int) -> None:
+        self.resource = resource  # TILE_RESOURCES code
+        self.number = number
+
+
+class CompactState:
+    __slots__ = (
+        "players",
+        "tiles",
+        "current_player",
+        "bank",
+        "robber_index",
+        "dev_deck",
+        "phase",
+        "has_rolled",
+        "setup_step",
+        "setup_pointer",
+        "vertex_owner",
+        "vertex_kind",
+        "edge_owner",
+        "settlement_order",
+        "city_order",
+        "road_order",
+        "legacy_buildings",
+        "longest_road_owner",
+    )
+
+    def __init__(self, players: List[CompactPlayer], tiles: Tuple[CompactTile, ...]) -> None:
+        self.players = players
+        self.tiles = tiles  # shared, never mutated
+        self.current_player = 0
+        self.bank = array("i", [19] * len(RESOURCES))
+        self.robber_index = 0
+        self.dev_deck = bytearray()
+        self.phase = PHASE_CODES["setup"]
+        self.has_rolled = False
+        self.setup_step = 1
+        self.setup_pointer = 0
+        self.vertex_owner = bytearray([NO_OWNER]) * NUM_VERTICES
+        self.vertex_kind = bytearray(NUM_VERTICES)
+        self.edge_owner = bytearray([NO_OWNER]) * NUM_EDGES
+        # Build order of pieces, kept so to_dict reproduces the GameState lists exactly
+        self.settlement_order = bytearray()
+        self.city_order = bytearray()
+        self.road_order = bytearray()
+        # Per-tile building markers of legacy saves that predate vertex placements
+        self.legacy_buildings: Optional[Tuple[Dict[int, str], ...]] = None
+        self.longest_road_owner: Optional[int] = None
+
+    def copy(self) -> "CompactState":
+        other = CompactState.__new__(CompactState)
+        other.players = [p.copy() for p in self.players]
+        other.tiles = self.tiles
+        other.current_player = self.current_player
+        other.bank = array("i", self.bank)
+        other.robber_index = self.robber_index
+        other.dev_deck = bytearray(self.dev_deck)
+        other.phase = self.phase
+        other.has_rolled = self.has_rolled
+        other.setup_step = self.setup_step
+        other.setup_pointer = self.setup_pointer
+        other.vertex_owner = bytearray(self.vertex_owner)
+        other.vertex_kind = bytearray(self.vertex_kind)
+        other.edge_owner = bytearray(self.edge_owner)
+        other.settlement_order = bytearray(self.settlement_order)
+        other.city_order = bytearray(self.city_order)
+        other.road_order = bytearray(self.road_order)
+        other.legacy_buildings = self.legacy_buildings
+        other.longest_road_owner = self.longest_road_owner
+        return other
+
+    # --- cheap mutators for rollouts (rule checks live in Game) ---
+
+    def pay(self, player: CompactPlayer, cost: Tuple[int, ...]) -> None:
+        res = player.resources
+        bank = self.bank
+        for i, c in enumerate(cost):
+            res[i] -= c
+            bank[i] += c
+
+    def place_settlement(self, pid: int, vertex_id: int) -> None:
+        self.vertex_owner[vertex_id] = pid
+        self.vertex_kind[vertex_id] = SETTLEMENT
+        self.settlement_order.append(vertex_id)
+
+    def upgrade_city(self, vertex_id: int) -> None:
+        self.vertex_kind[vertex_id] = CITY
+        self.settlement_order.remove(vertex_id)
+        self.city_order.append(vertex_id)
+
+    def place_road(self, pid: int, edge_id: int) -> None:
+        self.edge_owner[edge_id] = pid
+        self.road_order.append(edge_id)
+
+    # --- lossless conversion to/from GameState.to_dict() ---
+
+    def _derived_buildings(self) -> List[Dict[int, str]]:
+        buildings: List[Dict[int, str]] = [{} for _ in self.tiles]
+        for vid in self.settlement_order:
+            for tidx in VERTEX_TILES[vid]:
+                buildings[tidx].setdefault(self.vertex_owner[vid], "settlement")
+        for vid in self.city_order:
+            for tidx in VERTEX_TILES[vid]:
+                buildings[tidx][self.vertex_owner[vid]] = "city"
+        return buildings
+
+    def to_dict(self) -> Dict:
+        buildings = list(self.legacy_buildings) if self.legacy_buildings is not None else self._derived_buildings()
+        return {
+            "players": [p.to_dict() for p in self.players],
+            "current_player": self.current_player,
+            "board": {
+                "tiles": [
+                    {"resource": TILE_RESOURCES[t.resource], "number": t.number, "buildings": dict(b)}
+                    for t, b in zip(self.tiles, buildings)
+                ]
+            },
+            "bank": dict(zip(RESOURCES, self.bank)),
+            "robber_index": self.robber_index,
+            "dev_deck": [DEV_CARD_TYPES[c] for c in self.dev_deck],
+            "phase": PHASES[self.phase],
+            "has_rolled": self.has_rolled,
+            "setup_step": self.setup_step,
+            "setup_pointer": self.setup_pointer,
+            "settlements": [[self.vertex_owner[v], v] for v in self.settlement_order],
+            "roads": [[self.edge_owner[e], e] for e in self.road_order],
+            "cities": [[self.vertex_owner[v], v] for v in self.city_order],
+            "longest_road_owner": self.longest_road_owner,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict) -> "CompactState":
+        players = [CompactPlayer.from_dict(p) for p in data["players"]]
+        tiles = tuple(
+            CompactTile(TILE_RESOURCE_CODES[t["resource"]], t["number"]) for t in data["board"]["tiles"]
+        )
+        state = CompactState(players, tiles)
+        state.current_player = data["current_player"]
+        bank = data.get("bank", {})
+        state.bank = array("i", [bank.get(r, 19) for r in RESOURCES])
+        state.robber_index = data.get("robber_index", 0)
+        state.dev_deck = bytearray(DEV_CARD_CODES[c] for c in data.get("dev_deck", []))
+        state.phase = PHASE_CODES[data.get("phase", "setup")]
+        state.has_rolled = data.get("has_rolled", False)
+        state.setup_step = data.get("setup_step", 1)
+        state.setup_pointer = data.get("setup_pointer", 0)
+        state.longest_road_owner = data.get("longest_road_owner")
+        for pid, vid in data.get("settlements", []):
+            state.place_settlement(pid, vid)
+        for pid, vid in data.get("cities", []):
+            state.vertex_owner[vid] = pid
+            state.vertex_kind[vid] = CITY
+            state.city_order.append(vid)
+        for pid, eid in data.get("roads", []):
+            state.place_road(pid, eid)
+        saved = [{int(pid): kind for pid, kind in t.get("buildings", {}).items()} for t in data["board"]["tiles"]]
+        if saved != state._derived_buildings():
+            state.legacy_buildings = tuple(saved)
+        return state
+
+    @staticmethod
+    def from_state(state: GameState) -> "CompactState":
+        return CompactState.from_dict(state.to_dict())
+
+    def to_state(self) -> GameState:
+        return GameState.from_dict(self.to_dict())
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 import random
 
 
 DevCard = str  # "knight", "road_building", "year_of_plenty", "monopoly", "victory_point"
 
+# Fixed card order for compact encodings
+DEV_CARD_TYPES: tuple[DevCard, ...] = ("knight", "victory_point", "road_building", "year_of_plenty", "monopoly")
 
-def build_standard_deck() -> List[DevCard]:
+
+def build_standard_deck(rng: Optional[random.Random] = None) -> List[DevCard]:
     deck: List[DevCard] = []
     deck += ["knight"] * 14
     deck += ["victory_point"] * 5
     deck += ["road_building"] * 2
     deck += ["year_of_plenty"] * 2
     deck += ["monopoly"] * 2
-    random.shuffle(deck)
+    (rng or random).shuffle(deck)
     return deck
 
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from term_catan.core.evaluation_python import DICE_OUTCOMES, DICE_WEIGHTS as _DICE_WEIGHTS
+from term_catan.core.models import RESOURCE_INDEX, RESOURCES, Tile
+from term_catan.core.topology import NUM_TILES, NUM_VERTICES, TILE_VERTICES, VERTEX_TILES
+
+if TYPE_CHECKING:
+    from term_catan.core.models import GameState
+
+
+# Expected production per vertex as NumPy matrices.
+#
+# vertex_yield = INCIDENCE (vertex x tile) @ tile_yield (tile x resource),
+# where a tile's row holds the dice weight of its number under its resource,
+# and the robber's tile row is zero. Moving the robber only touches the rows
+# of the six vertices around the two tiles involved. Weights are kept in pips
+# (ways to roll out of 36) so sums stay exact and equal spots compare equal.
+# Without NumPy, Game falls back to the list-based twin in core.evaluation_python.
+
+# Ways to roll each total with two dice, indexed by the total (7 never produces)
+DICE_WEIGHTS = np.array(_DICE_WEIGHTS, dtype=np.float64)
+
+INCIDENCE = np.zeros((NUM_VERTICES, NUM_TILES), dtype=np.float64)
+for _vid, _tiles in enumerate(VERTEX_TILES):
+    INCIDENCE[_vid, list(_tiles)] = 1.0
+INCIDENCE.setflags(write=False)
+
+# tile -> vertex rows it contributes to (the nonzero entries of its INCIDENCE column)
+TILE_ROWS: Tuple[np.ndarray, ...] = tuple(np.array(vids, dtype=np.intp) for vids in TILE_VERTICES)
+
+
+def tile_yield_matrix(tiles: Sequence[Tile]) -> np.ndarray:
+    """Tile x resource matrix of dice weights, ignoring the robber."""
+    out = np.zeros((NUM_TILES, len(RESOURCES)), dtype=np.float64)
+    for tidx, tile in enumerate(tiles):
+        res = RESOURCE_INDEX.get(tile.resource)
+        if res is not None and 0 <= tile.number < len(DICE_WEIGHTS):
+            out[tidx, res] = DICE_WEIGHTS[tile.number]
+    return out
+
+
+class BoardEvaluator:
+    """Per-vertex expected yield for a settlement, with the robber's tile blocked.
+
+    ``vertex_yield[v]`` holds dice weights indexed like ``RESOURCES`` and
+    ``vertex_value[v]`` their sum; divided by ``DICE_OUTCOMES`` they are
+    expected resource cards per roll. A city doubles both.
+    """
+
+    __slots__ = ("tile_yield", "robber_index", "vertex_yield", "vertex_value")
+
+    def __init__(self, tiles: Sequence[Tile], robber_index: int) -> None:
+        self.tile_yield = tile_yield_matrix(tiles)
+        self.tile_yield.setflags(write=False)  # the layout never changes, so clones share it
+        self.robber_index = robber_index
+        active = self.tile_yield.copy()
+        active[robber_index] = 0.0
+        self.vertex_yield = INCIDENCE @ active
+        self.vertex_value = self.vertex_yield.sum(axis=1)
+
+    @staticmethod
+    def build(state: "GameState") -> "BoardEvaluator":
+        return BoardEvaluator(state.board.tiles, state.robber_index)
+
+    def clone(self) -> "BoardEvaluator":
+        other = BoardEvaluator.__new__(BoardEvaluator)
+        other.tile_yield = self.tile_yield
+        other.robber_index = self.robber_index
+        other.vertex_yield = self.vertex_yield.copy()
+        other.vertex_value = self.vertex_value.copy()
+        return other
+
+    def move_robber(self, new_index: int) -> None:
+        """Unblock the old tile and block the new one, updating only their vertices."""
+        old_index = self.robber_index
+        if new_index == old_index:
+            return
+        self.robber_index = new_index
+        for tidx, sign in ((old_index, 1.0), (new_index, -1.0)):
+            rows = TILE_ROWS[tidx]
+            vec = self.tile_yield[tidx]
+            self.vertex_yield[rows] += sign * vec
+            self.vertex_value[rows] += sign * vec.sum()
+
+    # --- queries ---
+
+    def value(self, vertex_id: int) -> float:
+        """Expected resource cards per roll from a settlement on the vertex."""
+        return float(self.vertex_value[vertex_id]) / DICE_OUTCOMES
+
+    def yields(self, vertex_id: int) -> List[float]:
+        """Expected cards per roll at the vertex, per resource in ``RESOURCES`` order."""
+        return (self.vertex_yield[vertex_id] / DICE_OUTCOMES).tolist()
+
+    def best_spots(self, candidates: Iterable[int], count: int = 3) -> List[int]:
+        """The ``count`` highest-value candidate vertices, best first (ties keep candidate order)."""
+        ids = np.fromiter(candidates, dtype=np.intp)
+        if not len(ids) or count <= 0:
+            return []
+        order = np.argsort(-self.vertex_value[ids], kind="stable")[:count]
+        return ids[order].tolist()
@@ -0,0 +1,95 @@
+"""Pure-Python board evaluator, used when NumPy is not installed.
+
+Mirrors ``core.evaluation.BoardEvaluator`` value for value: the same dice
+weights summed per vertex, the same incremental robber update, and the
+same tie order in ``best_spots``.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Tuple
+
+from term_catan.core.models import RESOURCE_INDEX, RESOURCES, Tile
+from term_catan.core.topology import TILE_VERTICES, VERTEX_TILES
+
+if TYPE_CHECKING:
+    from term_catan.core.models import GameState
+
+
+# Ways to roll each total with two dice, indexed by the total (7 never produces)
+DICE_WEIGHTS: Tuple[float, ...] = (0, 0, 1, 2, 3, 4, 5, 0, 5, 4, 3, 2, 1)
+DICE_OUTCOMES = 36
+
+
+def tile_yield_rows(tiles: Sequence[Tile]) -> Tuple[Tuple[float, ...], ...]:
+    """Per tile, its dice weight under its resource (in ``RESOURCES`` order), ignoring the robber."""
+    rows = []
+    for tile in tiles:
+        row = [0.0] * len(RESOURCES)
+        res = RESOURCE_INDEX.get(tile.resource)
+        if res is not None and 0 <= tile.number < len(DICE_WEIGHTS):
+            row[res] = float(DICE_WEIGHTS[tile.number])
+        rows.append(tuple(row))
+    return tuple(rows)
+
+
+class BoardEvaluator:
+    """Per-vertex expected yield for a settlement, with the robber's tile blocked (see core.evaluation)."""
+
+    __slots__ = ("tile_yield", "robber_index", "vertex_yield", "vertex_value")
+
+    def __init__(self, tiles: Sequence[Tile], robber_index: int) -> None:
+        self.tile_yield = tile_yield_rows(tiles)  # never changes, so clones share it
+        self.robber_index = robber_index
+        self.vertex_yield: List[List[float]] = []
+        for vertex_tiles in VERTEX_TILES:
+            row = [0.0] * len(RESOURCES)
+            for tidx in vertex_tiles:
+                if tidx != robber_index:
+                    for i, w in enumerate(self.tile_yield[tidx]):
+                        row[i] += w
+            self.vertex_yield.append(row)
+        self.vertex_value = [sum(row) for row in self.vertex_yield]
+
+    @staticmethod
+    def build(state: "GameState") -> "BoardEvaluator":
+        return BoardEvaluator(state.board.tiles, state.robber_index)
+
+    def clone(self) -> "BoardEvaluator":
+        other = BoardEvaluator.__new__(BoardEvaluator)
+        other.tile_yield = self.tile_yield
+        other.robber_index = self.robber_index
+        other.vertex_yield = [list(row) for row in self.vertex_yield]
+        other.vertex_value = list(self.vertex_value)
+        return other
+
+    def move_robber(self, new_index: int) -> None:
+        """Unblock the old tile and block the new one, updating only their vertices."""
+        old_index = self.robber_index
+        if new_index == old_index:
+            return
+        self.robber_index = new_index
+        for tidx, sign in ((old_index, 1.0), (new_index, -1.0)):
+            vec = self.tile_yield[tidx]
+            total = sign * sum(vec)
+            for vid in TILE_VERTICES[tidx]:
+                row = self.vertex_yield[vid]
+                for i, w in enumerate(vec):
+                    row[i] += sign * w
+                self.vertex_value[vid] += total
+
+    # --- queries ---
+
+    def value(self, vertex_id: int) -> float:
+        """Expected resource cards per roll from a settlement on the vertex."""
+        return self.vertex_value[vertex_id] / DICE_OUTCOMES
+
+    def yields(self, vertex_id: int) -> List[float]:
+        """Expected cards per roll at the vertex, per resource in ``RESOURCES`` order."""
+        return [w / DICE_OUTCOMES for w in self.vertex_yield[vertex_id]]
+
+    def best_spots(self, candidates: Iterable[int], count: int = 3) -> List[int]:
+        """The ``count`` highest-value candidate vertices, best first (ties keep candidate order)."""
+        if count <= 0:
+            return []
+        values = self.vertex_value
+        return sorted(candidates, key=lambda vid: -values[vid])[:count]
@@ -1,22 +1,61 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+import functools
 import random
 
-from term_catan.core.models import GameState, Player, Board
+from term_catan.core.models import BANK_TRADE_RATE, BUILD_COSTS, PIECE_LIMITS, RESOURCES, GameState, Player, Board
 from term_catan.core.dev_cards import build_standard_deck
+try:
+    from term_catan.core.evaluation import BoardEvaluator
+except ImportError:  # NumPy is optional; the pure-Python evaluator is the fallback
+    from term_catan.core.evaluation_python import BoardEvaluator  # type: ignore[assignment]
+from term_catan.core.movegen import NO_OWNER, MoveGen
+from term_catan.core.roads import RoadNetwork, longest_road_holder
+from term_catan.core.topology import VERTEX_TILES
+
+
+VICTORY_POINTS_TO_WIN = 10
+LONGEST_ROAD_POINTS = 2
+
+# Receives (method name, args) after each successful state change; see Game.recorder
+Recorder = Callable[[str, Tuple], None]
+
+_F = TypeVar("_F", bound=Callable)
+
+
+def _recorded(method: _F) -> _F:
+    """Report a successful call of a state-changing method to the game's recorder.
+
+    Calling the method again with the same args on a game in the same state
+    reproduces the change, which is what journal replay relies on.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: "Game", *args):
+        result = method(self, *args)
+        if self.recorder is not None:
+            self.recorder(name, args)
+        return result
+
+    return wrapper  # type: ignore[return-value]
 
 
 class Game:
-    def __init__(self, num_humans: int = 1, num_ai: int = 3) -> None:
+    def __init__(self, num_humans: int = 1, num_ai: int = 3, seed: Optional[int] = None) -> None:
+        # Every random draw of this game (board, deck, dice, AI choices) comes from this stream
+        self.rng = random.Random(seed)
+        # Set by a journal to hear about every state change; never copied to clones
+        self.recorder: Optional[Recorder] = None
         players: List[Player] = []
         for i in range(num_humans):
             players.append(Player(id=i, name=f"Human {i+1}", is_ai=False))
         for j in range(num_ai):
             players.append(Player(id=num_humans + j, name=f"AI {j+1}", is_ai=True))
-        board = Board.standard_board()
+        board = Board.standard_board(self.rng)
         self.state = GameState(players=players, current_player=0, board=board)
-        self.state.dev_deck = build_standard_deck()
+        self.state.dev_deck = build_standard_deck(self.rng)
         # Place robber on desert initially
         for i, t in enumerate(self.state.board.tiles):
             if t.resource == "desert":
@@ -26,6 +65,16 @@ class Game:
     def to_dict(self) -> Dict:
         return self.state.to_dict()
 
+    def clone(self) -> "Game":
+        """Branch the game for lookahead/undo; see GameState.clone."""
+        game = Game.__new__(Game)
+        # Skip Random()'s OS-entropy seeding; the state is overwritten anyway
+        game.rng = random.Random.__new__(random.Random)
+        game.rng.setstate(self.rng.getstate())
+        game.recorder = None
+        game.state = self.state.clone()
+        return game
+
     @staticmethod
     def from_dict(data: Dict) -> "Game":
         game = Game(0, 0)
@@ -45,39 +94,49 @@ class Game:
         return f"{self.state.phase.upper()} | Turn: {p.name} | VP: {p.victory_points} | {res}"
 
     def roll_and_distribute(self) -> tuple[int, Dict[int, Dict[str, int]]]:
+        """Roll two dice and pay out production; returns the roll and each producing player's gains."""
+        assert self.state.phase in ("turn_roll", "turn_actions")
+        roll = self.rng.randint(1, 6) + self.rng.randint(1, 6)
+        return roll, self.apply_roll(roll)
+
+    @_recorded
+    def apply_roll(self, roll: int) -> Dict[int, Dict[str, int]]:
+        """Resolve a given dice total (a 7 starts the robber phase); returns each producing player's gains."""
         assert self.state.phase in ("turn_roll", "turn_actions")
-        roll = random.randint(1, 6) + random.randint(1, 6)
-        gains: Dict[int, Dict[str, int]] = {p.id: {"wood": 0, "brick": 0, "sheep": 0, "wheat": 0, "ore": 0} for p in self.state.players}
+        gains: Dict[int, Dict[str, int]] = {}
         if roll == 7:
             self.state.phase = "robber"
-            return roll, gains
-        for idx, tile in enumerate(self.state.board.tiles):
-            if tile.number == roll and tile.resource != "desert" and idx != self.state.robber_index:
-                for owner_id, building in tile.buildings.items():
-                    amount = 1 if building == "settlement" else 2
-                    gains[owner_id][tile.resource] += amount
-        # Apply gains against bank
-        for pid, resmap in gains.items():
-            player = next(p for p in self.state.players if p.id == pid)
-            for res, amt in resmap.items():
-                if amt <= 0:
+            return gains
+        yields = self.state.production_index().yields(roll)
+        if yields:
+            # Apply gains against bank, in seat order
+            bank = self.state.bank
+            for player in self.state.players:
+                vec = yields.get(player.id)
+                if vec is None:
                     continue
-                take = min(amt, self.state.bank[res])
-                self.state.bank[res] -= take
-                player.resources[res] += take
+                gains[player.id] = dict(zip(RESOURCES, vec))
+                for res, amt in zip(RESOURCES, vec):
+                    if amt <= 0:
+                        continue
+                    take = min(amt, bank[res])
+                    bank[res] -= take
+                    player.resources[res] += take
         self.state.has_rolled = True
         self.state.phase = "turn_actions"
-        return roll, gains
+        return gains
 
+    @_recorded
     def end_turn(self) -> None:
         # Reset turn state
         self.state.current_player = (self.state.current_player + 1) % len(self.state.players)
         self.state.has_rolled = False
         self.state.phase = "turn_roll"
 
+    @_recorded
     def demo_build(self) -> None:
         p = self.state.players[self.state.current_player]
-        cost = {"wood": 1, "brick": 1}
+        cost = BUILD_COSTS["road"]
         if self.state.phase == "setup":
             raise ValueError("Place starting settlements/roads during setup")
         if not self.state.has_rolled:
@@ -90,22 +149,108 @@ class Game:
         else:
             raise ValueError("Not enough resources to build a road")
 
-    def setup_place_settlement(self, tile_index: int) -> None:
+    def vertex_owner(self, vertex_id: int) -> Optional[int]:
+        pid = self.move_generator().vertex_owner[vertex_id]
+        return None if pid == NO_OWNER else pid
+
+    def edge_owner(self, edge_id: int) -> Optional[int]:
+        pid = self.move_generator().edge_owner[edge_id]
+        return None if pid == NO_OWNER else pid
+
+    def move_generator(self) -> MoveGen:
+        """Placement bitmasks for the current state, rebuilt if the lists changed behind its back."""
+        state = self.state
+        gen = state._movegen
+        if gen is None or gen.count != len(state.settlements) + len(state.cities) + len(state.roads):
+            gen = state._movegen = MoveGen.build(state)
+        return gen
+
+    def road_network(self) -> RoadNetwork:
+        state = self.state
+        net = state._road_network
+        if net is None or net.count != len(state.settlements) + len(state.cities) + len(state.roads):
+            net = state._road_network = RoadNetwork.build(state)
+        return net
+
+    def board_evaluator(self) -> BoardEvaluator:
+        """Per-vertex expected yield; a robber move since the last call is applied incrementally."""
+        state = self.state
+        evaluator = state._evaluator
+        if evaluator is None:
+            evaluator = state._evaluator = BoardEvaluator.build(state)
+        elif evaluator.robber_index != state.robber_index:
+            evaluator.move_robber(state.robber_index)
+        return evaluator
+
+    def longest_road(self, player_id: int) -> int:
+        return self.road_network().longest[player_id]
+
+    def _update_longest_road(self) -> None:
+        """Move the Longest Road card (and its points) per ``longest_road_holder``."""
+        state = self.state
+        holder = state.longest_road_owner
+        new_holder = longest_road_holder(self.road_network().longest, holder)
+        if new_holder == holder:
+            return
+        if holder is not None:
+            state.players[holder].victory_points -= LONGEST_ROAD_POINTS
+        if new_holder is not None:
+            state.players[new_holder].victory_points += LONGEST_ROAD_POINTS
+        state.longest_road_owner = new_holder
+
+    def setup_settlement_spots(self) -> List[int]:
+        return self.move_generator().setup_settlement_spots()
+
+    def setup_road_spots(self) -> List[int]:
+        """Free edges next to the current player's most recent settlement."""
+        pid = self.state.players[self.state.current_player].id
+        own = [vid for owner, vid in self.state.settlements if owner == pid]
+        if not own:
+            return []
+        return self.move_generator().setup_road_spots(own[-1])
+
+    @_recorded
+    def setup_place_settlement(self, vertex_id: int) -> None:
+        """Place a starting settlement on a canonical vertex id (see core.topology)."""
         assert self.state.phase == "setup"
         p = self.state.players[self.state.current_player]
-        tile = self.state.board.tiles[tile_index]
-        if p.id in tile.buildings:
+        gen = self.move_generator()
+        if gen.vertex_owner[vertex_id] != NO_OWNER:
             raise ValueError("Already built here")
-        tile.buildings[p.id] = "settlement"
+        if not gen.can_settle(vertex_id):
+            raise ValueError("Too close to another settlement")
+        self._add_settlement(p, vertex_id)
+
+    def _add_settlement(self, p: Player, vertex_id: int) -> None:
+        # Update the derived indexes before the placement lists (a lazy build would count it twice)
+        self.state.production_index().add_building(p.id, vertex_id, 1)
+        self.move_generator().place_settlement(p.id, vertex_id)
+        self.road_network().add_building(p.id, vertex_id)
+        self.state.settlements.append((p.id, vertex_id))
+        # Tiles keep a per-player building marker for the tile list view
+        tiles = self.state.board_for_write().tiles
+        for tidx in VERTEX_TILES[vertex_id]:
+            tiles[tidx].buildings.setdefault(p.id, "settlement")
         p.settlements += 1
         p.victory_points += 1
+        self._update_longest_road()
 
-    def setup_place_road(self) -> None:
+    @_recorded
+    def setup_place_road(self, edge_id: int) -> None:
+        """Place a starting road on a canonical edge id (see core.topology)."""
         assert self.state.phase == "setup"
         p = self.state.players[self.state.current_player]
-        # Only track count here; visual canvas enforces non-overlap and exact position
+        if self.edge_owner(edge_id) is not None:
+            raise ValueError("Road already built here")
+        if edge_id not in self.setup_road_spots():
+            raise ValueError("Road must touch your new settlement")
+        self.move_generator().place_road(p.id, edge_id)
+        self.road_network().add_road(p.id, edge_id)
+        self.state.roads.append((p.id, edge_id))
         p.roads += 1
+        self._update_longest_road()
 
+    @_recorded
     def setup_next(self) -> bool:
         assert self.state.phase == "setup"
         n = len(self.state.players)
@@ -125,9 +270,118 @@ class Game:
             self.state.current_player = 0
             return True
 
+    @_recorded
+    def advance_setup_pointer(self, steps: int = 1) -> None:
+        """Step the setup placement cursor (even: settlement next, odd: road next)."""
+        self.state.setup_pointer += steps
+
+    def _require_build_phase(self) -> None:
+        if self.state.phase == "setup":
+            raise ValueError("Place starting settlements/roads during setup")
+        if self.state.phase != "turn_actions" or not self.state.has_rolled:
+            raise ValueError("Roll before building")
+
+    def pieces_left(self, player: Player, piece: str) -> int:
+        built = {"road": player.roads, "settlement": player.settlements, "city": player.cities}[piece]
+        return PIECE_LIMITS[piece] - built
+
+    def can_afford(self, player: Player, piece: str) -> bool:
+        return all(player.resources[r] >= c for r, c in BUILD_COSTS[piece].items())
+
+    def _pay(self, player: Player, piece: str) -> None:
+        for r, c in BUILD_COSTS[piece].items():
+            player.resources[r] -= c
+            self.state.bank[r] += c
+
+    def road_spots(self, player_id: int) -> List[int]:
+        """Free edges connected to the player's network; opponents' buildings cut it."""
+        return self.move_generator().road_spots(player_id)
+
+    def settlement_spots(self, player_id: int) -> List[int]:
+        """Open vertices at the end of one of the player's roads."""
+        return self.move_generator().settlement_spots(player_id)
+
+    def city_spots(self, player_id: int) -> List[int]:
+        return self.move_generator().city_spots(player_id)
+
+    @_recorded
+    def build_road(self, edge_id: int) -> None:
+        self._require_build_phase()
+        p = self.state.players[self.state.current_player]
+        if self.pieces_left(p, "road") <= 0:
+            raise ValueError("No roads left")
+        if edge_id not in self.road_spots(p.id):
+            raise ValueError("Road must connect to your network")
+        if not self.can_afford(p, "road"):
+            raise ValueError("Not enough resources to build a road")
+        self._pay(p, "road")
+        self.move_generator().place_road(p.id, edge_id)
+        self.road_network().add_road(p.id, edge_id)
+        self.state.roads.append((p.id, edge_id))
+        p.roads += 1
+        self._update_longest_road()
+
+    @_recorded
+    def build_settlement(self, vertex_id: int) -> None:
+        self._require_build_phase()
+        p = self.state.players[self.state.current_player]
+        if self.pieces_left(p, "settlement") <= 0:
+            raise ValueError("No settlements left")
+        if vertex_id not in self.settlement_spots(p.id):
+            raise ValueError("Settlement must be on your road and away from other buildings")
+        if not self.can_afford(p, "settlement"):
+            raise ValueError("Not enough resources to build a settlement")
+        self._pay(p, "settlement")
+        self._add_settlement(p, vertex_id)
+
+    @_recorded
+    def build_city(self, vertex_id: int) -> None:
+        self._require_build_phase()
+        p = self.state.players[self.state.current_player]
+        if self.pieces_left(p, "city") <= 0:
+            raise ValueError("No cities left")
+        if (p.id, vertex_id) not in self.state.settlements:
+            raise ValueError("City must replace one of your settlements")
+        if not self.can_afford(p, "city"):
+            raise ValueError("Not enough resources to build a city")
+        self._pay(p, "city")
+        self.state.production_index().add_building(p.id, vertex_id, 1)
+        self.move_generator().upgrade_city(p.id, vertex_id)
+        self.state.settlements.remove((p.id, vertex_id))
+        self.state.cities.append((p.id, vertex_id))
+        tiles = self.state.board_for_write().tiles
+        for tidx in VERTEX_TILES[vertex_id]:
+            tiles[tidx].buildings[p.id] = "city"
+        p.settlements -= 1
+        p.cities += 1
+        p.victory_points += 1
+
+    @_recorded
+    def bank_trade(self, give: str, get: str) -> None:
+        """Trade BANK_TRADE_RATE of one resource for one of another."""
+        self._require_build_phase()
+        p = self.state.players[self.state.current_player]
+        if give == get:
+            raise ValueError("Pick two different resources")
+        if p.resources[give] < BANK_TRADE_RATE:
+            raise ValueError(f"Need {BANK_TRADE_RATE} {give} to trade")
+        if self.state.bank[get] <= 0:
+            raise ValueError(f"Bank has no {get}")
+        p.resources[give] -= BANK_TRADE_RATE
+        self.state.bank[give] += BANK_TRADE_RATE
+        p.resources[get] += 1
+        self.state.bank[get] -= 1
+
+    def winner(self) -> Optional[int]:
+        for p in self.state.players:
+            if p.victory_points >= VICTORY_POINTS_TO_WIN:
+                return p.id
+        return None
+
+    @_recorded
     def buy_dev_card(self) -> str:
         p = self.state.players[self.state.current_player]
-        cost = {"wheat": 1, "sheep": 1, "ore": 1}
+        cost = BUILD_COSTS["dev_card"]
         if not all(p.resources[r] >= c for r, c in cost.items()):
             raise ValueError("Not enough resources for dev card")
         if not self.state.dev_deck:
@@ -141,14 +395,17 @@ class Game:
             p.victory_points += 1
         return card
 
+    @_recorded
     def play_knight(self, move_to_index: int) -> None:
         p = self.state.players[self.state.current_player]
         if "knight" not in p.dev_cards:
             raise ValueError("No knight to play")
         p.dev_cards.remove("knight")
         p.played_knights += 1
+        self.state.production_index().move_robber(move_to_index)
         self.state.robber_index = move_to_index
 
+    @_recorded
     def move_robber(self, move_to_index: int) -> None:
         """Move the robber during robber phase and return to turn_actions.
 
@@ -159,7 +416,9 @@ class Game:
             raise ValueError("Robber can only be moved during robber phase")
         if move_to_index < 0 or move_to_index >= len(self.state.board.tiles):
             raise ValueError("Invalid tile index")
+        self.state.production_index().move_robber(move_to_index)
         self.state.robber_index = move_to_index
-        # Resume normal action phase after robber is placed
+        # Resume normal action phase after robber is placed; the roll is spent
+        self.state.has_rolled = True
         self.state.phase = "turn_actions"
 
@@ -1,21 +1,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import random
 
+from term_catan.core.topology import VERTEX_TILES
+
+if TYPE_CHECKING:
+    from term_catan.core.evaluation import BoardEvaluator
+    from term_catan.core.movegen import MoveGen
+    from term_catan.core.roads import RoadNetwork
+
 
 Resource = str  # "wood", "brick", "sheep", "wheat", "ore", "desert"
 
+# Fixed resource order for yield vectors and compact encodings
+RESOURCES: Tuple[Resource, ...] = ("wood", "brick", "sheep", "wheat", "ore")
+RESOURCE_INDEX: Dict[Resource, int] = {r: i for i, r in enumerate(RESOURCES)}
 
-@dataclass
+
+@dataclass(slots=True)
 class Tile:
     resource: Resource
     number: int  # 2-12, excluding 7 for production
     buildings: Dict[int, str] = field(default_factory=dict)  # player_id -> "settlement"|"city"
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     id: int
     name: str
@@ -28,13 +39,27 @@ class Player:
     dev_cards: List[str] = field(default_factory=list)
     played_knights: int = 0
 
+    def clone(self) -> "Player":
+        return Player(
+            self.id,
+            self.name,
+            self.is_ai,
+            dict(self.resources),
+            self.roads,
+            self.settlements,
+            self.cities,
+            self.victory_points,
+            list(self.dev_cards),
+            self.played_knights,
+        )
+
 
 @dataclass
 class Board:
     tiles: List[Tile]
 
     @staticmethod
-    def standard_board() -> "Board":
+    def standard_board(rng: Optional[random.Random] = None) -> "Board":
         resources: List[Resource] = [
             "wood", "wood", "wood", "wood",
             "brick", "brick", "brick",
@@ -44,7 +69,7 @@ class Board:
             "desert",
         ]
         numbers = [2, 3, 3, 4, 4, 5, 5, 6, 6, 8, 8, 9, 9, 10, 10, 11, 11, 12]
-        random.shuffle(resources)
+        (rng or random).shuffle(resources)
         tiles: List[Tile] = []
         for res in resources:
             if res == "desert":
@@ -54,6 +79,94 @@ class Board:
         return Board(tiles=tiles)
 
 
+class ProductionIndex:
+    """Dice number -> per-player resource yield vector, kept in sync with placements.
+
+    ``tile_units[t][pid]`` counts production units a player has on tile ``t``
+    (settlement 1, city 2). ``by_number[n][pid]`` sums those units into a
+    yield vector (indexed like ``RESOURCES``) over unblocked tiles numbered
+    ``n``, so a roll is a single dict lookup.
+    """
+
+    __slots__ = ("tiles", "robber_index", "tile_units", "by_number")
+
+    def __init__(self, tiles: List[Tile], robber_index: int) -> None:
+        self.tiles = tiles
+        self.robber_index = robber_index
+        self.tile_units: List[Dict[int, int]] = [{} for _ in tiles]
+        self.by_number: Dict[int, Dict[int, List[int]]] = {}
+
+    @staticmethod
+    def build(state: "GameState") -> "ProductionIndex":
+        index = ProductionIndex(state.board.tiles, state.robber_index)
+        if state.settlements or state.cities:
+            for pid, vid in state.settlements:
+                index.add_building(pid, vid, 1)
+            for pid, vid in state.cities:
+                index.add_building(pid, vid, 2)
+        else:
+            # Legacy saves only carry per-tile building markers
+            for tidx, tile in enumerate(state.board.tiles):
+                for pid, kind in tile.buildings.items():
+                    index._add_tile_units(tidx, pid, 1 if kind == "settlement" else 2)
+        return index
+
+    def _add_tile_units(self, tidx: int, pid: int, units: int) -> None:
+        tile_units = self.tile_units[tidx]
+        tile_units[pid] = tile_units.get(pid, 0) + units
+        if tidx != self.robber_index:
+            self._apply_tile(tidx, pid, units)
+
+    def _apply_tile(self, tidx: int, pid: int, units: int) -> None:
+        tile = self.tiles[tidx]
+        if tile.resource not in RESOURCE_INDEX or not units:
+            return
+        per_player = self.by_number.setdefault(tile.number, {})
+        vec = per_player.get(pid)
+        if vec is None:
+            vec = per_player[pid] = [0] * len(RESOURCES)
+        vec[RESOURCE_INDEX[tile.resource]] += units
+
+    def add_building(self, pid: int, vertex_id: int, units: int) -> None:
+        """Add production units at a vertex: 1 for a new settlement, +1 when it becomes a city."""
+        for tidx in VERTEX_TILES[vertex_id]:
+            self._add_tile_units(tidx, pid, units)
+
+    def move_robber(self, new_index: int) -> None:
+        old_index = self.robber_index
+        if new_index == old_index:
+            return
+        self.robber_index = new_index
+        for pid, units in self.tile_units[old_index].items():
+            self._apply_tile(old_index, pid, units)
+        for pid, units in self.tile_units[new_index].items():
+            self._apply_tile(new_index, pid, -units)
+
+    def clone(self) -> "ProductionIndex":
+        other = ProductionIndex.__new__(ProductionIndex)
+        other.tiles = self.tiles
+        other.robber_index = self.robber_index
+        other.tile_units = [dict(units) for units in self.tile_units]
+        other.by_number = {n: {pid: list(vec) for pid, vec in per_player.items()} for n, per_player in self.by_number.items()}
+        return other
+
+    def yields(self, number: int) -> Dict[int, List[int]]:
+        return self.by_number.get(number, {})
+
+
+# Build costs per piece/card
+BUILD_COSTS: Dict[str, Dict[Resource, int]] = {
+    "road": {"wood": 1, "brick": 1},
+    "settlement": {"wood": 1, "brick": 1, "sheep": 1, "wheat": 1},
+    "city": {"wheat": 2, "ore": 3},
+    "dev_card": {"wheat": 1, "sheep": 1, "ore": 1},
+}
+# Pieces each player may have on the board
+PIECE_LIMITS: Dict[str, int] = {"road": 15, "settlement": 5, "city": 4}
+# Resources given to the bank per resource taken
+BANK_TRADE_RATE = 4
+
+
 @dataclass
 class GameState:
     players: List[Player]
@@ -68,6 +181,68 @@ class GameState:
     setup_pointer: int = 0
     settlements: List[Tuple[int, int]] = field(default_factory=list)  # (player_id, vertex_id)
     roads: List[Tuple[int, int]] = field(default_factory=list)  # (player_id, edge_id)
+    cities: List[Tuple[int, int]] = field(default_factory=list)  # (player_id, vertex_id)
+    longest_road_owner: Optional[int] = None  # player holding the Longest Road card
+    # Derived roll lookup; built on first use, never serialized
+    _production: Optional[ProductionIndex] = field(default=None, init=False, repr=False, compare=False)
+    # Derived placement bitmasks, maintained by Game.move_generator(); never serialized
+    _movegen: Optional["MoveGen"] = field(default=None, init=False, repr=False, compare=False)
+    # Derived road components, maintained by Game.road_network(); never serialized
+    _road_network: Optional["RoadNetwork"] = field(default=None, init=False, repr=False, compare=False)
+    # Derived per-vertex expected yield, maintained by Game.board_evaluator(); never serialized
+    _evaluator: Optional["BoardEvaluator"] = field(default=None, init=False, repr=False, compare=False)
+    # Set while the board object is shared with a clone; the first writer copies it
+    _board_shared: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def clone(self) -> "GameState":
+        """Independent snapshot for lookahead and undo.
+
+        Only the mutable per-turn fields are copied. The board is shared
+        copy-on-write: tile layout never changes, and the first side to touch
+        tile buildings afterwards takes its own copy via ``board_for_write``.
+        """
+        other = GameState(
+            players=[p.clone() for p in self.players],
+            current_player=self.current_player,
+            board=self.board,
+            bank=dict(self.bank),
+            robber_index=self.robber_index,
+            dev_deck=list(self.dev_deck),
+            phase=self.phase,
+            has_rolled=self.has_rolled,
+            setup_step=self.setup_step,
+            setup_pointer=self.setup_pointer,
+            settlements=list(self.settlements),
+            roads=list(self.roads),
+            cities=list(self.cities),
+            longest_road_owner=self.longest_road_owner,
+        )
+        if self._production is not None:
+            other._production = self._production.clone()
+        if self._movegen is not None:
+            other._movegen = self._movegen.clone()
+        if self._road_network is not None:
+            other._road_network = self._road_network.clone()
+        if self._evaluator is not None:
+            other._evaluator = self._evaluator.clone()
+        self._board_shared = other._board_shared = True
+        return other
+
+    def board_for_write(self) -> Board:
+        """The board, copied first if it is still shared with a clone."""
+        if self._board_shared:
+            self.board = Board(tiles=[Tile(t.resource, t.number, dict(t.buildings)) for t in self.board.tiles])
+            self._board_shared = False
+            if self._production is not None:
+                # Same layout, so the roll index stays valid for the new tiles
+                self._production.tiles = self.board.tiles
+        return self.board
+
+    def production_index(self) -> ProductionIndex:
+        index = self._production
+        if index is None or index.tiles is not self.board.tiles or index.robber_index != self.robber_index:
+            index = self._production = ProductionIndex.build(self)
+        return index
 
     def to_dict(self) -> Dict:
         return {
@@ -76,13 +251,38 @@ class GameState:
             "board": {
                 "tiles": [asdict(t) for t in self.board.tiles]
             },
-            "bank": self.bank,
+            "bank": dict(self.bank),
+            "robber_index": self.robber_index,
+            "dev_deck": list(self.dev_deck),
+            "phase": self.phase,
+            "has_rolled": self.has_rolled,
+            "setup_step": self.setup_step,
+            "setup_pointer": self.setup_pointer,
+            "settlements": [list(s) for s in self.settlements],
+            "roads": [list(r) for r in self.roads],
+            "cities": [list(c) for c in self.cities],
+            "longest_road_owner": self.longest_road_owner,
         }
 
     @staticmethod
     def from_dict(data: Dict) -> "GameState":
-        players = [Player(**p) for p in data["players"]]
-        tiles = [Tile(**t) for t in data["board"]["tiles"]]
+        # Copy the nested resources/dev_cards so the game never writes back into ``data``
+        players = [Player(**p).clone() for p in data["players"]]
+        # JSON turns the int player-id keys of tile buildings into strings
+        tiles = [
+            Tile(t["resource"], t["number"], {int(pid): kind for pid, kind in t.get("buildings", {}).items()})
+            for t in data["board"]["tiles"]
+        ]
         board = Board(tiles=tiles)
-        return GameState(players=players, current_player=data["current_player"], board=board, bank=data.get("bank", {r: 19 for r in ["wood", "brick", "sheep", "wheat", "ore"]}))
-
+        state = GameState(players=players, current_player=data["current_player"], board=board, bank=dict(data.get("bank", {r: 19 for r in RESOURCES})))
+        state.robber_index = data.get("robber_index", 0)
+        state.dev_deck = list(data.get("dev_deck", []))
+        state.phase = data.get("phase", "setup")
+        state.has_rolled = data.get("has_rolled", False)
+        state.setup_step = data.get("setup_step", 1)
+        state.setup_pointer = data.get("setup_pointer", 0)
+        state.settlements = [(pid, vid) for pid, vid in data.get("settlements", [])]
+        state.roads = [(pid, eid) for pid, eid in data.get("roads", [])]
+        state.cities = [(pid, vid) for pid, vid in data.get("cities", [])]
+        state.longest_road_owner = data.get("longest_road_owner")
+        return state
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Union
+
+from term_catan.core.models import BANK_TRADE_RATE, RESOURCES
+from term_catan.core.topology import EDGE_VERTICES, NUM_EDGES, NUM_TILES, NUM_VERTICES, VERTEX_EDGES, VERTEX_NEIGHBORS
+
+if TYPE_CHECKING:
+    from term_catan.core.game import Game
+    from term_catan.core.models import GameState
+
+
+# Legal-move generation over bitmask occupancy.
+#
+# Vertex sets are ints with bit v set for canonical vertex v, edge sets the
+# same over the 72 edge ids. Placements update the masks incrementally, so
+# every placement query is a couple of bitwise ops plus decoding the result.
+
+ALL_VERTICES = (1 << NUM_VERTICES) - 1
+ALL_EDGES = (1 << NUM_EDGES) - 1
+# vertex -> itself plus its neighbours: the spots a building there rules out
+VERTEX_BLOCK_MASK: Tuple[int, ...] = tuple(
+    (1 << v) | sum(1 << n for n in VERTEX_NEIGHBORS[v]) for v in range(NUM_VERTICES)
+)
+# vertex -> incident edges
+VERTEX_EDGE_MASK: Tuple[int, ...] = tuple(sum(1 << e for e in VERTEX_EDGES[v]) for v in range(NUM_VERTICES))
+
+NO_OWNER = -1
+
+
+def bits(mask: int) -> Iterator[int]:
+    """Set bit positions in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class MoveGen:
+    """Occupancy bitmasks plus per-player placement candidates.
+
+    ``anchors[pid]`` are the vertices a player can extend roads from (own
+    buildings, and own road ends no opponent has built on); ``frontier[pid]``
+    is every edge touching an anchor, so free road spots are one AND away.
+    """
+
+    __slots__ = (
+        "occupied",
+        "blocked",
+        "roads",
+        "vertex_owner",
+        "edge_owner",
+        "settlements",
+        "cities",
+        "road_edges",
+        "road_ends",
+        "anchors",
+        "frontier",
+        "count",
+    )
+
+    def __init__(self, num_players: int) -> None:
+        self.occupied = 0  # vertices with any building
+        self.blocked = 0  # occupied vertices and their neighbours
+        self.roads = 0  # edges with any road
+        self.vertex_owner: List[int] = [NO_OWNER] * NUM_VERTICES
+        self.edge_owner: List[int] = [NO_OWNER] * NUM_EDGES
+        self.settlements = [0] * num_players
+        self.cities = [0] * num_players
+        self.road_edges = [0] * num_players
+        self.road_ends = [0] * num_players
+        self.anchors = [0] * num_players
+        self.frontier = [0] * num_players
+        self.count = 0  # entries in the state's placement lists, to spot a stale index
+
+    @staticmethod
+    def build(state: "GameState") -> "MoveGen":
+        gen = MoveGen(len(state.players))
+        for pid, vid in state.settlements:
+            gen.place_settlement(pid, vid)
+        for pid, vid in state.cities:
+            gen.place_settlement(pid, vid)
+            gen.upgrade_city(pid, vid)
+        for pid, eid in state.roads:
+            gen.place_road(pid, eid)
+        return gen
+
+    def clone(self) -> "MoveGen":
+        other = MoveGen.__new__(MoveGen)
+        other.occupied = self.occupied
+        other.blocked = self.blocked
+        other.roads = self.roads
+        other.vertex_owner = list(self.vertex_owner)
+        other.edge_owner = list(self.edge_owner)
+        other.settlements = list(self.settlements)
+        other.cities = list(self.cities)
+        other.road_edges = list(self.road_edges)
+        other.road_ends = list(self.road_ends)
+        other.anchors = list(self.anchors)
+        other.frontier = list(self.frontier)
+        other.count = self.count
+        return other
+
+    # --- incremental updates ---
+
+    def place_settlement(self, pid: int, vertex_id: int) -> None:
+        bit = 1 << vertex_id
+        self.occupied |= bit
+        self.blocked |= VERTEX_BLOCK_MASK[vertex_id]
+        self.vertex_owner[vertex_id] = pid
+        self.settlements[pid] |= bit
+        self.anchors[pid] |= bit
+        self.frontier[pid] |= VERTEX_EDGE_MASK[vertex_id]
+        # The new building cuts opponents' roads that run through it
+        for other in range(len(self.anchors)):
+            if other != pid and self.anchors[other] & bit:
+                self.anchors[other] &= ~bit
+                self._rebuild_frontier(other)
+        self.count += 1
+
+    def upgrade_city(self, pid: int, vertex_id: int) -> None:
+        bit = 1 << vertex_id
+        self.settlements[pid] &= ~bit
+        self.cities[pid] |= bit
+
+    def place_road(self, pid: int, edge_id: int) -> None:
+        self.roads |= 1 << edge_id
+        self.edge_owner[edge_id] = pid
+        self.road_edges[pid] |= 1 << edge_id
+        for vid in EDGE_VERTICES[edge_id]:
+            bit = 1 << vid
+            self.road_ends[pid] |= bit
+            owner = self.vertex_owner[vid]
+            if owner == NO_OWNER or owner == pid:
+                self.anchors[pid] |= bit
+                self.frontier[pid] |= VERTEX_EDGE_MASK[vid]
+        self.count += 1
+
+    def _rebuild_frontier(self, pid: int) -> None:
+        frontier = 0
+        for vid in bits(self.anchors[pid]):
+            frontier |= VERTEX_EDGE_MASK[vid]
+        self.frontier[pid] = frontier
+
+    # --- placement queries (sorted canonical ids) ---
+
+    def setup_settlement_spots(self) -> List[int]:
+        return list(bits(ALL_VERTICES & ~self.blocked))
+
+    def setup_road_spots(self, vertex_id: int) -> List[int]:
+        return list(bits(VERTEX_EDGE_MASK[vertex_id] & ~self.roads))
+
+    def road_spots(self, pid: int) -> List[int]:
+        return list(bits(self.frontier[pid] & ~self.roads))
+
+    def settlement_spots(self, pid: int) -> List[int]:
+        return list(bits(self.road_ends[pid] & ~self.blocked))
+
+    def city_spots(self, pid: int) -> List[int]:
+        return list(bits(self.settlements[pid]))
+
+    def can_settle(self, vertex_id: int) -> bool:
+        return not self.blocked >> vertex_id & 1
+
+
+# An action is a tuple tagged by its kind, e.g. ("road", edge_id) or ("end",)
+Action = Tuple[Union[str, int], ...]
+
+
+def legal_actions(game: "Game") -> List[Action]:
+    """Every move the current seat may make in the current phase."""
+    state = game.state
+    player = state.players[state.current_player]
+    gen = game.move_generator()
+    if state.phase == "setup":
+        free = ~gen.roads
+        return [
+            ("setup", v, e)
+            for v in gen.setup_settlement_spots()
+            for e in bits(VERTEX_EDGE_MASK[v] & free)
+        ]
+    if state.phase == "turn_roll":
+        return [("roll",)]
+    if state.phase == "robber":
+        return [("robber", t) for t in range(NUM_TILES) if t != state.robber_index]
+    actions: List[Action] = [("end",)]
+    if game.pieces_left(player, "city") > 0 and game.can_afford(player, "city"):
+        actions += [("city", v) for v in gen.city_spots(player.id)]
+    if game.pieces_left(player, "settlement") > 0 and game.can_afford(player, "settlement"):
+        actions += [("settlement", v) for v in gen.settlement_spots(player.id)]
+    if game.pieces_left(player, "road") > 0 and game.can_afford(player, "road"):
+        actions += [("road", e) for e in gen.road_spots(player.id)]
+    if state.dev_deck and game.can_afford(player, "dev_card"):
+        actions.append(("dev_card",))
+    if "knight" in player.dev_cards:
+        actions += [("knight", t) for t in range(NUM_TILES) if t != state.robber_index]
+    for give in RESOURCES:
+        if player.resources[give] >= BANK_TRADE_RATE:
+            actions += [("trade", give, get) for get in RESOURCES if get != give and state.bank[get] > 0]
+    return actions
+
+
+def apply_action(game: "Game", action: Action) -> None:
+    kind = action[0]
+    if kind == "setup":
+        game.setup_place_settlement(action[1])
+        game.setup_place_road(action[2])
+        game.advance_setup_pointer(2)
+        game.setup_next()
+    elif kind == "roll":
+        game.roll_and_distribute()
+    elif kind == "robber":
+        game.move_robber(action[1])
+    elif kind == "end":
+        game.end_turn()
+    elif kind == "city":
+        game.build_city(action[1])
+    elif kind == "settlement":
+        game.build_settlement(action[1])
+    elif kind == "road":
+        game.build_road(action[1])
+    elif kind == "dev_card":
+        game.buy_dev_card()
+    elif kind == "knight":
+        game.play_knight(action[1])
+    elif kind == "trade":
+        game.bank_trade(action[1], action[2])
+    else:
+        raise ValueError(f"Unknown action: {action!r}")
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import bisect
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from term_catan.core.game import Game
+
+
+# Replaying recorded games turn by turn.
+#
+# A record is a starting state plus the (method name, args) calls the game's
+# recorder saw after it; calling them again on the starting state rebuilds
+# every later state. Turn n starts after the n-th end_turn (turn 0 covers
+# setup). Seeking clones the nearest snapshot at or before the target and
+# replays from there; snapshots are kept every ``snapshot_every`` turns as
+# seeks pass them, so a timeline is only paid for where it is looked at.
+
+Event = Tuple[str, Tuple]
+
+# Turns between kept snapshots
+REPLAY_SNAPSHOT_EVERY = 16
+
+
+class GameRecord:
+    """A game's starting state and every recorded change made after it."""
+
+    __slots__ = ("initial", "events")
+
+    def __init__(self, initial: Dict, events: Optional[List[Event]] = None) -> None:
+        self.initial = initial
+        self.events: List[Event] = events if events is not None else []
+
+    @staticmethod
+    def capture(game: Game) -> "GameRecord":
+        """Start recording ``game`` from its current state; takes over its recorder."""
+        record = GameRecord(game.to_dict())
+        game.recorder = record.append
+        return record
+
+    def append(self, name: str, args: Tuple) -> None:
+        self.events.append((name, args))
+
+
+class Replay:
+    """Seekable timeline over a GameRecord.
+
+    ``state_at(n)`` returns the game as it stood at the start of turn n;
+    ``frames`` streams turns in order on a single game for headless analysis.
+    """
+
+    def __init__(self, record: GameRecord, snapshot_every: int = REPLAY_SNAPSHOT_EVERY) -> None:
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be at least 1")
+        self.record = record
+        self.snapshot_every = snapshot_every
+        # Event index each turn starts at
+        self.turn_starts: List[int] = [0]
+        for index, (name, _args) in enumerate(record.events):
+            if name == "end_turn":
+                self.turn_starts.append(index + 1)
+        self._snapshots: Dict[int, Game] = {0: Game.from_dict(record.initial)}
+        self._snapshot_turns: List[int] = [0]
+
+    @property
+    def num_turns(self) -> int:
+        return len(self.turn_starts)
+
+    def _check_turn(self, turn: int) -> None:
+        if not 0 <= turn < self.num_turns:
+            raise ValueError(f"Turn {turn} is outside the replay (0-{self.num_turns - 1})")
+
+    def _apply(self, game: Game, start: int, stop: int) -> None:
+        events = self.record.events
+        for index in range(start, stop):
+            name, args = events[index]
+            try:
+                getattr(game, name)(*args)
+            except (AssertionError, ValueError, IndexError) as exc:
+                raise ValueError(f"Event {index} ({name}) does not replay: {exc}") from exc
+
+    def advance(self, game: Game, turn: int, target: int, *, keep_snapshots: bool = False) -> None:
+        """Replay ``game`` in place from the start of ``turn`` to the start of ``target``."""
+        self._check_turn(target)
+        if target < turn:
+            raise ValueError("Replays only run forward")
+        for current in range(turn, target):
+            self._apply(game, self.turn_starts[current], self.turn_starts[current + 1])
+            reached = current + 1
+            if keep_snapshots and reached % self.snapshot_every == 0 and reached not in self._snapshots:
+                self._snapshots[reached] = game.clone()
+                bisect.insort(self._snapshot_turns, reached)
+
+    def state_at(self, turn: int) -> Game:
+        """A fresh game at the start of ``turn``, replayed from the nearest snapshot."""
+        self._check_turn(turn)
+        base = self._snapshot_turns[bisect.bisect_right(self._snapshot_turns, turn) - 1]
+        game = self._snapshots[base].clone()
+        self.advance(game, base, turn, keep_snapshots=True)
+        return game
+
+    def final_state(self) -> Game:
+        """The game after the last recorded event, mid-turn if the record ends there."""
+        game = self.state_at(self.num_turns - 1)
+        self._apply(game, self.turn_starts[-1], len(self.record.events))
+        return game
+
+    def frames(self, start: int = 0, stop: Optional[int] = None, step: int = 1) -> Iterator[Tuple[int, Game]]:
+        """Yield ``(turn, game)`` for turns start, start+step, ... below ``stop``.
+
+        The same game is stepped forward between yields, so no state is
+        copied; clone a frame to keep it past the next iteration.
+        """
+        if step < 1:
+            raise ValueError("step must be at least 1")
+        stop = self.num_turns if stop is None else min(stop, self.num_turns)
+        if start >= stop:
+            return
+        game = self.state_at(start)
+        turn = start
+        while True:
+            yield turn, game
+            if turn + step >= stop:
+                return
+            self.advance(game, turn, turn + step)
+            turn += step
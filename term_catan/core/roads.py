@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from term_catan.core.movegen import bits
+from term_catan.core.topology import EDGE_VERTICES, VERTEX_EDGES
+
+if TYPE_CHECKING:
+    from term_catan.core.models import GameState
+
+
+# Longest-road tracking over the canonical edge ids.
+#
+# Each player's roads are kept as connected components (edge bitmask, vertex
+# bitmask, longest trail). A new road only recomputes the components it
+# joins; a new building only re-splits the opponents' components running
+# through its vertex. Opponent buildings cut a road: a trail may end at
+# such a vertex but not pass through it.
+
+# Shortest road that can hold the Longest Road card
+LONGEST_ROAD_MIN = 5
+
+EDGE_VERTEX_MASK: Tuple[int, ...] = tuple((1 << a) | (1 << b) for a, b in EDGE_VERTICES)
+
+Component = Tuple[int, int, int]  # (edge mask, vertex mask, longest trail)
+
+
+def longest_trail(edge_mask: int, blocked: int) -> int:
+    """Longest path over distinct edges of ``edge_mask`` that does not pass through ``blocked`` vertices."""
+    best = 0
+    seen = 0
+
+    def walk(vertex: int, used: int, length: int) -> None:
+        nonlocal best, seen
+        if length > best:
+            best = length
+        seen |= used
+        if length and blocked >> vertex & 1:
+            return
+        for eid in VERTEX_EDGES[vertex]:
+            bit = 1 << eid
+            if edge_mask & bit and not used & bit:
+                a, b = EDGE_VERTICES[eid]
+                walk(b if a == vertex else a, used | bit, length + 1)
+
+    # A longest trail can always be started at a dead end, a junction or a
+    # blocked vertex; only a bare cycle has none of those
+    vertices = 0
+    for eid in bits(edge_mask):
+        vertices |= EDGE_VERTEX_MASK[eid]
+    for vertex in bits(vertices):
+        if blocked >> vertex & 1 or sum(1 for e in VERTEX_EDGES[vertex] if edge_mask >> e & 1) != 2:
+            walk(vertex, 0, 0)
+    while edge_mask & ~seen:
+        # Bare cycles are left over; any of their vertices will do
+        eid = (edge_mask & ~seen & -(edge_mask & ~seen)).bit_length() - 1
+        walk(EDGE_VERTICES[eid][0], 0, 0)
+    return best
+
+
+def longest_road_holder(lengths: Sequence[int], holder: Optional[int]) -> Optional[int]:
+    """Who holds the Longest Road card given each player's longest road.
+
+    The sole longest road of LONGEST_ROAD_MIN or more takes it; the holder
+    keeps it on a tie, and if the holder's road is cut while others tie for
+    longest the card is set aside.
+    """
+    top = max(lengths)
+    if holder is not None and lengths[holder] == top and top >= LONGEST_ROAD_MIN:
+        return holder
+    leaders = [pid for pid, length in enumerate(lengths) if length == top]
+    return leaders[0] if top >= LONGEST_ROAD_MIN and len(leaders) == 1 else None
+
+
+def _components(edge_mask: int, blocked: int) -> List[Component]:
+    """Split edges into pieces joined at vertices that are not blocked."""
+    out: List[Component] = []
+    remaining = edge_mask
+    while remaining:
+        start = remaining & -remaining
+        comp = start
+        frontier = start
+        while frontier:
+            eid = (frontier & -frontier).bit_length() - 1
+            frontier &= frontier - 1
+            for vid in EDGE_VERTICES[eid]:
+                if blocked >> vid & 1:
+                    continue
+                for other in VERTEX_EDGES[vid]:
+                    bit = 1 << other
+                    if remaining & bit and not comp & bit:
+                        comp |= bit
+                        frontier |= bit
+        remaining &= ~comp
+        vertices = 0
+        for eid in bits(comp):
+            vertices |= EDGE_VERTEX_MASK[eid]
+        out.append((comp, vertices, longest_trail(comp, blocked)))
+    return out
+
+
+class RoadNetwork:
+    """Per-player road components and their longest trails, kept up to date on placements."""
+
+    __slots__ = ("buildings", "occupied", "components", "longest", "count")
+
+    def __init__(self, num_players: int) -> None:
+        self.buildings = [0] * num_players  # vertex mask per player
+        self.occupied = 0
+        self.components: List[List[Component]] = [[] for _ in range(num_players)]
+        self.longest = [0] * num_players
+        self.count = 0  # entries in the state's placement lists, to spot a stale index
+
+    @staticmethod
+    def build(state: "GameState") -> "RoadNetwork":
+        net = RoadNetwork(len(state.players))
+        for pid, vid in state.settlements + state.cities:
+            net.buildings[pid] |= 1 << vid
+            net.occupied |= 1 << vid
+            net.count += 1
+        edges = [0] * len(state.players)
+        for pid, eid in state.roads:
+            edges[pid] |= 1 << eid
+            net.count += 1
+        for pid, mask in enumerate(edges):
+            net.components[pid] = _components(mask, net._blocked(pid))
+            net._refresh(pid)
+        return net
+
+    def clone(self) -> "RoadNetwork":
+        other = RoadNetwork.__new__(RoadNetwork)
+        other.buildings = list(self.buildings)
+        other.occupied = self.occupied
+        other.components = [list(comps) for comps in self.components]
+        other.longest = list(self.longest)
+        other.count = self.count
+        return other
+
+    def _blocked(self, pid: int) -> int:
+        return self.occupied & ~self.buildings[pid]
+
+    def _refresh(self, pid: int) -> None:
+        self.longest[pid] = max((length for _, _, length in self.components[pid]), default=0)
+
+    def add_road(self, pid: int, edge_id: int) -> None:
+        """Join the new road with the components it touches and re-measure only those."""
+        blocked = self._blocked(pid)
+        joints = EDGE_VERTEX_MASK[edge_id] & ~blocked
+        edges = 1 << edge_id
+        vertices = EDGE_VERTEX_MASK[edge_id]
+        kept: List[Component] = []
+        for comp in self.components[pid]:
+            if comp[1] & joints:
+                edges |= comp[0]
+                vertices |= comp[1]
+            else:
+                kept.append(comp)
+        kept.append((edges, vertices, longest_trail(edges, blocked)))
+        self.components[pid] = kept
+        self._refresh(pid)
+        self.count += 1
+
+    def add_building(self, pid: int, vertex_id: int) -> None:
+        """Record a settlement; it splits opponents' components that run through the vertex."""
+        bit = 1 << vertex_id
+        self.buildings[pid] |= bit
+        self.occupied |= bit
+        for other, comps in enumerate(self.components):
+            if other == pid or not any(comp[1] & bit for comp in comps):
+                continue
+            blocked = self._blocked(other)
+            split: List[Component] = []
+            for comp in comps:
+                if comp[1] & bit:
+                    split.extend(_components(comp[0], blocked))
+                else:
+                    split.append(comp)
+            self.components[other] = split
+            self._refresh(other)
+        self.count += 1
+
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+
+# Canonical, resolution-independent topology of the 3-4-5-4-3 board.
+#
+# Tiles are indexed in reading order (row by row, left to right), the same
+# order Board.standard_board() produces. Each tile has 6 corners and 6 sides
+# numbered like the canvas: corner k sits at angle 60*k - 30 degrees (y down),
+# side k runs from corner k to corner k+1. Shared corners/sides collapse to
+# one of 54 vertex ids / 72 edge ids, numbered top-to-bottom, left-to-right.
+
+ROWS_LAYOUT: Tuple[int, ...] = (3, 4, 5, 4, 3)
+
+NUM_TILES = sum(ROWS_LAYOUT)
+NUM_VERTICES = 54
+NUM_EDGES = 72
+
+# Corner offsets from a tile center on an integer lattice: x in units of
+# half the horizontal tile spacing, y in units of half the hex radius.
+_CORNER_OFFSETS: Tuple[Tuple[int, int], ...] = ((1, -1), (1, 1), (0, 2), (-1, 1), (-1, -1), (0, -2))
+
+TileCorner = Tuple[int, int, int]  # (row, col, corner 0..5) as used by the canvas
+TileSide = Tuple[int, int, int]  # (row, col, side 0..5)
+
+
+def _build() -> Tuple:
+    tile_positions: List[Tuple[int, int]] = []
+    for row, count in enumerate(ROWS_LAYOUT):
+        for col in range(count):
+            tile_positions.append((row, col))
+
+    mid = len(ROWS_LAYOUT) // 2
+    corner_points: Dict[TileCorner, Tuple[int, int]] = {}
+    for row, col in tile_positions:
+        cx = 2 * col + abs(mid - row)
+        cy = 3 * row
+        for k, (dx, dy) in enumerate(_CORNER_OFFSETS):
+            corner_points[(row, col, k)] = (cx + dx, cy + dy)
+
+    points = sorted(set(corner_points.values()), key=lambda p: (p[1], p[0]))
+    point_ids = {p: i for i, p in enumerate(points)}
+    corner_vertex = {corner: point_ids[p] for corner, p in corner_points.items()}
+
+    side_pairs: Dict[TileSide, Tuple[int, int]] = {}
+    for row, col in tile_positions:
+        for k in range(6):
+            a = corner_vertex[(row, col, k)]
+            b = corner_vertex[(row, col, (k + 1) % 6)]
+            side_pairs[(row, col, k)] = (min(a, b), max(a, b))
+    pairs = sorted(set(side_pairs.values()))
+    pair_ids = {p: i for i, p in enumerate(pairs)}
+    side_edge = {side: pair_ids[p] for side, p in side_pairs.items()}
+    return tile_positions, corner_vertex, side_edge, pairs
+
+
+_TILE_POSITIONS, _CORNER_VERTEX, _SIDE_EDGE, _EDGE_PAIRS = _build()
+assert len(_EDGE_PAIRS) == NUM_EDGES and len(set(_CORNER_VERTEX.values())) == NUM_VERTICES
+
+# tile index -> (row, col)
+TILE_POSITIONS: Tuple[Tuple[int, int], ...] = tuple(_TILE_POSITIONS)
+TILE_INDEX: Dict[Tuple[int, int], int] = {pos: i for i, pos in enumerate(TILE_POSITIONS)}
+
+# tile index -> 6 vertex ids / 6 edge ids in corner/side order
+TILE_VERTICES: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_CORNER_VERTEX[(row, col, k)] for k in range(6)) for row, col in TILE_POSITIONS
+)
+TILE_EDGES: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_SIDE_EDGE[(row, col, k)] for k in range(6)) for row, col in TILE_POSITIONS
+)
+
+# edge id -> (vertex a, vertex b) with a < b
+EDGE_VERTICES: Tuple[Tuple[int, int], ...] = tuple(_EDGE_PAIRS)
+
+
+def _invert(table: Tuple[Tuple[int, ...], ...], size: int) -> Tuple[Tuple[int, ...], ...]:
+    out: List[List[int]] = [[] for _ in range(size)]
+    for owner, members in enumerate(table):
+        for m in members:
+            out[m].append(owner)
+    return tuple(tuple(sorted(set(x))) for x in out)
+
+
+# vertex id -> adjacent tile indices (1..3), incident edges (2..3), neighbouring vertices (2..3)
+VERTEX_TILES: Tuple[Tuple[int, ...], ...] = _invert(TILE_VERTICES, NUM_VERTICES)
+VERTEX_EDGES: Tuple[Tuple[int, ...], ...] = _invert(EDGE_VERTICES, NUM_VERTICES)
+VERTEX_NEIGHBORS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(sorted(b if a == v else a for a, b in (EDGE_VERTICES[e] for e in VERTEX_EDGES[v])))
+    for v in range(NUM_VERTICES)
+)
+# edge id -> edges sharing a vertex with it
+EDGE_NEIGHBORS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(sorted({n for v in EDGE_VERTICES[e] for n in VERTEX_EDGES[v]} - {e}))
+    for e in range(NUM_EDGES)
+)
+
+# Canonical tile corner/side for drawing a vertex/edge (first tile that has it)
+VERTEX_CORNER: Tuple[TileCorner, ...] = tuple(
+    next(c for c, v in _CORNER_VERTEX.items() if v == vid) for vid in range(NUM_VERTICES)
+)
+EDGE_SIDE: Tuple[TileSide, ...] = tuple(
+    next(s for s, e in _SIDE_EDGE.items() if e == eid) for eid in range(NUM_EDGES)
+)
+
+
+def vertex_id(row: int, col: int, corner: int) -> int:
+    """Canonical vertex id for a tile corner; shared corners give the same id."""
+    return _CORNER_VERTEX[(row, col, corner % 6)]
+
+
+def edge_id(row: int, col: int, side: int) -> int:
+    """Canonical edge id for a tile side; shared sides give the same id."""
+    return _SIDE_EDGE[(row, col, side % 6)]
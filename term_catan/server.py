@@ -0,0 +1,261 @@
+"""Authoritative multiplayer host: ``python -m term_catan.server --port 8765``.
+
+Serves any number of independent game rooms from one asyncio process with
+no UI imports. Clients join a room (and optionally a seat) and send actions;
+the server checks each one against the room's ``Game`` and, once applied,
+sends every subscriber the resulting state delta (services/sync.py). A
+delta is encoded once and the same text goes to the whole room.
+
+Messages are JSON objects:
+  {"type": "hello", "protocol": 1, "version": v, "room": "name", "seat": n}
+      join (creating the room if needed); seat omitted or null to watch.
+      Answered with the deltas (or full state) past version v.
+  {"type": "resync", "version": v}          ask for the state past version v
+  {"type": "action", "name": "build_road", "args": [12]}
+      names and arguments as in ACTIONS; "roll" rolls on the server.
+  {"type": "error", "message": "..."}       sent back for a refused message
+
+Slow consumers: a connection whose unsent output passes
+SEND_BUFFER_LIMIT stops getting deltas and is marked stale; as soon as its
+buffer drains it is sent the room's full state, without waiting for the
+next action, so a stalled client costs a bounded buffer rather than a
+growing backlog.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
+
+import websockets
+
+from term_catan.core.game import Game
+from term_catan.core.models import RESOURCES
+from term_catan.core.topology import NUM_EDGES, NUM_TILES, NUM_VERTICES
+from term_catan.services.sync import SYNC_PROTOCOL, SyncState, decode_message, encode_message
+
+
+DEFAULT_HOST = "localhost"
+DEFAULT_PORT = 8765
+DEFAULT_SEATS = 4
+# Unsent bytes after which a connection is skipped until it catches up
+SEND_BUFFER_LIMIT = 64 * 1024
+# Largest message accepted from a client
+MAX_MESSAGE_SIZE = 4096
+# Seconds between buffer checks on a stale connection
+STALE_POLL_INTERVAL = 0.05
+
+# Action -> (phases it is allowed in, argument kinds: v vertex, e edge, t tile, r resource)
+ACTIONS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    "setup_place_settlement": (("setup",), "v"),
+    "setup_place_road": (("setup",), "e"),
+    "roll": (("turn_roll",), ""),
+    "move_robber": (("robber",), "t"),
+    "play_knight": (("turn_roll", "turn_actions"), "t"),
+    "build_road": (("turn_actions",), "e"),
+    "build_settlement": (("turn_actions",), "v"),
+    "build_city": (("turn_actions",), "v"),
+    "bank_trade": (("turn_actions",), "rr"),
+    "buy_dev_card": (("turn_actions",), ""),
+    "end_turn": (("turn_actions",), ""),
+}
+_ID_LIMITS = {"v": NUM_VERTICES, "e": NUM_EDGES, "t": NUM_TILES}
+
+
+def _error(message: str) -> str:
+    return encode_message({"type": "error", "message": message})
+
+
+def check_args(kinds: str, args: object) -> List:
+    """The action's arguments if they are the right count and kinds, else ValueError."""
+    if not isinstance(args, list) or len(args) != len(kinds):
+        raise ValueError(f"Expected {len(kinds)} argument(s)")
+    for kind, arg in zip(kinds, args):
+        if kind == "r":
+            if arg not in RESOURCES:
+                raise ValueError(f"Unknown resource {arg!r}")
+        elif not isinstance(arg, int) or isinstance(arg, bool) or not 0 <= arg < _ID_LIMITS[kind]:
+            raise ValueError(f"Bad id {arg!r}")
+    return args
+
+
+class Room:
+    """One table: the authoritative game, its versioned state and its subscribers."""
+
+    def __init__(self, name: str, seats: int = DEFAULT_SEATS, seed: Optional[int] = None) -> None:
+        self.name = name
+        self.game = Game(num_humans=seats, num_ai=0, seed=seed)
+        self.sync = SyncState()
+        self.sync.commit(self.game.to_dict())
+        self.subscribers: Set[websockets.WebSocketServerProtocol] = set()
+        self.seats: Dict[int, websockets.WebSocketServerProtocol] = {}
+        self.stale: Set[websockets.WebSocketServerProtocol] = set()
+        # Stale subscriber -> task that sends it the full state once it drains
+        self._recovering: Dict[websockets.WebSocketServerProtocol, asyncio.Task] = {}
+        self._full: Tuple[int, str] = (-1, "")
+
+    def full_data(self) -> str:
+        """The full state message, encoded once per version."""
+        if self._full[0] != self.sync.version:
+            self._full = (self.sync.version, self.sync.full_data())
+        return self._full[1]
+
+    def apply(self, seat: Optional[int], name: str, args: object) -> None:
+        """Check and run an action for ``seat``, then broadcast the change; ValueError if refused."""
+        spec = ACTIONS.get(name)
+        if spec is None:
+            raise ValueError(f"Unknown action {name!r}")
+        phases, kinds = spec
+        args = check_args(kinds, args)
+        game = self.game
+        state = game.state
+        if seat is None:
+            raise ValueError("Spectators cannot act")
+        if game.winner() is not None:
+            raise ValueError("The game is over")
+        if seat != state.current_player:
+            raise ValueError("Not your turn")
+        if state.phase not in phases:
+            raise ValueError(f"Cannot {name.replace('_', ' ')} during {state.phase}")
+        if name == "roll":
+            game.roll_and_distribute()
+        elif name == "setup_place_settlement":
+            if state.setup_pointer % 2:
+                raise ValueError("Place your road first")
+            game.setup_place_settlement(*args)
+            game.advance_setup_pointer()
+        elif name == "setup_place_road":
+            if not state.setup_pointer % 2:
+                raise ValueError("Place your settlement first")
+            game.setup_place_road(*args)
+            game.advance_setup_pointer()
+            game.setup_next()
+        else:
+            getattr(game, name)(*args)
+        data = self.sync.commit(game.to_dict())
+        if data is not None:
+            self.broadcast(data)
+
+    def broadcast(self, data: str) -> None:
+        """Send ``data`` to every subscriber keeping up; the rest are marked stale."""
+        current: List[websockets.WebSocketServerProtocol] = []
+        for ws in self.subscribers:
+            if ws in self.stale:
+                continue
+            if ws.transport is None or ws.transport.get_write_buffer_size() > SEND_BUFFER_LIMIT:
+                self.stale.add(ws)
+                self._recovering[ws] = asyncio.ensure_future(self._recover(ws))
+            else:
+                current.append(ws)
+        websockets.broadcast(current, data)
+
+    async def _recover(self, ws: websockets.WebSocketServerProtocol) -> None:
+        """Wait for a stale subscriber's buffer to drain, then send it the full state."""
+        try:
+            while ws.transport is not None and ws.transport.get_write_buffer_size() > SEND_BUFFER_LIMIT:
+                await ws.drain()  # returns at once unless the transport paused writing
+                await asyncio.sleep(STALE_POLL_INTERVAL)
+        except websockets.ConnectionClosed:
+            return
+        finally:
+            if self._recovering.get(ws) is asyncio.current_task():
+                del self._recovering[ws]
+        if ws in self.stale and ws.transport is not None:
+            # No await from here on, so the next broadcast's delta follows this state
+            self.stale.discard(ws)
+            websockets.broadcast([ws], self.full_data())
+
+    def leave(self, ws: websockets.WebSocketServerProtocol) -> None:
+        self.subscribers.discard(ws)
+        self.stale.discard(ws)
+        task = self._recovering.pop(ws, None)
+        if task is not None:
+            task.cancel()
+        for seat, holder in list(self.seats.items()):
+            if holder is ws:
+                del self.seats[seat]
+
+
+class GameServer:
+    """Rooms by name, created on first join and dropped when the last subscriber leaves."""
+
+    def __init__(self, seats: int = DEFAULT_SEATS) -> None:
+        self.seats = seats
+        self.rooms: Dict[str, Room] = {}
+
+    def join(self, ws: websockets.WebSocketServerProtocol, name: str, seat: Optional[int]) -> Room:
+        """Subscribe ``ws`` to room ``name`` in ``seat`` (None to watch); ValueError if the seat is not free."""
+        if seat is not None and (not isinstance(seat, int) or isinstance(seat, bool) or not 0 <= seat < self.seats):
+            raise ValueError(f"No seat {seat!r}")
+        room = self.rooms.get(name)
+        if room is not None and seat is not None and room.seats.get(seat, ws) is not ws:
+            raise ValueError(f"Seat {seat} is taken")
+        if room is None:
+            room = self.rooms[name] = Room(name, self.seats)
+        room.leave(ws)  # a rejoin may change seats
+        if seat is not None:
+            room.seats[seat] = ws
+        room.subscribers.add(ws)
+        return room
+
+    def leave(self, ws: websockets.WebSocketServerProtocol, room: Room) -> None:
+        room.leave(ws)
+        if not room.subscribers and self.rooms.get(room.name) is room:
+            del self.rooms[room.name]
+
+    async def handler(self, ws: websockets.WebSocketServerProtocol) -> None:
+        room: Optional[Room] = None
+        seat: Optional[int] = None
+        try:
+            async for data in ws:
+                try:
+                    message = decode_message(data)
+                    kind = message["type"]
+                    if kind == "hello":
+                        if message.get("protocol") != SYNC_PROTOCOL:
+                            raise ValueError(f"Sync protocol {SYNC_PROTOCOL} required")
+                        joined = self.join(ws, str(message.get("room", "")), message.get("seat"))
+                        if room is not None and room is not joined:
+                            self.leave(ws, room)
+                        room, seat = joined, message.get("seat")
+                        for out in room.sync.catch_up(message.get("version", -1)):
+                            await ws.send(out)
+                    elif room is None:
+                        raise ValueError("Say hello first")
+                    elif kind == "resync":
+                        for out in room.sync.catch_up(message.get("version", -1)):
+                            await ws.send(out)
+                    elif kind == "action":
+                        room.apply(seat, message.get("name"), message.get("args", []))
+                    else:
+                        raise ValueError(f"Unknown message {kind!r}")
+                except (ValueError, TypeError, KeyError) as exc:
+                    await ws.send(_error(str(exc)))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            if room is not None:
+                self.leave(ws, room)
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        async with websockets.serve(self.handler, host, port, max_size=MAX_MESSAGE_SIZE):
+            await asyncio.Future()  # run forever
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m term_catan.server", description="Host game rooms over websockets.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--seats", type=int, default=DEFAULT_SEATS, help="players per room")
+    args = parser.parse_args(argv)
+    if args.seats < 2:
+        parser.error("need at least 2 seats")
+    print(f"serving rooms on ws://{args.host}:{args.port}")
+    try:
+        asyncio.run(GameServer(args.seats).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
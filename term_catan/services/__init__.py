@@ -1,6 +1,8 @@
 __all__ = [
     "persistence",
     "network",
+    "sync",
     "assets",
+    "archive",
 ]
 
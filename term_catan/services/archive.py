@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from term_catan.core.game import Game
+from term_catan.core.models import RESOURCES
+
+
+# Bulk archive of simulated games for analytics.
+#
+# Layout: a fixed header, then one fixed-width record per played turn (games
+# back to back, in order), then the game index with one record per game
+# pointing at its first turn. The writer streams turn records as games come
+# in and writes the index and the final header on close, so an archive that
+# was never closed reads as unfinished. Readers mmap the file and get NumPy
+# views straight onto it; aggregates walk the turn records in chunks, so
+# memory stays bounded however many games are archived.
+
+ARCHIVE_MAGIC = b"TCARCH"
+ARCHIVE_VERSION = 1
+ARCHIVE_SUFFIX = ".tcarchive"
+# magic, version, players, games, turns, byte offset of the game index
+_HEADER = struct.Struct("<6sBBQQQ")
+HEADER_SIZE = 64
+# Turn records scanned per step by the aggregates
+CHUNK_ROWS = 1 << 18
+# Turns without roll income that count as starved
+STARVATION_WINDOW = 4
+
+
+def turn_dtype(num_players: int) -> np.dtype:
+    """One played turn: whose it was, the roll, and every seat's position after it."""
+    return np.dtype([
+        ("game", "<u4"),
+        ("turn", "<u2"),
+        ("player", "u1"),
+        ("roll", "u1"),  # 0 if the turn had no roll
+        ("hands", "u1", (num_players, len(RESOURCES))),
+        ("gains", "u1", (num_players,)),  # cards each seat took from the roll
+        ("victory_points", "u1", (num_players,)),
+    ])
+
+
+def game_dtype(num_players: int) -> np.dtype:
+    return np.dtype([
+        ("seed", "<u8"),
+        ("winner", "i1"),  # -1 if unfinished
+        ("turns", "<u4"),
+        ("first", "<u8"),  # index of the game's first turn record
+        ("victory_points", "u1", (num_players,)),
+    ])
+
+
+class TurnLog:
+    """Turn records for one game, collected from its recorder.
+
+    Attach once setup is over; a turn ends at each ``end_turn``, and a
+    seat's gains are the growth of its hand when the dice were applied.
+    Hands are kept as flat ints while playing and shaped on ``to_array``.
+    """
+
+    def __init__(self, game: Game) -> None:
+        self.game = game
+        self.num_players = len(game.state.players)
+        self._start = self._hands()
+        self._players: List[int] = []
+        self._rolls: List[int] = []
+        self._rolled: List[int] = []  # hands just after each turn's roll (zeros without one)
+        self._ends: List[int] = []  # hands at the end of each turn
+        self._points: List[int] = []
+        self._roll = 0
+        self._after_roll: Optional[List[int]] = None
+        game.recorder = self.record
+
+    def _hands(self) -> List[int]:
+        return [p.resources[r] for p in self.game.state.players for r in RESOURCES]
+
+    def record(self, name: str, args: Tuple) -> None:
+        if name == "apply_roll":
+            self._roll = args[0]
+            self._after_roll = self._hands()
+        elif name == "end_turn":
+            state = self.game.state
+            self._players.append((state.current_player - 1) % self.num_players)
+            self._rolls.append(self._roll)
+            self._rolled.extend(self._after_roll or [0] * (self.num_players * len(RESOURCES)))
+            self._ends.extend(self._hands())
+            self._points.extend(p.victory_points for p in state.players)
+            self._roll = 0
+            self._after_roll = None
+
+    def to_array(self) -> np.ndarray:
+        count = len(self._rolls)
+        shape = (count, self.num_players, len(RESOURCES))
+        out = np.zeros(count, dtype=turn_dtype(self.num_players))
+        out["turn"] = np.arange(count)
+        out["player"] = self._players
+        out["roll"] = self._rolls
+        ends = np.array(self._ends, dtype=np.int16).reshape(shape)
+        out["hands"] = ends
+        before = np.concatenate([np.array(self._start, dtype=np.int16).reshape((1,) + shape[1:]), ends[:-1]])
+        rolled = np.array(self._rolled, dtype=np.int16).reshape(shape)
+        gains = np.clip(rolled - before, 0, None).sum(axis=2)
+        gains[out["roll"] == 0] = 0
+        out["gains"] = gains
+        out["victory_points"] = np.array(self._points, dtype=np.uint8).reshape(count, self.num_players)
+        return out
+
+
+class ArchiveWriter:
+    """Streams games into an archive; ``close`` writes the game index and header."""
+
+    def __init__(self, path: Path, num_players: int) -> None:
+        self.path = Path(path)
+        self.num_players = num_players
+        self.turn_dtype = turn_dtype(num_players)
+        self._games: List[Tuple] = []
+        self._turns = 0
+        self._file = self.path.open("wb")
+        # No index offset yet: readers treat the archive as unfinished until close
+        self._file.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, num_players, 0, 0, 0).ljust(HEADER_SIZE, b"\0"))
+        self._file.flush()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def add(self, seed: int, winner: Optional[int], victory_points: Sequence[int], turns: np.ndarray) -> None:
+        """Append one game; ``turns`` are its records, e.g. from ``TurnLog.to_array``."""
+        if turns.dtype != self.turn_dtype:
+            raise ValueError(f"Turn records are not for a {self.num_players}-player archive")
+        if len(turns) > 0x10000:
+            raise ValueError("Games longer than 65536 turns do not fit the archive")
+        if len(victory_points) != self.num_players:
+            raise ValueError(f"Expected {self.num_players} victory point totals")
+        turns = turns.copy()
+        turns["game"] = len(self._games)
+        self._file.write(turns.tobytes())
+        self._games.append((seed, -1 if winner is None else winner, len(turns), self._turns, tuple(victory_points)))
+        self._turns += len(turns)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        index_offset = HEADER_SIZE + self._turns * self.turn_dtype.itemsize
+        self._file.write(np.array(self._games, dtype=game_dtype(self.num_players)).tobytes())
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(
+            ARCHIVE_MAGIC, ARCHIVE_VERSION, self.num_players, len(self._games), self._turns, index_offset
+        ))
+        self._file.close()
+
+
+class GameArchive:
+    """Read-only archive mapped into memory.
+
+    ``turns`` and ``games`` are NumPy structured arrays viewing the mapped
+    file directly; nothing is parsed or copied up front.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            header = f.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE:
+                raise ValueError(f"{self.path.name} is not a game archive")
+            magic, version, players, games, turns, index_offset = _HEADER.unpack_from(header)
+            if magic != ARCHIVE_MAGIC:
+                raise ValueError(f"{self.path.name} is not a game archive")
+            if version > ARCHIVE_VERSION:
+                raise ValueError(f"Archive version {version} is newer than this game supports")
+            if index_offset == 0:
+                raise ValueError(f"{self.path.name} was not finished (writer never closed)")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.num_players = players
+        self.turns: np.ndarray = np.frombuffer(self._mmap, dtype=turn_dtype(players), count=turns, offset=HEADER_SIZE)
+        self.games: np.ndarray = np.frombuffer(self._mmap, dtype=game_dtype(players), count=games, offset=index_offset)
+
+    def __enter__(self) -> "GameArchive":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def close(self) -> None:
+        """Drop the archive's views; the map closes now, or with the last view a caller still holds."""
+        del self.turns, self.games
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def game_turns(self, index: int) -> np.ndarray:
+        """Turn records of one game (a view)."""
+        game = self.games[index]
+        first = int(game["first"])
+        return self.turns[first:first + int(game["turns"])]
+
+    def _chunks(self) -> Iterator[Tuple[int, int]]:
+        for start in range(0, len(self.turns), CHUNK_ROWS):
+            yield start, min(start + CHUNK_ROWS, len(self.turns))
+
+    # --- aggregates ---
+
+    def win_rate_by_seat(self) -> np.ndarray:
+        """Share of all archived games won by each seat (unfinished games count for nobody)."""
+        if not len(self.games):
+            return np.zeros(self.num_players)
+        winners = self.games["winner"]
+        return np.bincount(winners[winners >= 0], minlength=self.num_players) / len(self.games)
+
+    def roll_histogram(self) -> np.ndarray:
+        """How often each dice total was rolled, indexed by the total (0-12)."""
+        counts = np.zeros(13, dtype=np.int64)
+        for start, stop in self._chunks():
+            counts += np.bincount(self.turns["roll"][start:stop], minlength=13)
+        counts[0] = 0  # turns without a roll
+        return counts
+
+    def starvation_curve(self, window: int = STARVATION_WINDOW) -> np.ndarray:
+        """Per turn number, the share of seats that took no cards from rolls in the last ``window`` turns.
+
+        Only games still running at a turn count towards it; early turns
+        look back to the start of the game.
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if not len(self.turns):
+            return np.zeros(0)
+        length = int(self.turns["turn"].max()) + 1
+        starved = np.zeros(length)
+        seats = np.zeros(length)
+        for start, stop in self._chunks():
+            # A row's window never reaches back past ``window`` rows, nor past its game's first turn
+            lo = max(0, start - window)
+            gains = self.turns["gains"][lo:stop]
+            cumulative = np.zeros((len(gains) + 1, self.num_players), dtype=np.int32)
+            np.cumsum(gains, axis=0, out=cumulative[1:])
+            turn_numbers = self.turns["turn"][start:stop].astype(np.intp)
+            ends = np.arange(start - lo + 1, stop - lo + 1)
+            received = cumulative[ends] - cumulative[ends - np.minimum(turn_numbers + 1, window)]
+            starved += np.bincount(turn_numbers, weights=(received == 0).sum(axis=1), minlength=length)
+            seats += np.bincount(turn_numbers, minlength=length) * self.num_players
+        return starved / np.maximum(seats, 1)
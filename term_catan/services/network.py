@@ -2,36 +2,140 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Callable, Dict, Optional, Set
 
 import websockets
 
+from term_catan.services.sync import (
+    SYNC_PROTOCOL,
+    SyncState,
+    decode_message,
+    encode_message,
+    hello_message,
+    resync_message,
+)
+
 
 class NetworkService:
+    """Versioned state sync over websockets; see services/sync.py for the protocol.
+
+    The host holds the authoritative copy: ``publish`` turns its own changes
+    into deltas for every peer, and the server applies clients' proposed
+    deltas and forwards them. A client says hello on ``connect``, proposes
+    its changes with ``send_state`` and follows the host with ``recv_state``.
+    Proposals go one at a time, so a client's moves reach the host in order;
+    ``refused`` says why the host turned the last one down, if it did.
+    """
+
     def __init__(self, host: str = "localhost", port: int = 8765) -> None:
         self.host = host
         self.port = port
+        self.sync = SyncState()
+        self.peers: Set[websockets.WebSocketServerProtocol] = set()
+        # Client: the latest local state, held while a proposal is in flight
+        self._queued: Optional[Dict] = None
+        self.refused: Optional[str] = None
+
+    # --- host ---
+
+    async def host_server(self, state: Optional[Dict] = None, on_change: Optional[Callable[[Dict], None]] = None) -> None:
+        """Serve ``state`` (if nothing was published yet); ``on_change`` sees each client change applied."""
+        if state is not None and self.sync.state is None:
+            self.sync.commit(state)
 
-    async def host_server(self) -> None:
         async def handler(ws):  # type: ignore[no-untyped-def]
-            async for _message in ws:
-                # Echo server for now
-                await ws.send(_message)
+            self.peers.add(ws)
+            try:
+                async for data in ws:
+                    await self._handle(ws, data, on_change)
+            finally:
+                self.peers.discard(ws)
 
         async with websockets.serve(handler, self.host, self.port):
             await asyncio.Future()  # run forever
 
+    async def _handle(self, ws, data: str, on_change: Optional[Callable[[Dict], None]]) -> None:  # type: ignore[no-untyped-def]
+        try:
+            message = decode_message(data)
+        except (ValueError, TypeError):
+            return  # not ours; ignore it
+        kind = message["type"]
+        if kind == "hello" and message.get("protocol") != SYNC_PROTOCOL:
+            await ws.close(reason=f"sync protocol {SYNC_PROTOCOL} required")
+        elif kind in ("hello", "resync"):
+            for out in self.sync.catch_up(message.get("version", -1)):
+                await ws.send(out)
+        elif kind == "delta":
+            if self.sync.receive(message, data):
+                # Forward the client's own encoding: no re-serialization per peer
+                websockets.broadcast(self.peers, data)
+                if on_change is not None:
+                    on_change(self.sync.state)  # type: ignore[arg-type]
+            else:
+                # Proposed on a stale version: say so, then bring the client up to date
+                await ws.send(encode_message({"type": "error", "message": "Another change reached the host first"}))
+                await ws.send(self.sync.full_data())
+
+    def publish(self, state: Dict) -> None:
+        """Make the host's ``state`` the next version and push the delta to every peer."""
+        data = self.sync.commit(state)
+        if data is not None and self.peers:
+            websockets.broadcast(self.peers, data)
+
+    # --- client ---
+
     async def connect(self) -> AsyncIterator[websockets.WebSocketClientProtocol]:
         uri = f"ws://{self.host}:{self.port}"
         async with websockets.connect(uri) as ws:
+            await ws.send(encode_message(hello_message(self.sync.version)))
             yield ws
 
-    @staticmethod
-    async def send_state(ws: websockets.WebSocketClientProtocol, state: dict) -> None:
-        await ws.send(json.dumps(state))
+    async def send_state(self, ws: websockets.WebSocketClientProtocol, state: dict) -> bool:
+        """Propose the changes from the synced state to ``state``; False if there were none.
+
+        While an earlier proposal waits for the host, ``state`` is held and
+        proposed once that one is echoed, on top of the version it made.
+        """
+        if self.sync.proposal is not None:
+            self._queued = state
+            return True
+        data = self.sync.propose(state)
+        if data is None:
+            return False
+        await ws.send(data)
+        return True
 
-    @staticmethod
-    async def recv_state(ws: websockets.WebSocketClientProtocol) -> dict:
-        msg = await ws.recv()
-        return json.loads(msg)
+    async def recv_state(self, ws: websockets.WebSocketClientProtocol) -> dict:
+        """The synced state after the host's next update, asking to resync when a delta leaves a gap.
 
+        Nothing is returned while this client's own changes are still on the
+        way, since the synced state would undo them locally. If the host
+        refuses a proposal, its state is returned with ``refused`` set and
+        any held changes are dropped.
+        """
+        self.refused = None
+        while True:
+            data = await ws.recv()
+            try:
+                message = decode_message(data)
+            except (ValueError, TypeError, json.JSONDecodeError):
+                continue
+            if message["type"] == "error":
+                self.refused = message.get("message", "")
+                continue
+            if message["type"] == "delta" and message["version"] <= self.sync.version:
+                continue  # already held, e.g. a catch-up overlapping a live update
+            waiting = self.sync.proposal is not None
+            if not self.sync.receive(message, data):
+                await ws.send(encode_message(resync_message(self.sync.version)))
+                continue
+            if waiting and message["type"] == "full" and self.refused is not None:
+                self._queued = None  # built on the refused proposal
+                return self.sync.state  # type: ignore[return-value]
+            if self.sync.proposal is not None:
+                continue  # someone else's change; ours is still in flight
+            if self._queued is not None:
+                queued, self._queued = self._queued, None
+                if await self.send_state(ws, queued):
+                    continue
+            return self.sync.state  # type: ignore[return-value]
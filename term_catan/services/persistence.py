@@ -1,37 +1,712 @@
 from __future__ import annotations
 
 import json
+import lzma
+import os
+import sqlite3
+import struct
+import time
+import zlib
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+from term_catan.core.compact import DEV_CARD_CODES, PHASE_CODES, PHASES, TILE_RESOURCE_CODES, TILE_RESOURCES
+from term_catan.core.dev_cards import DEV_CARD_TYPES
+from term_catan.core.game import Game
+from term_catan.core.models import RESOURCE_INDEX, RESOURCES
+from term_catan.core.replay import Event, GameRecord
+
+
+# Save files, version 2.
+#
+# A save holds the full GameState.to_dict() in one of two containers:
+#   - JSON text: {"format": SAVE_FORMAT, "version": 2, "state": {...}}
+#   - binary: SAVE_MAGIC, version, encoding, compression, payload length,
+#     then the payload ("json" bytes or the struct-packed layout below),
+#     optionally zlib/lzma compressed.
+# Version 1 saves are the bare state dict as JSON; the loader tells the
+# kinds apart by their first bytes, so every version stays loadable.
+
+SAVE_FORMAT = "term_catan"
+SAVE_VERSION = 2
+SAVE_MAGIC = b"TCSAVE"
+_HEADER = struct.Struct("<6sBBBI")  # magic, version, encoding, compression, payload length
+
+ENCODINGS: Tuple[str, ...] = ("json", "packed")
+COMPRESSIONS: Tuple[Optional[str], ...] = (None, "zlib", "lzma")
+# File suffix per container
+JSON_SUFFIX = ".json"
+BINARY_SUFFIX = ".tcsave"
+AUTOSAVE_NAME = "autosave"
+MANIFEST_NAME = "manifest.sqlite3"
+JOURNAL_SUFFIX = ".journal"
+
+_BUILDING_KINDS: Tuple[str, ...] = ("", "settlement", "city")
+_BUILDING_CODES: Dict[str, int] = {k: i for i, k in enumerate(_BUILDING_KINDS) if k}
+_NONE = 0xFF  # u8 stand-in for None
+
+
+# --- struct-packed payload ---
+
+
+class _Packer:
+    """Collects fields in one struct format so the payload is packed in a single call."""
+
+    __slots__ = ("fmt", "values")
+
+    def __init__(self) -> None:
+        self.fmt: List[str] = ["<"]
+        self.values: List = []
+
+    def u8(self, value: int) -> None:
+        self.fmt.append("B")
+        self.values.append(value)
+
+    def u16(self, value: int) -> None:
+        self.fmt.append("H")
+        self.values.append(value)
+
+    def u8s(self, values: List[int]) -> None:
+        """Length-prefixed run of u8 values."""
+        self.u8(len(values))
+        self.fmt.append(f"{len(values)}s")
+        self.values.append(bytes(values))
+
+    def text(self, value: str) -> None:
+        raw = value.encode("utf-8")
+        self.u8(len(raw))
+        self.fmt.append(f"{len(raw)}s")
+        self.values.append(raw)
+
+    def pairs(self, pairs: List) -> None:
+        """Length-prefixed run of (u8, u8) pairs, e.g. (player_id, vertex_id)."""
+        self.u8(len(pairs))
+        for a, b in pairs:
+            self.fmt.append("BB")
+            self.values.append(a)
+            self.values.append(b)
+
+    def pack(self) -> bytes:
+        return struct.pack("".join(self.fmt), *self.values)
+
+
+class _Unpacker:
+    __slots__ = ("data", "offset")
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.offset = 0
+
+    def _take(self, fmt: str) -> Tuple:
+        values = struct.unpack_from(fmt, self.data, self.offset)
+        self.offset += struct.calcsize(fmt)
+        return values
+
+    def u8(self) -> int:
+        return self._take("<B")[0]
+
+    def u16(self) -> int:
+        return self._take("<H")[0]
+
+    def u16s(self, count: int) -> Tuple[int, ...]:
+        return self._take(f"<{count}H")
+
+    def u8s(self) -> bytes:
+        count = self.u8()
+        return self._take(f"{count}s")[0]
+
+    def text(self) -> str:
+        return self.u8s().decode("utf-8")
+
+    def pairs(self) -> List[List[int]]:
+        flat = self._take(f"<{2 * self.u8()}B")
+        return [[flat[i], flat[i + 1]] for i in range(0, len(flat), 2)]
+
+
+def pack_state(state: Dict) -> bytes:
+    """Struct-packed encoding of GameState.to_dict(); ValueError if the state does not fit it."""
+    out = _Packer()
+    try:
+        players = state["players"]
+        out.u8(len(players))
+        for p in players:
+            if list(p["resources"]) != list(RESOURCES):
+                raise ValueError("unexpected resource keys")
+            out.u8(p["id"])
+            out.text(p["name"])
+            out.u8(1 if p["is_ai"] else 0)
+            for res in RESOURCES:
+                out.u16(p["resources"][res])
+            out.u8(p["roads"])
+            out.u8(p["settlements"])
+            out.u8(p["cities"])
+            out.u8(p["victory_points"])
+            out.u8s([DEV_CARD_CODES[c] for c in p["dev_cards"]])
+            out.u8(p["played_knights"])
+        out.u8(state["current_player"])
+        tiles = state["board"]["tiles"]
+        out.u8(len(tiles))
+        for t in tiles:
+            out.u8(TILE_RESOURCE_CODES[t["resource"]])
+            out.u8(t["number"])
+            out.pairs([(int(pid), _BUILDING_CODES[kind]) for pid, kind in t["buildings"].items()])
+        if list(state["bank"]) != list(RESOURCES):
+            raise ValueError("unexpected bank keys")
+        for res in RESOURCES:
+            out.u16(state["bank"][res])
+        out.u8(state["robber_index"])
+        out.u8s([DEV_CARD_CODES[c] for c in state["dev_deck"]])
+        out.u8(PHASE_CODES[state["phase"]])
+        out.u8(1 if state["has_rolled"] else 0)
+        out.u8(state["setup_step"])
+        out.u16(state["setup_pointer"])
+        out.pairs(state["settlements"])
+        out.pairs(state["roads"])
+        out.pairs(state["cities"])
+        owner = state["longest_road_owner"]
+        out.u8(_NONE if owner is None else owner)
+        return out.pack()
+    except (KeyError, TypeError, struct.error) as exc:
+        raise ValueError(f"State does not fit the packed save layout: {exc!r}") from exc
+
+
+def unpack_state(payload: bytes) -> Dict:
+    data = _Unpacker(payload)
+    players = []
+    for _ in range(data.u8()):
+        pid = data.u8()
+        name = data.text()
+        is_ai = bool(data.u8())
+        resources = dict(zip(RESOURCES, data.u16s(len(RESOURCES))))
+        roads, settlements, cities, victory_points = data.u8(), data.u8(), data.u8(), data.u8()
+        dev_cards = [DEV_CARD_TYPES[c] for c in data.u8s()]
+        players.append(
+            {
+                "id": pid,
+                "name": name,
+                "is_ai": is_ai,
+                "resources": resources,
+                "roads": roads,
+                "settlements": settlements,
+                "cities": cities,
+                "victory_points": victory_points,
+                "dev_cards": dev_cards,
+                "played_knights": data.u8(),
+            }
+        )
+    current_player = data.u8()
+    tiles = []
+    for _ in range(data.u8()):
+        resource = TILE_RESOURCES[data.u8()]
+        number = data.u8()
+        buildings = {pid: _BUILDING_KINDS[kind] for pid, kind in data.pairs()}
+        tiles.append({"resource": resource, "number": number, "buildings": buildings})
+    bank = dict(zip(RESOURCES, data.u16s(len(RESOURCES))))
+    robber_index = data.u8()
+    dev_deck = [DEV_CARD_TYPES[c] for c in data.u8s()]
+    phase = PHASES[data.u8()]
+    has_rolled = bool(data.u8())
+    setup_step = data.u8()
+    setup_pointer = data.u16()
+    settlements = data.pairs()
+    roads = data.pairs()
+    cities = data.pairs()
+    owner = data.u8()
+    return {
+        "players": players,
+        "current_player": current_player,
+        "board": {"tiles": tiles},
+        "bank": bank,
+        "robber_index": robber_index,
+        "dev_deck": dev_deck,
+        "phase": phase,
+        "has_rolled": has_rolled,
+        "setup_step": setup_step,
+        "setup_pointer": setup_pointer,
+        "settlements": settlements,
+        "roads": roads,
+        "cities": cities,
+        "longest_road_owner": None if owner == _NONE else owner,
+    }
+
+
+# --- containers ---
+
+
+def encode_save(state: Dict, encoding: str = "packed", compression: Optional[str] = "zlib") -> bytes:
+    """Binary save container; a state the packed layout cannot hold is stored as JSON instead."""
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown save encoding: {encoding!r}")
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown save compression: {compression!r}")
+    payload = None
+    if encoding == "packed":
+        try:
+            payload = pack_state(state)
+        except ValueError:
+            encoding = "json"
+    if payload is None:
+        payload = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    body = payload
+    if compression == "zlib":
+        body = zlib.compress(payload)
+    elif compression == "lzma":
+        body = lzma.compress(payload)
+    header = _HEADER.pack(SAVE_MAGIC, SAVE_VERSION, ENCODINGS.index(encoding), COMPRESSIONS.index(compression), len(payload))
+    return header + body
+
+
+def decode_save(data: bytes) -> Dict:
+    """State dict from any save version, binary or JSON."""
+    if data.startswith(SAVE_MAGIC):
+        _magic, version, encoding, compression, length = _HEADER.unpack_from(data)
+        if version > SAVE_VERSION:
+            raise ValueError(f"Save format v{version} is newer than this build (v{SAVE_VERSION})")
+        body = data[_HEADER.size:]
+        if COMPRESSIONS[compression] == "zlib":
+            body = zlib.decompress(body)
+        elif COMPRESSIONS[compression] == "lzma":
+            body = lzma.decompress(body)
+        if len(body) != length:
+            raise ValueError("Save payload is truncated")
+        if ENCODINGS[encoding] == "packed":
+            return unpack_state(body)
+        return json.loads(body)
+    doc = json.loads(data)
+    if isinstance(doc, dict) and doc.get("format") == SAVE_FORMAT:
+        if doc.get("version", SAVE_VERSION) > SAVE_VERSION:
+            raise ValueError(f"Save format v{doc['version']} is newer than this build (v{SAVE_VERSION})")
+        return doc["state"]
+    return doc  # version 1: the bare state dict
+
+
+# --- autosave journal ---
+#
+# The autosave is a checkpoint (a binary save) plus a journal of the Game
+# calls made since. Journal records are a one-byte op code followed by one
+# byte per argument (ids, dice totals, resource codes). The journal header
+# carries the checkpoint's CRC, so after a crash between writing a new
+# checkpoint and resetting the journal, the stale journal is ignored.
+
+JOURNAL_MAGIC = b"TCJRNL"
+_JOURNAL_HEADER = struct.Struct("<6sBI")  # magic, version, crc32 of the checkpoint file
+# Recorded Game methods and their argument kinds: "i" small int, "r" resource
+JOURNAL_EVENTS: Tuple[Tuple[str, str], ...] = (
+    ("setup_place_settlement", "i"),
+    ("setup_place_road", "i"),
+    ("setup_next", ""),
+    ("advance_setup_pointer", "i"),
+    ("apply_roll", "i"),
+    ("move_robber", "i"),
+    ("play_knight", "i"),
+    ("build_road", "i"),
+    ("build_settlement", "i"),
+    ("build_city", "i"),
+    ("bank_trade", "rr"),
+    ("buy_dev_card", ""),
+    ("demo_build", ""),
+    ("end_turn", ""),
+)
+_EVENT_CODES: Dict[str, int] = {name: code for code, (name, _kinds) in enumerate(JOURNAL_EVENTS)}
+# Events between checkpoints, and between fsyncs of the journal
+JOURNAL_CHECKPOINT_EVERY = 256
+JOURNAL_SYNC_EVERY = 16
+
+
+def encode_event(name: str, args: Tuple) -> bytes:
+    code = _EVENT_CODES[name]
+    kinds = JOURNAL_EVENTS[code][1]
+    return bytes([code] + [RESOURCE_INDEX[a] if kind == "r" else a for kind, a in zip(kinds, args)])
+
+
+def decode_events(data: bytes) -> List[Event]:
+    """Events in a journal body; a record cut short by a crash ends the list."""
+    events: List[Event] = []
+    offset = 0
+    while offset < len(data):
+        code = data[offset]
+        if code >= len(JOURNAL_EVENTS):
+            break
+        name, kinds = JOURNAL_EVENTS[code]
+        raw = data[offset + 1:offset + 1 + len(kinds)]
+        if len(raw) < len(kinds):
+            break
+        events.append((name, tuple(RESOURCES[a] if kind == "r" else a for kind, a in zip(kinds, raw))))
+        offset += 1 + len(kinds)
+    return events
+
+
+class GameJournal:
+    """Append-only autosave: a checkpoint plus every Game change made since.
+
+    ``attach`` hooks a game's recorder. Each change is written to the OS
+    straight away, so a crash of the program loses at most the change in
+    flight. The file is fsynced in batches of ``sync_every`` records, so an
+    OS crash or power loss can lose up to the last ``sync_every`` changes
+    (pass 1 to fsync every change). Every ``checkpoint_every`` records the
+    state is written out whole and the journal starts over. The first
+    checkpoint is only written once the attached game changes, so attaching
+    never clobbers an earlier autosave.
+    """
+
+    def __init__(
+        self,
+        checkpoint_path: Path,
+        journal_path: Path,
+        checkpoint_every: int = JOURNAL_CHECKPOINT_EVERY,
+        sync_every: int = JOURNAL_SYNC_EVERY,
+    ) -> None:
+        self.checkpoint_path = checkpoint_path
+        self.journal_path = journal_path
+        self.checkpoint_every = checkpoint_every
+        self.sync_every = sync_every
+        self.game: Optional[Game] = None
+        self._base: Optional[bytes] = None  # checkpoint owed before the next record
+        self._fd: Optional[int] = None
+        self._events = 0
+        self._unsynced = 0
+
+    def attach(self, game: Game) -> None:
+        self.detach()
+        self.game = game
+        self._base = encode_save(game.to_dict(), "packed", "zlib")
+        game.recorder = self.record
+
+    def detach(self) -> None:
+        if self.game is not None and self.game.recorder == self.record:
+            self.game.recorder = None
+        self.game = None
+        self.close()
+
+    def record(self, name: str, args: Tuple) -> None:
+        if self._base is not None:
+            self._write_checkpoint(self._base)
+        os.write(self._fd, encode_event(name, args))  # type: ignore[arg-type]
+        self._events += 1
+        self._unsynced += 1
+        if self._events >= self.checkpoint_every:
+            self.checkpoint()
+        elif self._unsynced >= self.sync_every:
+            os.fsync(self._fd)  # type: ignore[arg-type]
+            self._unsynced = 0
+
+    def checkpoint(self) -> None:
+        """Write the attached game out whole and start an empty journal."""
+        if self.game is not None:
+            self._write_checkpoint(encode_save(self.game.to_dict(), "packed", "zlib"))
+
+    def _write_checkpoint(self, data: bytes) -> None:
+        self.close()
+        _write_synced(self.checkpoint_path, data)
+        _write_synced(self.journal_path, _JOURNAL_HEADER.pack(JOURNAL_MAGIC, SAVE_VERSION, zlib.crc32(data)))
+        self._fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND)
+        self._base = None
+        self._events = 0
+        self._unsynced = 0
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.fsync(self._fd)
+            os.close(self._fd)
+            self._fd = None
+
+    def read_record(self) -> Optional[GameRecord]:
+        """The checkpoint and the journal written since, or None without a checkpoint."""
+        try:
+            data = self.checkpoint_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        record = GameRecord(decode_save(data))
+        try:
+            journal = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            return record
+        if len(journal) < _JOURNAL_HEADER.size:
+            return record
+        magic, _version, crc = _JOURNAL_HEADER.unpack_from(journal)
+        if magic != JOURNAL_MAGIC or crc != zlib.crc32(data):
+            return record  # left over from before the checkpoint
+        record.events = decode_events(journal[_JOURNAL_HEADER.size:])
+        return record
+
+    def restore(self) -> Optional[Game]:
+        """The checkpoint with the journal replayed on top, or None without a checkpoint."""
+        record = self.read_record()
+        if record is None:
+            return None
+        game = Game.from_dict(record.initial)
+        for name, args in record.events:
+            try:
+                getattr(game, name)(*args)
+            except (AssertionError, ValueError, IndexError):
+                break  # a damaged record; keep what replayed cleanly
+        return game
+
+
+def _write_synced(path: Path, data: bytes) -> None:
+    """Replace a file atomically and durably: written aside, fsynced, then swapped in."""
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if hasattr(os, "O_DIRECTORY"):
+        # Make the rename itself durable (POSIX; Windows cannot open directories)
+        fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+@dataclass
+class SaveReport:
+    action: str  # "save" | "load"
+    path: Path
+    size: int  # bytes on disk
+    seconds: float
+
+    def __str__(self) -> str:
+        return f"{self.path.name}: {self.size / 1024:.1f} KB in {self.seconds * 1000:.2f} ms"
+
+
+@dataclass(frozen=True)
+class SaveEntry:
+    slot: int
+    path: Path
+    created: float  # unix time
+    turn: str  # name of the player to move
+    phase: str
+    players: Tuple[Tuple[str, int], ...]  # (name, victory points) per seat
+    size: int  # bytes on disk
+
+    def summary(self) -> str:
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.created))
+        scores = ", ".join(f"{name} {vp}" for name, vp in self.players)
+        return f"#{self.slot:03d}  {when}  {self.turn} to move ({self.phase})  VP: {scores}"
+
+
+def _describe(state: Dict) -> Tuple[str, str, str]:
+    """(turn, phase, players JSON) manifest columns for a state dict."""
+    players = state["players"]
+    turn = players[state["current_player"]]["name"]
+    return turn, state["phase"], json.dumps([[p["name"], p["victory_points"]] for p in players])
+
+
+class SaveManifest:
+    """SQLite index of the numbered saves, so listing and numbering never scan the directory.
+
+    Each row is written in its own transaction, so the index is never left
+    half-updated. If the database is missing or unreadable it is rebuilt by
+    scanning ``base_dir`` once.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS saves ("
+        "slot INTEGER PRIMARY KEY, file TEXT NOT NULL, created REAL NOT NULL, "
+        "turn TEXT NOT NULL, phase TEXT NOT NULL, players TEXT NOT NULL, size INTEGER NOT NULL)"
+    )
+    _COLUMNS = "slot, file, created, turn, phase, players, size"
+
+    def __init__(self, base_dir: Path) -> None:
+        self.base_dir = base_dir
+        self.path = base_dir / MANIFEST_NAME
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is not None and not self.path.exists():
+            self.close()  # deleted under us; reopening rebuilds it
+        if self._conn is None:
+            fresh = not self.path.exists()
+            try:
+                self._conn = self._open()
+            except sqlite3.DatabaseError:
+                # Not a database any more; start over from the files on disk
+                self.path.unlink(missing_ok=True)
+                fresh = True
+                self._conn = self._open()
+            if fresh:
+                self._reindex(self._conn)
+        return self._conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                conn.execute(self._SCHEMA)
+            conn.execute("SELECT COUNT(*) FROM saves").fetchone()
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def rebuild(self) -> None:
+        """Re-index every numbered save file under ``base_dir``."""
+        self._reindex(self._db())
+
+    def _reindex(self, conn: sqlite3.Connection) -> None:
+        rows = []
+        for path in self.base_dir.glob("save_*"):
+            slot = SaveService.slot_of(path)
+            if slot is None:
+                continue
+            stat = path.stat()
+            try:
+                turn, phase, players = _describe(decode_save(path.read_bytes()))
+            except Exception:  # noqa: BLE001 - unreadable saves are still listed
+                turn, phase, players = "?", "unreadable", "[]"
+            rows.append((slot, path.name, stat.st_mtime, turn, phase, players, stat.st_size))
+        with conn:
+            conn.execute("DELETE FROM saves")
+            conn.executemany(f"INSERT OR REPLACE INTO saves ({self._COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def add(self, slot: int, path: Path, state: Dict, size: int) -> None:
+        turn, phase, players = _describe(state)
+        with self._db() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO saves ({self._COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (slot, path.name, time.time(), turn, phase, players, size),
+            )
+
+    def next_slot(self) -> int:
+        return self._db().execute("SELECT COALESCE(MAX(slot), 0) + 1 FROM saves").fetchone()[0]
+
+    def count(self) -> int:
+        return self._db().execute("SELECT COUNT(*) FROM saves").fetchone()[0]
+
+    def page(self, offset: int, limit: int) -> List[SaveEntry]:
+        """Entries newest first, ``limit`` of them starting ``offset`` rows in."""
+        rows = self._db().execute(
+            f"SELECT {self._COLUMNS} FROM saves ORDER BY slot DESC LIMIT ? OFFSET ?", (limit, offset)
+        )
+        return [self._entry(row) for row in rows]
+
+    def latest(self) -> Optional[SaveEntry]:
+        entries = self.page(0, 1)
+        return entries[0] if entries else None
+
+    def _entry(self, row: Tuple) -> SaveEntry:
+        slot, name, created, turn, phase, players, size = row
+        return SaveEntry(
+            slot, self.base_dir / name, created, turn, phase, tuple((n, vp) for n, vp in json.loads(players)), size
+        )
 
 
 class SaveService:
-    def __init__(self, base_dir: Optional[Path] = None) -> None:
+    """Numbered saves plus a rolling autosave under ``base_dir``.
+
+    ``encoding``/``compression`` pick the container of numbered saves:
+    ``"json"`` with no compression writes readable JSON text, anything else
+    the binary container. The autosave is ``journal``: a packed, compressed
+    checkpoint plus the changes made since, loaded through ``autosave_path``.
+    A crash of the game loses at most the action in flight; an OS crash or
+    power loss can lose the actions since the journal's last batched fsync
+    (up to ``JOURNAL_SYNC_EVERY``).
+    Numbered saves are indexed in ``manifest``; the autosave is not, since
+    it changes on every action. Every save and load leaves its size and
+    latency in ``last_report``.
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        encoding: str = "json",
+        compression: Optional[str] = None,
+    ) -> None:
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown save encoding: {encoding!r}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown save compression: {compression!r}")
         self.base_dir = base_dir or Path(__file__).resolve().parent.parent.parent / "saves"
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.encoding = encoding
+        self.compression = compression
+        self.manifest = SaveManifest(self.base_dir)
+        self.journal = GameJournal(self.autosave_path, self.base_dir / f"{AUTOSAVE_NAME}{JOURNAL_SUFFIX}")
+        self.last_report: Optional[SaveReport] = None
+
+    @property
+    def autosave_path(self) -> Path:
+        """The autosave checkpoint; loading it replays the journal too."""
+        return self.base_dir / f"{AUTOSAVE_NAME}{BINARY_SUFFIX}"
+
+    @staticmethod
+    def slot_of(path: Path) -> Optional[int]:
+        """Slot number of a ``save_###`` file, None for anything else."""
+        if path.suffix not in (JSON_SUFFIX, BINARY_SUFFIX) or not path.stem.startswith("save_"):
+            return None
+        try:
+            return int(path.stem[len("save_"):])
+        except ValueError:
+            return None
+
+    def _slot_path(self, slot: int, suffix: str) -> Path:
+        return self.base_dir / f"save_{slot:03d}{suffix}"
+
+    def _encode(self, state: Dict) -> Tuple[bytes, str]:
+        if self.encoding == "json" and self.compression is None:
+            doc = {"format": SAVE_FORMAT, "version": SAVE_VERSION, "state": state}
+            return json.dumps(doc, indent=2).encode("utf-8"), JSON_SUFFIX
+        return encode_save(state, self.encoding, self.compression), BINARY_SUFFIX
 
     def save_state(self, state: Dict) -> Path:
-        files = sorted(self.base_dir.glob("save_*.json"))
-        next_idx = 1
-        if files:
-            try:
-                last = files[-1]
-                next_idx = int(last.stem.split("_")[-1]) + 1
-            except Exception:
-                next_idx = len(files) + 1
-        path = self.base_dir / f"save_{next_idx:03d}.json"
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        start = time.perf_counter()
+        slot = self.manifest.next_slot()
+        # A file the manifest missed (e.g. a crash before it was recorded) keeps its slot
+        while self._slot_path(slot, JSON_SUFFIX).exists() or self._slot_path(slot, BINARY_SUFFIX).exists():
+            slot += 1
+        data, suffix = self._encode(state)
+        path = self._slot_path(slot, suffix)
+        # The manifest only lists a save once the file is durable
+        _write_synced(path, data)
+        self.manifest.add(slot, path, state, len(data))
+        self.last_report = SaveReport("save", path, len(data), time.perf_counter() - start)
         return path
 
+    def load(self, path: Path) -> Dict:
+        start = time.perf_counter()
+        path = Path(path)
+        if path == self.autosave_path:
+            game = self.journal.restore()
+            if game is None:
+                raise FileNotFoundError(path)
+            state = game.to_dict()
+            size = path.stat().st_size + (self.journal.journal_path.stat().st_size if self.journal.journal_path.exists() else 0)
+        else:
+            data = path.read_bytes()
+            state = decode_save(data)
+            size = len(data)
+        self.last_report = SaveReport("load", path, size, time.perf_counter() - start)
+        return state
+
+    def latest_path(self) -> Optional[Path]:
+        """The most recently written of the newest numbered save and the autosave."""
+        latest = self.manifest.latest()
+        candidates = [latest.path] if latest is not None and latest.path.exists() else []
+        if self.autosave_path.exists():
+            candidates.append(self.autosave_path)
+        if not candidates:
+            return None
+
+        def written(p: Path) -> int:
+            if p == self.autosave_path and self.journal.journal_path.exists():
+                return max(p.stat().st_mtime_ns, self.journal.journal_path.stat().st_mtime_ns)
+            return p.stat().st_mtime_ns
+
+        return max(candidates, key=written)
+
     def load_latest(self) -> Optional[Dict]:
-        files = sorted(self.base_dir.glob("save_*.json"))
-        if not files:
+        path = self.latest_path()
+        if path is None:
             return None
-        path = files[-1]
         try:
-            with path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return self.load(path)
         except Exception:
             return None
-
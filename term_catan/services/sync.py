@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+# Versioned state sync for multiplayer.
+#
+# Every change to the shared game bumps the state version and is sent as a
+# delta against the version before it, carrying only what changed: scalar
+# fields, the fields of each player that moved, the tiles whose buildings
+# changed, and list edits (pieces appended, a settlement removed for a city,
+# cards drawn off the deck). A peer applies a delta only when its base is the
+# version it holds; otherwise it asks to resync. Only the host numbers
+# versions: a client proposes a delta on the version it holds, and the host
+# applies it and sends it to everyone, the proposer included, or answers a
+# stale proposal with an error and the full state. A client has at most one
+# proposal in flight; its next one waits for the echo and is diffed against
+# the version that brought. The host keeps the recent deltas, so a
+# peer a few versions behind is caught up with those and only one that fell
+# further back gets the full state.
+#
+# Messages are JSON objects:
+#   {"type": "hello", "protocol": 1, "version": v}   join, holding version v (-1: nothing)
+#       (to the rooms server, also "room" and "seat": see term_catan/server.py)
+#   {"type": "resync", "version": v}                 a delta did not fit on v
+#   {"type": "full", "version": v, "state": {...}}
+#   {"type": "delta", "base": v, "version": v + 1, "changes": {...}}
+#   {"type": "error", "message": "..."}             the host refused a message
+
+SYNC_PROTOCOL = 1
+# Deltas kept for catching up peers that fell behind
+SYNC_HISTORY = 64
+
+# to_dict keys whose list values are edited in place rather than replaced
+_LIST_KEYS = ("settlements", "roads", "cities", "dev_deck")
+
+
+def _list_delta(old: List, new: List) -> Optional[Dict[str, Any]]:
+    """An edit turning ``old`` into ``new``, or None if it is not one of the usual shapes."""
+    if new[:len(old)] == old:
+        return {"append": new[len(old):]}
+    if old[:len(new)] == new:
+        return {"truncate": len(new)}
+    # Some entries dropped (a settlement upgraded) and new ones appended
+    present = {tuple(x) for x in new}
+    kept = [x for x in old if tuple(x) in present]
+    if new[:len(kept)] == kept:
+        return {"remove": [x for x in old if tuple(x) not in present], "append": new[len(kept):]}
+    return None
+
+
+def _tile(tile: Dict) -> Dict:
+    # JSON turns the int player-id keys of tile buildings into strings; compare and send them that way
+    return {**tile, "buildings": {str(pid): kind for pid, kind in tile["buildings"].items()}}
+
+
+def diff_state(old: Dict, new: Dict) -> Dict:
+    """Changes taking the ``to_dict`` state ``old`` to ``new``; empty if they are equal."""
+    changes: Dict[str, Any] = {}
+    for key, value in new.items():
+        before = old.get(key)
+        if value == before:
+            continue
+        if key == "players" and before is not None and len(before) == len(value):
+            changes["players"] = {
+                str(pid): {field: v for field, v in player.items() if v != prior.get(field)}
+                for pid, (player, prior) in enumerate(zip(value, before))
+                if player != prior
+            }
+        elif key == "board" and before is not None and len(before["tiles"]) == len(value["tiles"]):
+            tiles = {}
+            for tidx, (tile, prior) in enumerate(zip(value["tiles"], before["tiles"])):
+                tile = _tile(tile)
+                if tile != _tile(prior):
+                    tiles[str(tidx)] = tile
+            if tiles:
+                changes["tiles"] = tiles
+        elif key in _LIST_KEYS and before is not None:
+            edit = _list_delta(before, value)
+            if edit is not None:
+                changes.setdefault("lists", {})[key] = edit
+            else:
+                changes.setdefault("set", {})[key] = value
+        else:
+            changes.setdefault("set", {})[key] = value
+    return changes
+
+
+def apply_changes(state: Dict, changes: Dict) -> None:
+    """Apply ``diff_state`` output to ``state`` in place."""
+    for key, value in changes.get("set", {}).items():
+        state[key] = value
+    for pid, fields in changes.get("players", {}).items():
+        state["players"][int(pid)].update(fields)
+    for tidx, tile in changes.get("tiles", {}).items():
+        state["board"]["tiles"][int(tidx)] = tile
+    for key, edit in changes.get("lists", {}).items():
+        items = state[key]
+        if "truncate" in edit:
+            del items[edit["truncate"]:]
+        if "remove" in edit:
+            dropped = {tuple(x) for x in edit["remove"]}
+            items[:] = [x for x in items if tuple(x) not in dropped]
+        items.extend(edit.get("append", ()))
+
+
+def encode_message(message: Dict) -> str:
+    return json.dumps(message, separators=(",", ":"))
+
+
+def decode_message(data: str) -> Dict:
+    message = json.loads(data)
+    if not isinstance(message, dict) or "type" not in message:
+        raise ValueError("Not a sync message")
+    return message
+
+
+class SyncState:
+    """One peer's copy of the shared state, its version and the recent deltas.
+
+    Outgoing messages come back already encoded, and the history keeps them
+    that way: each one is serialized once however many peers it goes to, and
+    later edits to the state cannot reach a delta waiting to be replayed.
+    """
+
+    def __init__(self, state: Optional[Dict] = None, version: int = 0, history: int = SYNC_HISTORY) -> None:
+        self.state = state
+        self.version = version if state is not None else -1
+        self._history: Deque[Tuple[int, str]] = deque(maxlen=history)  # (base version, encoded delta)
+        # A client's proposal the host has not echoed yet
+        self.proposal: Optional[str] = None
+
+    def full_data(self) -> str:
+        return encode_message({"type": "full", "version": self.version, "state": self.state})
+
+    def commit(self, state: Dict) -> Optional[str]:
+        """Take ``state`` (a fresh ``to_dict``) as the next version; the message to send, or None if unchanged."""
+        if self.state is None:
+            self.state = state
+            self.version = 0
+            return self.full_data()
+        changes = diff_state(self.state, state)
+        if not changes:
+            return None
+        data = encode_message({"type": "delta", "base": self.version, "version": self.version + 1, "changes": changes})
+        self._history.append((self.version, data))
+        self.state = state
+        self.version += 1
+        return data
+
+    def propose(self, state: Dict) -> Optional[str]:
+        """A delta from the held version to ``state``, for a client to send to the host.
+
+        The client's copy stays as it is; the change counts once the host
+        sends it back as the next version. Until then it is ``proposal``, and
+        another one cannot be made: both would sit on the same base and the
+        host would refuse the second.
+        """
+        if self.proposal is not None:
+            raise ValueError("A proposal is already waiting for the host")
+        if self.state is None:
+            return None
+        changes = diff_state(self.state, state)
+        if not changes:
+            return None
+        self.proposal = encode_message({"type": "delta", "base": self.version, "version": self.version + 1, "changes": changes})
+        return self.proposal
+
+    def receive(self, message: Dict, data: Optional[str] = None) -> bool:
+        """Apply a decoded full or delta message; False if a delta's base is not the version held.
+
+        ``data`` is the message as received, kept for forwarding a delta on.
+        The echo of ``proposal`` settles it; a full state drops it, since the
+        host answers a refused proposal with one.
+        """
+        kind = message.get("type")
+        if kind == "full":
+            self.state = message["state"]
+            self.version = message["version"]
+            self._history.clear()
+            self.proposal = None
+            return True
+        if kind != "delta":
+            raise ValueError(f"Cannot apply a {kind!r} message")
+        if self.state is None or message["base"] != self.version:
+            return False
+        if data is None:
+            data = encode_message(message)
+        if data == self.proposal:
+            self.proposal = None
+        self._history.append((self.version, data))
+        apply_changes(self.state, message["changes"])
+        self.version = message["version"]
+        return True
+
+    def catch_up(self, version: int) -> List[str]:
+        """Messages bringing a peer at ``version`` up to date: kept deltas when they reach back far enough."""
+        if self.state is None or version == self.version:
+            return []
+        if 0 <= version < self.version and self._history and self._history[0][0] <= version:
+            return [data for base, data in self._history if base >= version]
+        return [self.full_data()]
+
+
+def hello_message(version: int, room: Optional[str] = None, seat: Optional[int] = None) -> Dict:
+    """Join message; ``room`` and ``seat`` pick a table on the rooms server (term_catan/server.py)."""
+    message: Dict[str, Any] = {"type": "hello", "protocol": SYNC_PROTOCOL, "version": version}
+    if room is not None:
+        message["room"] = room
+        message["seat"] = seat
+    return message
+
+
+def resync_message(version: int) -> Dict:
+    return {"type": "resync", "version": version}
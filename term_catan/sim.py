@@ -0,0 +1,196 @@
+"""Headless AI-vs-AI simulation: ``python -m term_catan.sim --games N --seed S``.
+
+Runs complete games (setup placement included) on the core rules with no UI
+imports, and reports throughput, turn counts and wins per seat. Games are
+spread over a process pool in chunks; each game's seed is drawn from the
+master seed up front, so results do not depend on the worker count. With
+``--archive PATH`` every turn of every game is also written to a game
+archive (see services/archive.py) for later analysis.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence
+
+from term_catan.core.ai import SimpleAI
+from term_catan.core.game import Game
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+DEFAULT_PLAYERS = 4
+# Games still undecided after this many turns are stopped and counted as unfinished
+DEFAULT_MAX_TURNS = 500
+DEFAULT_CHUNK_SIZE = 25
+
+
+@dataclass
+class GameResult:
+    seed: int
+    winner: Optional[int]  # seat of the winner, None if max_turns was hit
+    turns: int
+    victory_points: List[int]
+    history: Optional[np.ndarray] = None  # turn records, when archiving
+
+
+@dataclass
+class SimStats:
+    games: int = 0
+    unfinished: int = 0
+    wins: Dict[int, int] = field(default_factory=dict)
+    turns: List[int] = field(default_factory=list)
+    elapsed: float = 0.0
+    # Results carrying turn records, waiting to be archived
+    archived: List[GameResult] = field(default_factory=list)
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        self.turns.append(result.turns)
+        if result.winner is None:
+            self.unfinished += 1
+        else:
+            self.wins[result.winner] = self.wins.get(result.winner, 0) + 1
+        if result.history is not None:
+            self.archived.append(result)
+
+    def merge(self, other: "SimStats") -> None:
+        self.games += other.games
+        self.unfinished += other.unfinished
+        for seat, count in other.wins.items():
+            self.wins[seat] = self.wins.get(seat, 0) + count
+        self.turns.extend(other.turns)
+
+    def report(self) -> str:
+        lines = [f"games: {self.games} in {self.elapsed:.2f}s ({self.games / max(self.elapsed, 1e-9):.1f} games/s)"]
+        if self.turns:
+            lines.append(
+                f"turns: mean {statistics.mean(self.turns):.1f}, median {statistics.median(self.turns):g}, "
+                f"min {min(self.turns)}, max {max(self.turns)}"
+            )
+        for seat in sorted(self.wins):
+            lines.append(f"seat {seat}: {self.wins[seat]} wins ({100 * self.wins[seat] / self.games:.1f}%)")
+        lines.append(f"unfinished: {self.unfinished}")
+        return "\n".join(lines)
+
+
+def play_game(
+    seed: int, num_players: int = DEFAULT_PLAYERS, max_turns: int = DEFAULT_MAX_TURNS, archive: bool = False
+) -> GameResult:
+    game = Game(num_humans=0, num_ai=num_players, seed=seed)
+    ai = SimpleAI(game)
+    while game.state.phase == "setup":
+        ai.take_turn_if_ai()
+    log = None
+    if archive:
+        from term_catan.services.archive import TurnLog  # needs NumPy, so only when archiving
+
+        log = TurnLog(game)
+    turns = 0
+    winner = None
+    while turns < max_turns:
+        ai.take_turn_if_ai()
+        turns += 1
+        winner = game.winner()
+        if winner is not None:
+            break
+    history = log.to_array() if log is not None else None
+    return GameResult(seed, winner, turns, [p.victory_points for p in game.state.players], history)
+
+
+def game_seeds(master_seed: int, games: int) -> List[int]:
+    rng = random.Random(master_seed)
+    return [rng.getrandbits(63) for _ in range(games)]
+
+
+def _play_chunk(seeds: Sequence[int], num_players: int, max_turns: int, archive: bool = False) -> SimStats:
+    stats = SimStats()
+    for seed in seeds:
+        stats.add(play_game(seed, num_players, max_turns, archive))
+    return stats
+
+
+def iter_chunks(
+    games: int,
+    seed: int,
+    num_players: int = DEFAULT_PLAYERS,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    archive: bool = False,
+) -> Iterator[SimStats]:
+    """Per-chunk stats, yielded in seed order as the chunks finish."""
+    seeds = game_seeds(seed, games)
+    chunks = [seeds[i:i + chunk_size] for i in range(0, games, chunk_size)]
+    if workers <= 1:
+        for chunk in chunks:
+            yield _play_chunk(chunk, num_players, max_turns, archive)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        count = len(chunks)
+        yield from pool.map(_play_chunk, chunks, [num_players] * count, [max_turns] * count, [archive] * count)
+
+
+def run(
+    games: int,
+    seed: int,
+    num_players: int = DEFAULT_PLAYERS,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: bool = False,
+    archive_path: Optional[str] = None,
+) -> SimStats:
+    stats = SimStats()
+    start = time.perf_counter()
+    writer = None
+    if archive_path:
+        from term_catan.services.archive import ArchiveWriter  # needs NumPy, so only when archiving
+
+        writer = ArchiveWriter(archive_path, num_players)
+    try:
+        for chunk in iter_chunks(games, seed, num_players, max_turns, workers, chunk_size, writer is not None):
+            if writer is not None:
+                for result in chunk.archived:
+                    writer.add(result.seed, result.winner, result.victory_points, result.history)
+            stats.merge(chunk)
+            if progress:
+                print(f"\r{stats.games}/{games} games", end="", flush=True)
+    finally:
+        if writer is not None:
+            writer.close()
+    if progress:
+        print()
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m term_catan.sim", description="Run headless AI-vs-AI games.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--players", type=int, default=DEFAULT_PLAYERS)
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes (1 runs in-process)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="games per work item")
+    parser.add_argument("--progress", action="store_true", help="print a running game count")
+    parser.add_argument("--archive", metavar="PATH", help="also write every turn to a game archive at PATH")
+    args = parser.parse_args(argv)
+    if args.games < 1 or args.players < 2 or args.chunk_size < 1:
+        parser.error("need at least 1 game, 2 players and a chunk size of 1")
+    stats = run(
+        args.games, args.seed, args.players, args.max_turns, args.workers, args.chunk_size, args.progress, args.archive
+    )
+    print(stats.report())
+    if args.archive:
+        print(f"archived to {args.archive}")
+
+
+if __name__ == "__main__":
+    main()
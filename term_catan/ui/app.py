@@ -7,6 +7,7 @@ from term_catan.ui.views.host_screen import create_host_screen
 from term_catan.ui.views.join_screen import create_join_screen
 from term_catan.ui.views.load_screen import create_load_screen
 from term_catan.ui.views.game_screen import GameScreen
+from term_catan.ui.views.replay_screen import create_replay_screen
 
 
 class AppController:
@@ -16,31 +17,40 @@ class AppController:
         self.game_screen: Optional[GameScreen] = None
 
     def show_main_menu(self) -> None:
+        self._close_game()
         menu = create_main_menu(
             on_single_player=self.start_single_player,
             on_host=self.start_host,
             on_join=self.start_join,
             on_load=self.on_load,
+            on_replay=self.on_replay,
             on_quit=self.quit,
         )
         self.frame.body = menu
 
-    def start_single_player(self) -> None:
-        self.game_screen = GameScreen(self.loop, single_player=True)
+    def _open_game(self, **options: bool) -> None:
+        self._close_game()
+        self.game_screen = GameScreen(self.loop, **options)
         self.frame.body = self.game_screen.widget
 
+    def _close_game(self) -> None:
+        if self.game_screen is not None:
+            self.game_screen.close()
+            self.game_screen = None
+
+    def start_single_player(self) -> None:
+        self._open_game(single_player=True)
+
     def start_host(self) -> None:
         def do_start() -> None:
-            self.game_screen = GameScreen(self.loop, host=True)
-            self.frame.body = self.game_screen.widget
+            self._open_game(host=True)
 
         self.frame.body = create_host_screen(on_back=self.show_main_menu, on_start=do_start)
 
     def start_join(self) -> None:
         def do_join(addr: str) -> None:
             # For now ignore addr and use default in NetworkService
-            self.game_screen = GameScreen(self.loop, join=True)
-            self.frame.body = self.game_screen.widget
+            self._open_game(join=True)
 
         self.frame.body = create_join_screen(on_back=self.show_main_menu, on_join=do_join)
 
@@ -49,11 +59,15 @@ class AppController:
             if self.game_screen is None:
                 self.start_single_player()
             assert self.game_screen is not None
-            self.game_screen.load_game()
+            self.game_screen.load_game(path)
 
         self.frame.body = create_load_screen(on_back=self.show_main_menu, on_load=lambda _p: do_load(_p))
 
+    def on_replay(self) -> None:
+        self.frame.body = create_replay_screen(self.loop, on_back=self.show_main_menu)
+
     def quit(self) -> None:
+        self._close_game()
         raise urwid.ExitMainLoop()
 
 
@@ -77,6 +91,7 @@ def run_app() -> None:
         ("settlement_bg", "black", "brown"),
         ("city_bg", "black,bold", "brown"),
         ("number", "black,bold", "light gray"),
+        ("hint", "white,bold", "dark blue"),
         # Resource backgrounds (tile fill colors)
         ("res_wood", "black", "dark green"),
         ("res_brick", "black", "dark red"),
@@ -9,10 +9,11 @@ def show_roll_results(loop: urwid.MainLoop, roll: int, gains: Dict[int, Dict[str
     if roll == 7:
         lines.append(urwid.Text("Robber activated. Players with >7 cards must discard."))
     else:
-        for pid, resmap in gains.items():
-            name = next((p.name for p in players if p.id == pid), str(pid))
+        # gains only lists players who produced this roll
+        for p in players:
+            resmap = gains.get(p.id, {})
             gained = ", ".join([f"{r}:{amt}" for r, amt in resmap.items() if amt > 0]) or "-"
-            lines.append(urwid.Text(f"{name}: {gained}"))
+            lines.append(urwid.Text(f"{p.name}: {gained}"))
     body = urwid.Pile(lines)
     show_dialog(loop, body, title="Roll Results", buttons=[("OK", lambda: None)])
 
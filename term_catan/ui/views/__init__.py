@@ -1,5 +1,6 @@
 __all__ = [
     "main_menu",
     "game_screen",
+    "replay_screen",
 ]
 
@@ -1,10 +1,15 @@
 import json
 import asyncio
 import urwid
-from typing import List, Optional
+import websockets
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
 
+from term_catan.core import topology
 from term_catan.core.game import Game
-from term_catan.core.ai import SimpleAI
+from term_catan.core.models import GameState
+from term_catan.core.ai import MCTSAI
 from term_catan.services.persistence import SaveService
 from term_catan.services.network import NetworkService
 from term_catan.ui.widgets.board_renderer import BoardRenderer
@@ -14,14 +19,29 @@ from term_catan.ui.dialogs.setup_help import show_setup_help
 from term_catan.ui.widgets.half_block_canvas import HalfBlockCanvas, VertexId, EdgeId
 
 
+# Seconds of search per AI decision
+AI_TIME_BUDGET = 0.3
+# Best open settlement spots marked on the board during setup placement
+HINT_SPOTS = 3
+
+
 class GameScreen:
     def __init__(self, loop: urwid.MainLoop, single_player: bool = False, host: bool = False, join: bool = False) -> None:
         self.loop = loop
         self.game = Game(num_humans=1 if single_player else 0, num_ai=3)
         self.save_service = SaveService()
+        # Every change to the game is journaled as the autosave
+        self.save_service.journal.attach(self.game)
         self.network = NetworkService()
         self.is_host = host
         self.is_join = join
+        self._ws = None  # connection to the host, once joined
+        # The event loop only holds tasks weakly; keep the server/sync task alive
+        self._net_task: Optional[asyncio.Future] = None
+        # AI search runs on a worker thread; results are applied back on the event loop
+        self._ai_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai")
+        self._ais: Dict[int, MCTSAI] = {}
+        self._ai_task: Optional[asyncio.Future] = None
 
         self.board_widget = BoardRenderer(self.game.state.board, self.game.state.robber_index)
         # Use half-block pixel canvas for rendering
@@ -35,16 +55,16 @@ class GameScreen:
         self.error = urwid.Text("", align="left")
         self.sidebar = Sidebar(
             self.game,
-            on_roll=self.roll_dice,
-            on_build=self.build_road_demo,
-            on_end=self.end_turn,
-            on_buy_dev=self.buy_dev_card,
-            on_play_knight=self.play_knight,
-            on_move_robber=self.move_robber_action,
-            on_save=self.save_game,
-            on_load=self.load_game,
-            on_setup_place_settlement=self.setup_place_settlement_action,
-            on_setup_place_road=self.setup_place_road_action,
+            on_roll=self._when_idle(self.roll_dice),
+            on_build=self._when_idle(self.build_road_demo),
+            on_end=self._when_idle(self.end_turn),
+            on_buy_dev=self._when_idle(self.buy_dev_card),
+            on_play_knight=self._when_idle(self.play_knight),
+            on_move_robber=self._when_idle(self.move_robber_action),
+            on_save=self._when_idle(self.save_game),
+            on_load=self._when_idle(self.load_game),
+            on_setup_place_settlement=self._when_idle(self.setup_place_settlement_action),
+            on_setup_place_road=self._when_idle(self.setup_place_road_action),
         )
         columns = urwid.Columns([
             ("weight", 3, urwid.AttrMap(self.hex_canvas, "board")),
@@ -66,6 +86,9 @@ class GameScreen:
             if not isinstance(key, str):
                 return
             k = key.lower()
+            if self.ai_busy:
+                self.error.set_text("AI players are moving...")
+                return
             if k == "r":
                 self.roll_dice()
             elif k == "b":
@@ -93,9 +116,17 @@ class GameScreen:
 
     def refresh_board(self) -> None:
         self.board_widget.refresh(self.game.state.board, self.game.state.robber_index)
-        self.hex_canvas.refresh(self.game.state.board, self.game.state.robber_index, current_player_id=self.game.state.current_player)
+        self.hex_canvas.refresh(
+            self.game.state.board,
+            self.game.state.robber_index,
+            current_player_id=self.game.state.current_player,
+            settlements=self.game.state.settlements,
+            cities=self.game.state.cities,
+            roads=self.game.state.roads,
+        )
         self.status.set_text(self.game.render_status())
         self.sidebar.refresh(self.game)
+        self._sync_out()
 
     def roll_dice(self) -> None:
         if self.game.state.phase not in ("turn_roll", "turn_actions") or self.game.state.has_rolled:
@@ -108,12 +139,53 @@ class GameScreen:
     def end_turn(self) -> None:
         self.game.end_turn()
         self.refresh_board()
-        # Let AI act automatically if next player is AI
-        ai = SimpleAI(self.game)
-        action = ai.take_turn_if_ai()
-        if action is not None:
-            self.status.set_text(f"AI action: {action}")
-            self.refresh_board()
+        # Let AI seats play out until a human is up again
+        self.schedule_ai_turns()
+
+    @property
+    def ai_busy(self) -> bool:
+        return self._ai_task is not None and not self._ai_task.done()
+
+    def _when_idle(self, action: Callable[[], None]) -> Callable[[], None]:
+        """Wrap a human action so it is ignored while AI seats are moving."""
+        def run() -> None:
+            if self.ai_busy:
+                self.error.set_text("AI players are moving...")
+                return
+            action()
+        return run
+
+    def schedule_ai_turns(self) -> None:
+        if self.ai_busy:
+            return
+        player = self.game.state.players[self.game.state.current_player]
+        if player.is_ai and self.game.winner() is None:
+            self._ai_task = asyncio.ensure_future(self._play_ai_turns())
+
+    async def _play_ai_turns(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self.game.winner() is None:
+                player = self.game.state.players[self.game.state.current_player]
+                if not player.is_ai:
+                    break
+                ai = self._ais.get(player.id)
+                if ai is None or ai.game is not self.game:
+                    ai = self._ais[player.id] = MCTSAI(self.game, time_budget=AI_TIME_BUDGET)
+                # Search off the event loop; human input is blocked until we are done
+                action = await loop.run_in_executor(self._ai_executor, ai.choose_action)
+                ai.play(action)
+                self.refresh_board()
+                self.status.set_text(f"{player.name}: {' '.join(str(part) for part in action)}")
+                self._draw()
+        except Exception as exc:  # noqa: BLE001
+            self.error.set_text(f"AI error: {exc}")
+            self._draw()
+
+    def _draw(self) -> None:
+        # Updates made from a task are not followed by urwid's idle redraw
+        if self.loop.screen.started:
+            self.loop.draw_screen()
 
     def build_road_demo(self) -> None:
         try:
@@ -125,14 +197,23 @@ class GameScreen:
     def save_game(self) -> None:
         state = self.game.to_dict()
         self.save_service.save_state(state)
-        self.status.set_text("Saved game.")
+        self.status.set_text(f"Saved game ({self.save_service.last_report}).")
 
-    def load_game(self) -> None:
-        state = self.save_service.load_latest()
+    def load_game(self, path: Optional[str] = None) -> None:
+        if path is None:
+            state = self.save_service.load_latest()
+        else:
+            try:
+                state = self.save_service.load(Path(path))
+            except Exception:  # noqa: BLE001
+                state = None
         if state:
+            self._stop_ai()
             self.game = Game.from_dict(state)
-            self.status.set_text("Loaded game.")
+            self.save_service.journal.attach(self.game)
             self.refresh_board()
+            self.status.set_text(f"Loaded game ({self.save_service.last_report}).")
+            self.schedule_ai_turns()
         else:
             self.error.set_text("No save found.")
 
@@ -167,27 +248,19 @@ class GameScreen:
         self.refresh_board()
 
     def setup_place(self) -> None:
-        try:
-            focus = self.board_widget.get_focus_index()
-            if self.game.state.setup_pointer % 2 == 0:
-                # toggle hex canvas placement mode and wait for click
-                self.hex_canvas.set_mode("settlement")
-                return
-            else:
-                self.hex_canvas.set_mode("road")
-                return
-            self.game.state.setup_pointer += 1
-            finished = False
-            if self.game.state.setup_pointer % 2 == 0:
-                finished = self.game.setup_next()
-            if finished:
-                self.status.set_text("Setup complete. Begin turns.")
-        except Exception as exc:  # noqa: BLE001
-            self.error.set_text(f"Error: {exc}")
-        self.refresh_board()
+        # Enter placement mode for the next piece; the click on the board places it
+        if self.game.state.setup_pointer % 2 == 0:
+            self._enter_settlement_mode()
+        else:
+            self.hex_canvas.set_mode("road")
 
     def setup_place_settlement_action(self) -> None:
         # Enable settlement placement mode; placement is finalized via click callback
+        self._enter_settlement_mode()
+
+    def _enter_settlement_mode(self) -> None:
+        spots = self.game.setup_settlement_spots()
+        self.hex_canvas.set_hints(self.game.board_evaluator().best_spots(spots, HINT_SPOTS))
         self.hex_canvas.set_mode("settlement")
 
     def setup_place_road_action(self) -> None:
@@ -195,48 +268,84 @@ class GameScreen:
         self.hex_canvas.set_mode("road")
 
     def _place_settlement_vertex(self, vid: VertexId) -> None:
-        # Map vertex to a tile index; for simplicity pick the tile for vid row/col
-        row, col, _corner = vid
-        # Find tile index matching (row,col)
-        # In HexCanvas, tile positions are mapped based on 3-4-5-4-3 layout in order
-        # We'll reconstruct the mapping here to compute index from (row,col)
-        idx = 0
-        rows_layout = [3, 4, 5, 4, 3]
-        for r, count in enumerate(rows_layout):
-            for c in range(count):
-                if r == row and c == col:
-                    try:
-                        self.game.setup_place_settlement(idx)
-                    except Exception as exc:  # noqa: BLE001
-                        self.error.set_text(f"Error: {exc}")
-                    finally:
-                        self.hex_canvas.set_mode("none")
-                        self.game.state.setup_pointer += 1
-                        self.refresh_board()
-                        return
-                idx += 1
+        # Canvas corners map to canonical vertex ids shared by adjacent tiles
+        try:
+            self.game.setup_place_settlement(topology.vertex_id(*vid))
+            self.game.advance_setup_pointer()
+        except Exception as exc:  # noqa: BLE001
+            self.error.set_text(f"Error: {exc}")
+        finally:
+            self.hex_canvas.set_mode("none")
+            self.refresh_board()
 
     def _place_road_edge(self, eid: EdgeId) -> None:
         try:
-            self.game.setup_place_road()
+            self.game.setup_place_road(topology.edge_id(*eid))
         except Exception as exc:  # noqa: BLE001
             self.error.set_text(f"Error: {exc}")
-        finally:
             self.hex_canvas.set_mode("none")
-            self.game.state.setup_pointer += 1
-            finished = False
-            if self.game.state.setup_pointer % 2 == 0:
-                finished = self.game.setup_next()
-            if finished:
-                self.status.set_text("Setup complete. Begin turns.")
             self.refresh_board()
+            return
+        self.hex_canvas.set_mode("none")
+        self.game.advance_setup_pointer()
+        if self.game.setup_next():
+            self.status.set_text("Setup complete. Begin turns.")
+        self.refresh_board()
+        self.schedule_ai_turns()
 
     def _start_host(self) -> None:
-        asyncio.ensure_future(self.network.host_server())
+        self._net_task = asyncio.ensure_future(self.network.host_server(self.game.to_dict(), on_change=self._adopt_state))
 
     def _start_join(self) -> None:
         async def sync():
-            async for ws in self.network.connect():
-                await self.network.send_state(ws, self.game.to_dict())
-        asyncio.ensure_future(sync())
+            try:
+                async for ws in self.network.connect():
+                    self._ws = ws
+                    while True:
+                        state = await self.network.recv_state(ws)
+                        if self.network.refused is not None:
+                            self.error.set_text(f"Host refused your move: {self.network.refused}")
+                        self._adopt_state(state)
+            except (OSError, websockets.ConnectionClosed):
+                self._ws = None
+                self.error.set_text("Disconnected from host")
+                self.loop.draw_screen()
+        self._net_task = asyncio.ensure_future(sync())
+
+    def _sync_out(self) -> None:
+        """Share local changes: the host publishes them, a joined client proposes them."""
+        if self.is_host:
+            self.network.publish(self.game.to_dict())
+        elif self.is_join and self._ws is not None and self.network.sync.state is not None:
+            asyncio.ensure_future(self.network.send_state(self._ws, self.game.to_dict()))
+
+    def _adopt_state(self, state: dict) -> None:
+        """Take on the synced state from the other side of the connection."""
+        # A move being searched for was meant for the state being replaced
+        interrupted = self.ai_busy
+        self._stop_ai()
+        self.game.state = GameState.from_dict(state)
+        # The state arrived whole rather than as recorded actions
+        self.save_service.journal.checkpoint()
+        self.refresh_board()
+        self.loop.draw_screen()
+        if interrupted:
+            self.schedule_ai_turns()
+
+    def _stop_ai(self) -> None:
+        """Cancel the AI turn in progress and drop the AI players (and their search trees)."""
+        if self.ai_busy:
+            self._ai_task.cancel()  # type: ignore[union-attr]
+        self._ai_task = None
+        for ai in self._ais.values():
+            ai.stop()
+        self._ais = {}
+
+    def close(self) -> None:
+        """Stop background work when leaving the screen: AI search, networking and the AI thread."""
+        self._stop_ai()
+        if self._net_task is not None:
+            self._net_task.cancel()
+            self._net_task = None
+        self._ai_executor.shutdown(wait=False, cancel_futures=True)
 
@@ -1,24 +1,76 @@
 import urwid
-from typing import Callable, List
+from typing import Callable, Dict, List, Optional, Tuple
 
 from term_catan.ui.theme import apply_win95
-from term_catan.services.persistence import SaveService
+from term_catan.services.persistence import SaveEntry, SaveService
+
+
+# Manifest rows fetched per query while scrolling
+PAGE_SIZE = 40
+
+
+class SaveListWalker(urwid.ListWalker):
+    """Saves newest first, read from the manifest a page at a time as rows scroll into view."""
+
+    def __init__(self, service: SaveService, on_load: Callable[[str], None]) -> None:
+        self.service = service
+        self.on_load = on_load
+        # The autosave, when there is one, heads the list
+        self.head: List[Tuple[str, str]] = []
+        if service.autosave_path.exists():
+            self.head.append(("Autosave (latest turn)", str(service.autosave_path)))
+        self.size = len(self.head) + service.manifest.count()
+        self.focus = 0
+        self._pages: Dict[int, List[SaveEntry]] = {}
+        self._widgets: Dict[int, urwid.Widget] = {}
+
+    def _row(self, position: int) -> Tuple[str, str]:
+        if position < len(self.head):
+            return self.head[position]
+        index = position - len(self.head)
+        page = index // PAGE_SIZE
+        entries = self._pages.get(page)
+        if entries is None:
+            entries = self._pages[page] = self.service.manifest.page(page * PAGE_SIZE, PAGE_SIZE)
+        entry = entries[index % PAGE_SIZE]
+        return entry.summary(), str(entry.path)
+
+    def _widget(self, position: int) -> Optional[urwid.Widget]:
+        if not 0 <= position < self.size:
+            return None
+        widget = self._widgets.get(position)
+        if widget is None:
+            label, path = self._row(position)
+            btn = urwid.Button(label, on_press=lambda _b, p=path: self.on_load(p))
+            widget = self._widgets[position] = urwid.AttrMap(btn, "menu", focus_map="focus")
+        return widget
+
+    def get_focus(self) -> Tuple[Optional[urwid.Widget], Optional[int]]:
+        if not self.size:
+            return None, None
+        return self._widget(self.focus), self.focus
+
+    def set_focus(self, position: int) -> None:
+        self.focus = position
+        self._modified()
+
+    def get_next(self, position: int) -> Tuple[Optional[urwid.Widget], Optional[int]]:
+        widget = self._widget(position + 1)
+        return (widget, position + 1) if widget is not None else (None, None)
+
+    def get_prev(self, position: int) -> Tuple[Optional[urwid.Widget], Optional[int]]:
+        widget = self._widget(position - 1)
+        return (widget, position - 1) if widget is not None else (None, None)
 
 
 def create_load_screen(on_back: Callable[[], None], on_load: Callable[[str], None]) -> urwid.Widget:
     service = SaveService()
-    files = sorted(service.base_dir.glob("save_*.json"))
-    if not files:
+    walker = SaveListWalker(service, on_load)
+    if not walker.size:
         body = urwid.Text("No saves found.")
         pile = urwid.Pile([urwid.AttrMap(body, "menu"), urwid.Divider(), urwid.AttrMap(urwid.Button("Back", lambda _b: on_back()), "menu", focus_map="focus")])
         return apply_win95(urwid.Padding(pile, left=2, right=2), title="Load Game")
 
-    def item_button(path: str) -> urwid.Widget:
-        btn = urwid.Button(path, on_press=lambda _b: on_load(path))
-        return urwid.AttrMap(btn, "menu", focus_map="focus")
-
-    items: List[urwid.Widget] = [item_button(str(p)) for p in files]
-    list_box = urwid.ListBox(urwid.SimpleFocusListWalker(items))
+    list_box = urwid.ListBox(walker)
     padding = urwid.Padding(list_box, left=2, right=2)
     return apply_win95(padding, title="Load Game")
-
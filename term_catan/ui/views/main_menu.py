@@ -16,6 +16,7 @@ def create_main_menu(
     on_host: Callable[[], None],
     on_join: Callable[[], None],
     on_load: Callable[[], None],
+    on_replay: Callable[[], None],
     on_quit: Callable[[], None],
 ) -> urwid.Widget:
     items = [
@@ -25,6 +26,7 @@ def create_main_menu(
         menu_button("Host Multiplayer", on_host),
         menu_button("Join Multiplayer", on_join),
         menu_button("Load Game", on_load),
+        menu_button("Replay Autosave", on_replay),
         menu_button("Quit", on_quit),
     ]
     list_box = urwid.ListBox(urwid.SimpleFocusListWalker(items))
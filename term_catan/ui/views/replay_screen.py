@@ -0,0 +1,132 @@
+import asyncio
+import urwid
+from typing import Callable, Optional
+
+from term_catan.core.game import Game
+from term_catan.core.replay import Replay
+from term_catan.services.persistence import SaveService
+from term_catan.ui.theme import apply_win95
+from term_catan.ui.widgets.half_block_canvas import HalfBlockCanvas
+
+
+# Seconds between turns while playing
+REPLAY_FRAME_SECONDS = 0.4
+# Turns skipped by page up/down
+REPLAY_JUMP = 10
+
+REPLAY_HELP = "left/right:turn pgup/pgdn:10 turns home/end space:play esc:back"
+
+
+class _ReplayKeys(urwid.WidgetWrap):
+    """Routes keys to the replay before the board sees them."""
+
+    def __init__(self, widget: urwid.Widget, on_key: Callable[[str], bool]) -> None:
+        super().__init__(widget)
+        self.on_key = on_key
+
+    def keypress(self, size, key):  # type: ignore[no-untyped-def]
+        if isinstance(key, str) and self.on_key(key):
+            return None
+        return super().keypress(size, key)
+
+
+class ReplayScreen:
+    """Steps the board through a recorded game one turn at a time."""
+
+    def __init__(self, loop: urwid.MainLoop, replay: Replay, on_back: Callable[[], None]) -> None:
+        self.loop = loop
+        self.replay = replay
+        self.on_back = on_back
+        self.turn = 0
+        self.game: Game = replay.state_at(0)
+        self._play_task: Optional[asyncio.Future] = None
+
+        self.hex_canvas = HalfBlockCanvas(
+            self.game.state.board,
+            self.game.state.robber_index,
+            on_place_settlement=lambda _v: None,
+            on_place_road=lambda _e: None,
+        )
+        self.status = urwid.Text("", align="left")
+        self.error = urwid.Text("", align="left")
+        frame = urwid.Frame(
+            body=urwid.AttrMap(self.hex_canvas, "board"),
+            header=urwid.AttrMap(self.error, "error"),
+            footer=urwid.AttrMap(self.status, "status"),
+        )
+        box = urwid.AttrMap(urwid.LineBox(frame, title="Replay"), "menu")
+        self.widget: urwid.Widget = _ReplayKeys(box, self._on_key)
+        self.refresh()
+
+    def refresh(self) -> None:
+        state = self.game.state
+        self.hex_canvas.refresh(
+            state.board,
+            state.robber_index,
+            current_player_id=state.current_player,
+            settlements=state.settlements,
+            cities=state.cities,
+            roads=state.roads,
+        )
+        self.status.set_text(f"Turn {self.turn}/{self.replay.num_turns - 1} | {self.game.render_status()}\n{REPLAY_HELP}")
+
+    def seek(self, turn: int) -> None:
+        turn = max(0, min(turn, self.replay.num_turns - 1))
+        try:
+            if self.turn <= turn < self.turn + self.replay.snapshot_every:
+                # Close ahead: stepping the shown game beats cloning a snapshot
+                self.replay.advance(self.game, self.turn, turn)
+            else:
+                self.game = self.replay.state_at(turn)
+        except ValueError as exc:
+            self.error.set_text(f"Error: {exc}")
+            self.game = self.replay.state_at(self.turn)
+            self.stop()
+            return
+        self.turn = turn
+        self.refresh()
+
+    def _on_key(self, key: str) -> bool:
+        steps = {"right": 1, "left": -1, "page down": REPLAY_JUMP, "page up": -REPLAY_JUMP}
+        if key in steps:
+            self.seek(self.turn + steps[key])
+        elif key == "home":
+            self.seek(0)
+        elif key == "end":
+            self.seek(self.replay.num_turns - 1)
+        elif key == " ":
+            if self.playing:
+                self.stop()
+            else:
+                self._play_task = asyncio.ensure_future(self._play())
+        elif key == "esc":
+            self.stop()
+            self.on_back()
+        else:
+            return False
+        return True
+
+    @property
+    def playing(self) -> bool:
+        return self._play_task is not None and not self._play_task.done()
+
+    def stop(self) -> None:
+        if self.playing:
+            self._play_task.cancel()  # type: ignore[union-attr]
+        self._play_task = None
+
+    async def _play(self) -> None:
+        while self.turn < self.replay.num_turns - 1:
+            await asyncio.sleep(REPLAY_FRAME_SECONDS)
+            self.seek(self.turn + 1)
+            self.loop.draw_screen()
+
+
+def create_replay_screen(loop: urwid.MainLoop, on_back: Callable[[], None]) -> urwid.Widget:
+    """Replay of the autosave: its last checkpoint and the journal written since."""
+    record = SaveService().journal.read_record()
+    if record is None:
+        body = urwid.Text("No autosave to replay.")
+        pile = urwid.Pile([urwid.AttrMap(body, "menu"), urwid.Divider(), urwid.AttrMap(urwid.Button("Back", lambda _b: on_back()), "menu", focus_map="focus")])
+        return apply_win95(urwid.Padding(pile, left=2, right=2), title="Replay")
+    return ReplayScreen(loop, Replay(record), on_back).widget
@@ -3,22 +3,304 @@ from __future__ import annotations
 import math
 import random
 import urwid
-from typing import Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urwid.util import apply_target_encoding, rle_append_modify
 
+from term_catan.core import topology
 from term_catan.core.models import Board
 
+try:
+    from term_catan.ui.widgets import half_block_numpy
+except ImportError:  # NumPy is optional; the pure-Python rasterizer is the fallback
+    half_block_numpy = None  # type: ignore[assignment]
+
 
 VertexId = Tuple[int, int, int]  # (row, col, corner 0..5)
 EdgeId = Tuple[int, int, int]  # (row, col, edge 0..5)
 
+# Pixel priority values per resource fill (higher values win when compositing)
+RESOURCE_VALUES: Dict[str, int] = {
+    "wood": 11,
+    "brick": 12,
+    "sheep": 13,
+    "wheat": 14,
+    "ore": 15,
+    "desert": 16,
+}
+RESOURCE_ATTRS: Dict[int, str] = {
+    11: "res_wood",
+    12: "res_brick",
+    13: "res_sheep",
+    14: "res_wheat",
+    15: "res_ore",
+    16: "res_desert",
+}
+
+
+@dataclass
+class _StaticLayers:
+    """Board layers that only depend on the tile layout and pixel size."""
+
+    key: Tuple
+    width: int
+    height: int
+    hex_radius: int
+    hex_centers: Dict[Tuple[int, int], Tuple[float, float]]
+    pixels: Any  # terrain fills + hex outlines (nested lists, or an ndarray for the numpy backend)
+    char_overlays: Dict[int, List[Tuple[int, str, str]]]  # textures and sheep marks
+    vertex_points: Dict[VertexId, Tuple[float, float]]
+    edge_points: Dict[EdgeId, Tuple[float, float]]
+    vertex_cells: Dict[Tuple[int, int], VertexId]
+    edge_cells: Dict[Tuple[int, int], EdgeId]
+    # numpy backend: texture glyphs and attr indices per char cell (replaces char_overlays)
+    tex_chars: Any = None
+    tex_attrs: Any = None
+
+
+def _hex_points(cx: float, cy: float, r: float) -> List[Tuple[float, float]]:
+    pts = []
+    for k in range(6):
+        ang = math.radians(60 * k - 30)
+        pts.append((cx + r * math.cos(ang), cy + r * math.sin(ang)))
+    return pts
+
+
+def _pset(pixels: List[List[int]], w: int, h: int, x: float, y: float, val: int = 1) -> None:
+    ix = int(round(x))
+    iy = int(round(y))
+    if 0 <= ix < w and 0 <= iy < h:
+        pixels[iy][ix] = max(pixels[iy][ix], val)
+
+
+def _draw_polyline(pixels: List[List[int]], w: int, h: int, points: List[Tuple[float, float]], val: int = 1, thickness: int = 0) -> None:
+    for i in range(len(points)):
+        x0, y0 = points[i]
+        x1, y1 = points[(i + 1) % len(points)]
+        steps = int(max(abs(x1 - x0), abs(y1 - y0))) + 1
+        for s in range(steps + 1):
+            t = s / max(1, steps)
+            px = x0 + (x1 - x0) * t
+            py = y0 + (y1 - y0) * t
+            for dx in range(-thickness, thickness + 1):
+                for dy in range(-thickness, thickness + 1):
+                    _pset(pixels, w, h, px + dx, py + dy, val)
+
+
+def _fill_polygon(pixels: List[List[int]], w: int, h: int, points: List[Tuple[float, float]], val: int) -> None:
+    if not points:
+        return
+    min_y = int(min(p[1] for p in points))
+    max_y = int(max(p[1] for p in points))
+    for yy in range(max(min_y, 0), min(max_y + 1, h)):
+        # Find intersections of scanline with edges
+        xs: List[float] = []
+        for i in range(len(points)):
+            x0, y0 = points[i]
+            x1, y1 = points[(i + 1) % len(points)]
+            if (y0 <= yy < y1) or (y1 <= yy < y0):
+                if y1 == y0:
+                    continue
+                t = (yy - y0) / (y1 - y0)
+                xs.append(x0 + t * (x1 - x0))
+        xs.sort()
+        for j in range(0, len(xs), 2):
+            if j + 1 >= len(xs):
+                break
+            x_start = int(round(xs[j]))
+            x_end = int(round(xs[j + 1]))
+            for xx in range(max(x_start, 0), min(x_end + 1, w)):
+                _pset(pixels, w, h, xx, yy, val)
+
+
+def _point_in_polygon(px: float, py: float, points: List[Tuple[float, float]]) -> bool:
+    inside = False
+    n = len(points)
+    for i in range(n):
+        x0, y0 = points[i]
+        x1, y1 = points[(i + 1) % n]
+        if ((y0 > py) != (y1 > py)):
+            xinters = (py - y0) * (x1 - x0) / (y1 - y0 + 1e-9) + x0
+            if px < xinters:
+                inside = not inside
+    return inside
+
+
+def _texture_char(rx: str, x: int, yc: int) -> str:
+    k = (x + yc) % 4
+    if rx == "wood":
+        return "^" if k % 2 == 0 else "Y"
+    if rx == "brick":
+        return "#" if k in (0, 1) else ":"
+    if rx == "sheep":
+        return "." if k != 0 else "o"
+    if rx == "wheat":
+        return "Y" if k % 2 == 0 else "/"
+    if rx == "ore":
+        return "*" if k % 2 == 0 else "+"
+    if rx == "desert":
+        return " " if k != 0 else "."
+    return "."
+
+
+# Sizes kept warm so resizing back and forth never rebuilds geometry or rasters
+GEOMETRY_CACHE_SIZE = 8
+STATIC_CACHE_SIZE = 4
+# Smallest pixel grid the board is laid out on; smaller boxes are cropped
+MIN_PIXEL_SIZE = 12
+# Max squared pixel distance from a click to the vertex/edge it selects
+HIT_RADIUS_SQ = 100
+
+
+@dataclass
+class _Geometry:
+    """Hex layout fitted to one pixel size; shared read-only between canvases."""
+
+    width: int
+    height: int
+    hex_radius: int
+    hex_centers: Dict[Tuple[int, int], Tuple[float, float]]
+    vertex_points: Dict[VertexId, Tuple[float, float]]
+    edge_points: Dict[EdgeId, Tuple[float, float]]
+    # Char cell (col, row) -> nearest vertex/edge within HIT_RADIUS_SQ, for O(1) mouse hit-tests
+    vertex_cells: Dict[Tuple[int, int], VertexId]
+    edge_cells: Dict[Tuple[int, int], EdgeId]
+
+
+def _layout_extent(hex_radius: int, rows_layout: Tuple[int, ...]) -> Tuple[int, int, int, int]:
+    # (x_spacing, y_spacing, board width, board height) in pixels for a radius
+    x_spacing = int(round(math.sqrt(3) * hex_radius))  # center-to-center horizontally
+    y_spacing = int(round(1.5 * hex_radius))  # center-to-center vertically
+    width = (max(rows_layout) - 1) * x_spacing + 2 * hex_radius
+    height = (len(rows_layout) - 1) * y_spacing + 2 * hex_radius
+    return x_spacing, y_spacing, width, height
+
+
+@lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+def _board_geometry(w: int, h: int, rows_layout: Tuple[int, ...]) -> _Geometry:
+    # Largest hex radius whose board (plus a 1px margin for building glyphs) fits the grid
+    hex_radius = max(2, min(w, h) // 8 + 1)
+    while hex_radius > 2:
+        _xs, _ys, bw, bh = _layout_extent(hex_radius, rows_layout)
+        if bw <= w and bh + 2 <= h:
+            break
+        hex_radius -= 1
+    x_spacing, y_spacing, bw, bh = _layout_extent(hex_radius, rows_layout)
+    x_offset = (w - bw) // 2
+    y_offset = (h - bh) // 2
+
+    # Hex centers plus vertex and edge midpoints per (row, col)
+    hex_centers: Dict[Tuple[int, int], Tuple[float, float]] = {}
+    vertex_points: Dict[VertexId, Tuple[float, float]] = {}
+    edge_points: Dict[EdgeId, Tuple[float, float]] = {}
+    for row, count in enumerate(rows_layout):
+        for col in range(count):
+            row_offset = abs(2 - row) * (x_spacing // 2)
+            cx = x_offset + col * x_spacing + row_offset + hex_radius
+            cy = y_offset + row * y_spacing + hex_radius
+            hp = _hex_points(cx, cy, hex_radius)
+            hex_centers[(row, col)] = (cx, cy)
+            for vi, (vx, vy) in enumerate(hp):
+                vertex_points[(row, col, vi)] = (vx, vy)
+            for ei in range(6):
+                x0, y0 = hp[ei]
+                x1, y1 = hp[(ei + 1) % 6]
+                edge_points[(row, col, ei)] = ((x0 + x1) / 2, (y0 + y1) / 2)
+
+    return _Geometry(
+        width=w,
+        height=h,
+        hex_radius=hex_radius,
+        hex_centers=hex_centers,
+        vertex_points=vertex_points,
+        edge_points=edge_points,
+        vertex_cells=_hit_cells(vertex_points),
+        edge_cells=_hit_cells(edge_points),
+    )
+
+
+def _hit_cells(points: Dict[Tuple[int, int, int], Tuple[float, float]]) -> Dict[Tuple[int, int], Tuple[int, int, int]]:
+    """Map every char cell to its nearest point within the hit radius.
+
+    Each point only stamps the cells inside its hit disc, so the build is
+    O(points * disc) instead of O(cells * points). A cell at (col, row) is
+    tested at pixel (col, row * 2); ties keep the earlier point, matching a
+    linear nearest scan.
+    """
+    reach = math.sqrt(HIT_RADIUS_SQ)
+    best: Dict[Tuple[int, int], Tuple[float, Tuple[int, int, int]]] = {}
+    for pid, (px, py) in points.items():
+        for col in range(math.ceil(px - reach), math.floor(px + reach) + 1):
+            for row in range(math.ceil((py - reach) / 2), math.floor((py + reach) / 2) + 1):
+                d = (px - col) * (px - col) + (py - row * 2) * (py - row * 2)
+                if d > HIT_RADIUS_SQ:
+                    continue
+                cur = best.get((col, row))
+                if cur is None or d < cur[0]:
+                    best[(col, row)] = (d, pid)
+    return {cell: pid for cell, (_d, pid) in best.items()}
+
+
+def _scatter_sheep(
+    tidx: int, min_x: int, max_x: int, min_yc: int, max_yc: int, inside: Callable[[float, float], bool]
+) -> List[Tuple[int, int]]:
+    """Deterministic sheep mark positions (x, yc) for one tile; shared by both rasterizers."""
+    # Determine number of sheep marks based on area in char cells
+    area_chars = max(1, (max_x - min_x + 1) * (max_yc - min_yc + 1))
+    count = max(8, min(24, area_chars // 20))
+    rng = random.Random(tidx)
+    attempts = 0
+    placed: List[Tuple[int, int]] = []
+    while len(placed) < count and attempts < count * 10:
+        attempts += 1
+        yc = rng.randint(min_yc, max_yc)
+        x = rng.randint(min_x, max_x)
+        # Jitter bias inward: skip near outside by checking center inside polygon
+        if not inside(x + 0.5, yc * 2 + 1):
+            continue
+        # Simple spacing: avoid placing next to an existing mark
+        too_close = False
+        for (px, py) in placed:
+            if max(abs(px - x), abs(py - yc)) <= 1:
+                too_close = True
+                break
+        if too_close:
+            continue
+        placed.append((x, yc))
+    return placed
+
+
+def _encode_row(markup: List[Tuple[str, str]]) -> Tuple[bytes, List[Tuple[str, int]], List[Tuple[Optional[str], int]]]:
+    """Encode one row of (attr, text) runs into TextCanvas bytes, attr RLE and charset RLE."""
+    chunks: List[bytes] = []
+    attr_rle: List[Tuple[str, int]] = []
+    cs_rle: List[Tuple[Optional[str], int]] = []
+    for attr, text in markup:
+        data, cs = apply_target_encoding(text)
+        chunks.append(data)
+        rle_append_modify(attr_rle, (attr, len(data)))
+        for run in cs:
+            rle_append_modify(cs_rle, run)
+    return b"".join(chunks), attr_rle, cs_rle
+
+
+class HalfBlockCanvas(urwid.Widget):
+    """Box widget that renders the board straight into a cached urwid TextCanvas."""
+
+    _sizing = frozenset([urwid.Sizing.BOX])
+    _selectable = True
+    ignore_focus = True
 
-class HalfBlockCanvas(urwid.WidgetWrap):
     def __init__(
         self,
         board: Board,
         robber_index: int,
         on_place_settlement: Callable[[VertexId], None],
         on_place_road: Callable[[EdgeId], None],
+        *,
+        backend: Optional[str] = None,
     ) -> None:
         self.board = board
         self.robber_index = robber_index
@@ -27,320 +309,223 @@ class HalfBlockCanvas(urwid.WidgetWrap):
         self.mode: str = "none"  # none|settlement|road
 
         # Layout for 3-4-5-4-3 rows
-        self.rows_layout: List[int] = [3, 4, 5, 4, 3]
+        self.rows_layout: List[int] = list(topology.ROWS_LAYOUT)
         self.tile_positions: Dict[int, Tuple[int, int]] = {}
         self.vertex_points: Dict[VertexId, Tuple[float, float]] = {}
         self.edge_points: Dict[EdgeId, Tuple[float, float]] = {}
         self.hover_vertex: Optional[VertexId] = None
         self.hover_edge: Optional[EdgeId] = None
+        # Suggested settlement corners, marked while placing a settlement
+        self.hint_vertices: List[VertexId] = []
 
         # Persisted placements per player for visuals
         self.player_settlements: Dict[int, List[VertexId]] = {}
         self.player_roads: Dict[int, List[EdgeId]] = {}
         self.player_cities: Dict[int, List[VertexId]] = {}
-        # Global occupied vertex points -> player_id to prevent overlaps across adjacent tiles
-        self.occupied_vertices: Dict[Tuple[int, int], int] = {}
-        # Map of each VertexId to its canonical clustered char-grid key
-        self.vertex_char_key_map: Dict[VertexId, Tuple[int, int]] = {}
-        # Global occupied edge midpoints -> player_id to prevent overlaps across adjacent tiles
-        self.occupied_edges: Dict[Tuple[int, int], int] = {}
-        # Map of each EdgeId to its canonical clustered char-grid midpoint key
-        self.edge_char_key_map: Dict[EdgeId, Tuple[int, int]] = {}
+        # Occupied canonical vertex/edge ids (core.topology) -> player_id; shared corners/sides
+        # of adjacent tiles resolve to the same id regardless of layout size
+        self.occupied_vertices: Dict[int, int] = {}
+        self.occupied_edges: Dict[int, int] = {}
+        # Char cell -> nearest vertex/edge lookup grids for mouse hit-testing
+        self.vertex_cells: Dict[Tuple[int, int], VertexId] = {}
+        self.edge_cells: Dict[Tuple[int, int], EdgeId] = {}
         # Current player id for color selection
         self.current_player_id: int = 0
 
-        # Pixel grid (half-block): each char covers 1x2 pixels
-        self.pixel_width = 160  # adjust for terminal size
+        # Pixel grid (half-block): each char covers 1x2 pixels; follows the size passed to render()
+        self.pixel_width = 160
         self.pixel_height = 64
+        # Rasterizer: "numpy" when available, otherwise the pure-Python fallback
+        if backend is None:
+            backend = "numpy" if half_block_numpy is not None else "python"
+        if backend == "numpy" and half_block_numpy is None:
+            raise ValueError("numpy backend requested but NumPy is not installed")
+        self.backend = backend
+        # Terrain/texture/outline layers per (board layout, size), least recently used first
+        self._static_cache: "OrderedDict[Tuple, _StaticLayers]" = OrderedDict()
+
+        # Encoded rows are kept across frames; only rows whose markup changed are re-encoded
+        self._row_markup: List[List[Tuple[str, str]]] = []
+        self._row_text: List[bytes] = []
+        self._row_attr: List[List[Tuple[str, int]]] = []
+        self._row_cs: List[List[Tuple[Optional[str], int]]] = []
+        self.dirty_rows: List[int] = []
+        # Bumped whenever any row changes; keys the cached TextCanvas
+        self._version = 0
+        self._canvas_cache: Optional[Tuple[int, urwid.TextCanvas]] = None
 
         self._build_positions()
-        super().__init__(self._render())
+        super().__init__()
+        self._redraw()
 
     def set_mode(self, mode: str) -> None:
         self.mode = mode
-        self._w = self._render()
+        self._redraw()
 
-    def refresh(self, board: Board, robber_index: int, *, current_player_id: int | None = None) -> None:
+    def set_hints(self, vertex_ids: List[int]) -> None:
+        """Mark canonical vertex ids as suggested settlement spots (shown in settlement mode)."""
+        self.hint_vertices = [topology.VERTEX_CORNER[vid] for vid in vertex_ids]
+        self._redraw()
+
+    def refresh(
+        self,
+        board: Board,
+        robber_index: int,
+        *,
+        current_player_id: int | None = None,
+        settlements: Optional[List[Tuple[int, int]]] = None,
+        cities: Optional[List[Tuple[int, int]]] = None,
+        roads: Optional[List[Tuple[int, int]]] = None,
+    ) -> None:
         self.board = board
         self.robber_index = robber_index
         if current_player_id is not None:
             self.current_player_id = current_player_id
-        self._w = self._render()
-
-    def _edge_midpoint_key(self, edge: EdgeId) -> Tuple[int, int]:
-        # Use rounded pixel midpoint of the edge as a canonical key shared by adjacent tiles
-        (r, c, ei) = edge
-        # Ensure render maps are available; fall back to geometric recompute if missing
-        pt = self.edge_points.get(edge)
-        if pt is None:
-            # Build geometry approximately as in _render to compute midpoint
-            w = self.pixel_width
-            base_h = self.pixel_height
-            hex_radius = min(w // 12, base_h // 6)
-            x_spacing = int(round(math.sqrt(3) * hex_radius))
-            y_spacing = int(round(1.5 * hex_radius))
-            x_offset = (w - (max(self.rows_layout) - 1) * x_spacing - hex_radius * 2) // 2
-            y_offset = hex_radius // 2
-            row_offset = abs(2 - r) * (x_spacing // 2)
-            cx = x_offset + c * x_spacing + row_offset + hex_radius
-            cy = y_offset + r * y_spacing + hex_radius
-            def hex_points(cx: float, cy: float, rr: float) -> List[Tuple[float, float]]:
-                pts = []
-                for k in range(6):
-                    ang = math.radians(60 * k - 30)
-                    pts.append((cx + rr * math.cos(ang), cy + rr * math.sin(ang)))
-                return pts
-            hp = hex_points(cx, cy, hex_radius)
-            x0, y0 = hp[ei]
-            x1, y1 = hp[(ei + 1) % 6]
-            mx = int(round((x0 + x1) / 2))
-            my = int(round((y0 + y1) / 2))
-            return (mx, my)
-        ex, ey = pt
-        return (int(round(ex)), int(round(ey)))
-
-    def _edge_midpoint_char_key(self, edge: EdgeId) -> Tuple[int, int]:
-        # Prefer clustered char-grid key from the render-pass map for robustness
-        key = self.edge_char_key_map.get(edge)
-        if key is not None:
-            return key
-        # Fallback to rounding current midpoint if map missing
-        pt = self.edge_points.get(edge)
-        if pt is None:
-            return (0, 0)
-        ex, ey = pt
-        return (int(round(ex)), int(round(ey / 2)))
-
-    def _vertex_point_key(self, vertex: VertexId) -> Tuple[int, int]:
-        # Prefer clustered char-grid key from the render-pass map for robustness
-        key = self.vertex_char_key_map.get(vertex)
-        if key is not None:
-            return key
-        # Fallback to local rounding if map missing
-        pt = self.vertex_points.get(vertex)
-        if pt is None:
-            return (0, 0)
-        vx, vy = pt
-        return (int(round(vx)), int(round(vy / 2)))
+        if settlements is not None or cities is not None or roads is not None:
+            self.set_pieces(settlements or [], cities or [], roads or [])
+        self._redraw()
+
+    def set_pieces(
+        self,
+        settlements: List[Tuple[int, int]],
+        cities: List[Tuple[int, int]],
+        roads: List[Tuple[int, int]],
+    ) -> None:
+        """Replace placed pieces from (player_id, vertex_id/edge_id) lists as kept on GameState."""
+        self.player_settlements = {}
+        self.player_cities = {}
+        self.player_roads = {}
+        self.occupied_vertices = {}
+        self.occupied_edges = {}
+        for pid, vid in settlements:
+            self.player_settlements.setdefault(pid, []).append(topology.VERTEX_CORNER[vid])
+            self.occupied_vertices[vid] = pid
+        for pid, vid in cities:
+            self.player_cities.setdefault(pid, []).append(topology.VERTEX_CORNER[vid])
+            self.occupied_vertices[vid] = pid
+        for pid, eid in roads:
+            self.player_roads.setdefault(pid, []).append(topology.EDGE_SIDE[eid])
+            self.occupied_edges[eid] = pid
 
     def _build_positions(self) -> None:
         # Map index -> (row, col) for 3-4-5-4-3
-        idx = 0
-        positions: Dict[int, Tuple[int, int]] = {}
-        for r, count in enumerate(self.rows_layout):
-            for c in range(count):
-                positions[idx] = (r, c)
-                idx += 1
-        self.tile_positions = positions
-
-    def _render(self) -> urwid.Widget:
-        # Initialize geometry and overlays; compute required height based on hex tiling
-        w = self.pixel_width
-        base_h = self.pixel_height
-        # Char overlays: map per character row yc -> list of (x_start, text, attr)
-        char_overlays: Dict[int, List[Tuple[int, str, str]]] = {}
-        # Road color overrides per char cell (x_char, y_char) -> attr name
-        road_char_attrs: Dict[Tuple[int, int], str] = {}
+        self.tile_positions = dict(enumerate(topology.TILE_POSITIONS))
+
+    def _static_key(self) -> Tuple:
+        # Tiles and numbers never change after Board.standard_board(); a loaded game swaps them
+        tiles = tuple((t.resource, t.number) for t in self.board.tiles)
+        return (tiles, self.pixel_width, self.pixel_height)
+
+    def _static_layers(self) -> "_StaticLayers":
+        key = self._static_key()
+        layers = self._static_cache.get(key)
+        if layers is not None:
+            self._static_cache.move_to_end(key)
+        else:
+            layers = self._build_static_layers(key)
+            self._static_cache[key] = layers
+            if len(self._static_cache) > STATIC_CACHE_SIZE:
+                self._static_cache.popitem(last=False)
+        if self.vertex_points is not layers.vertex_points:
+            # Geometry maps are shared with hit-testing and occupancy keys
+            self.vertex_points = layers.vertex_points
+            self.edge_points = layers.edge_points
+            self.vertex_cells = layers.vertex_cells
+            self.edge_cells = layers.edge_cells
+        return layers
+
+    def _build_static_layers(self, key: Tuple) -> "_StaticLayers":
+        # Terrain fills, textures and outlines on top of the (size-cached) geometry
+        geometry = _board_geometry(self.pixel_width, self.pixel_height, tuple(self.rows_layout))
+        w = geometry.width
+        h = geometry.height
+        hex_radius = geometry.hex_radius
+        hex_centers = geometry.hex_centers
+        layers = _StaticLayers(
+            key=key,
+            width=w,
+            height=h,
+            hex_radius=hex_radius,
+            hex_centers=hex_centers,
+            pixels=[],
+            char_overlays={},
+            vertex_points=geometry.vertex_points,
+            edge_points=geometry.edge_points,
+            vertex_cells=geometry.vertex_cells,
+            edge_cells=geometry.edge_cells,
+        )
+        hexes = [
+            (tidx, self.board.tiles[tidx].resource, _hex_points(*hex_centers[pos], hex_radius))
+            for tidx, pos in self.tile_positions.items()
+        ]
+        if self.backend == "numpy":
+            layers.pixels, layers.tex_chars, layers.tex_attrs = half_block_numpy.rasterize_static(w, h, hexes)
+        else:
+            layers.pixels, layers.char_overlays = self._rasterize_static(w, h, hexes)
+        return layers
 
-        def pset(x: float, y: float, val: int = 1) -> None:
-            ix = int(round(x))
-            iy = int(round(y))
-            if 0 <= ix < w and 0 <= iy < h:
-                pixels[iy][ix] = max(pixels[iy][ix], val)
-
-        # Compute hex geometry (flat-top) with tight tiling (no gaps)
-        # First pass radius based on base height
-        hex_radius = min(w // 12, base_h // 6)
-        x_spacing = int(round(math.sqrt(3) * hex_radius))  # center-to-center horizontally
-        y_spacing = int(round(1.5 * hex_radius))  # center-to-center vertically
-        x_offset = (w - (max(self.rows_layout) - 1) * x_spacing - hex_radius * 2) // 2
-        y_offset = hex_radius // 2
-
-        # Compute required canvas height to fit all rows
-        rows_count = len(self.rows_layout)
-        required_h = y_offset + (rows_count - 1) * y_spacing + 2 * hex_radius + (hex_radius // 2)
-        h = max(base_h, required_h)
-
-        # Second pass: recompute radius if new height allows larger tiles
-        hex_radius2 = min(w // 12, h // 6)
-        if hex_radius2 != hex_radius:
-            hex_radius = hex_radius2
-            x_spacing = int(round(math.sqrt(3) * hex_radius))
-            y_spacing = int(round(1.5 * hex_radius))
-            x_offset = (w - (max(self.rows_layout) - 1) * x_spacing - hex_radius * 2) // 2
-            y_offset = hex_radius // 2
-            required_h = y_offset + (rows_count - 1) * y_spacing + 2 * hex_radius + (hex_radius // 2)
-            h = max(base_h, required_h)
-
-        # Allocate pixel grid using final height
+    @staticmethod
+    def _rasterize_static(
+        w: int, h: int, hexes: List[Tuple[int, str, List[Tuple[float, float]]]]
+    ) -> Tuple[List[List[int]], Dict[int, List[Tuple[int, str, str]]]]:
+        # Pure-Python rasterizer: pixel grid of fills + outlines and per-row texture overlays
         pixels = [[0 for _ in range(w)] for _ in range(h)]
-
-        # Clear maps
-        self.vertex_points.clear()
-        self.edge_points.clear()
-        self.vertex_char_key_map.clear()
-        self.edge_char_key_map.clear()
-
-        def draw_polyline(points: List[Tuple[float, float]], val: int = 1, thickness: int = 0) -> None:
-            for i in range(len(points)):
-                x0, y0 = points[i]
-                x1, y1 = points[(i + 1) % len(points)]
-                steps = int(max(abs(x1 - x0), abs(y1 - y0))) + 1
-                for s in range(steps + 1):
-                    t = s / max(1, steps)
-                    px = x0 + (x1 - x0) * t
-                    py = y0 + (y1 - y0) * t
-                    for dx in range(-thickness, thickness + 1):
-                        for dy in range(-thickness, thickness + 1):
-                            pset(px + dx, py + dy, val)
-
-        def hex_points(cx: float, cy: float, r: float) -> List[Tuple[float, float]]:
-            pts = []
-            for k in range(6):
-                ang = math.radians(60 * k - 30)
-                pts.append((cx + r * math.cos(ang), cy + r * math.sin(ang)))
-            return pts
-
-        def fill_polygon(points: List[Tuple[float, float]], val: int) -> None:
-            if not points:
-                return
-            min_y = int(min(p[1] for p in points))
-            max_y = int(max(p[1] for p in points))
-            for yy in range(max(min_y, 0), min(max_y + 1, h)):
-                # Find intersections of scanline with edges
-                xs: List[float] = []
-                for i in range(len(points)):
-                    x0, y0 = points[i]
-                    x1, y1 = points[(i + 1) % len(points)]
-                    if (y0 <= yy < y1) or (y1 <= yy < y0):
-                        if y1 == y0:
-                            continue
-                        t = (yy - y0) / (y1 - y0)
-                        xs.append(x0 + t * (x1 - x0))
-                xs.sort()
-                for j in range(0, len(xs), 2):
-                    if j + 1 >= len(xs):
-                        break
-                    x_start = int(round(xs[j]))
-                    x_end = int(round(xs[j + 1]))
-                    for xx in range(max(x_start, 0), min(x_end + 1, w)):
-                        pset(xx, yy, val)
-
-        def point_in_polygon(px: float, py: float, points: List[Tuple[float, float]]) -> bool:
-            inside = False
-            n = len(points)
-            for i in range(n):
-                x0, y0 = points[i]
-                x1, y1 = points[(i + 1) % n]
-                if ((y0 > py) != (y1 > py)):
-                    xinters = (py - y0) * (x1 - x0) / (y1 - y0 + 1e-9) + x0
-                    if px < xinters:
-                        inside = not inside
-            return inside
+        # Char overlays: map per character row yc -> list of (x_start, text, attr)
+        char_overlays: Dict[int, List[Tuple[int, str, str]]] = {}
 
         # Draw each tile (fill first), then outlines after to ensure edges are visible
-        hex_centers: Dict[Tuple[int, int], Tuple[float, float]] = {}
-        for tidx, (row, col) in self.tile_positions.items():
-            row_offset = abs(2 - row) * (x_spacing // 2)
-            cx = x_offset + col * x_spacing + row_offset + hex_radius
-            cy = y_offset + row * y_spacing + hex_radius
-            hp = hex_points(cx, cy, hex_radius)
-            hex_centers[(row, col)] = (cx, cy)
-            # Resource fill
-            tile = self.board.tiles[tidx]
-            res = tile.resource
+        for tidx, res, hp in hexes:
             # Map resource to pixel value range 11..16
-            res_val = {
-                "wood": 11,
-                "brick": 12,
-                "sheep": 13,
-                "wheat": 14,
-                "ore": 15,
-                "desert": 16,
-            }.get(res, 16)
-            fill_polygon(hp, val=res_val)
+            res_val = RESOURCE_VALUES.get(res, 16)
+            _fill_polygon(pixels, w, h, hp, val=res_val)
             # Texture overlay per resource using ASCII glyphs
             min_x = max(0, int(min(p[0] for p in hp) - 1))
             max_x = min(w - 1, int(max(p[0] for p in hp) + 1))
             min_yc = max(0, int(max(0, int(min(p[1] for p in hp)) // 2) - 1))
             max_yc = min((h - 1) // 2, int(min((h - 1) // 2, int(max(p[1] for p in hp) // 2) + 1)))
-            def texture_char(rx: str, x: int, yc: int) -> str:
-                k = (x + yc) % 4
-                if rx == "wood":
-                    return "^" if k % 2 == 0 else "Y"
-                if rx == "brick":
-                    return "#" if k in (0, 1) else ":"
-                if rx == "sheep":
-                    return "." if k != 0 else "o"
-                if rx == "wheat":
-                    return "Y" if k % 2 == 0 else "/"
-                if rx == "ore":
-                    return "*" if k % 2 == 0 else "+"
-                if rx == "desert":
-                    return " " if k != 0 else "."
-                return "."
             if res != "sheep":
                 # Default grid texture for non-sheep resources
                 for yc in range(min_yc, max_yc + 1):
                     pyc = yc * 2 + 1
                     for x in range(min_x, max_x + 1):
                         pxc = x + 0.5
-                        if point_in_polygon(pxc, pyc, hp):
-                            ch = texture_char(res, x, yc)
+                        if _point_in_polygon(pxc, pyc, hp):
+                            ch = _texture_char(res, x, yc)
                             overlays = char_overlays.setdefault(yc, [])
-                            overlays.append((x, ch, {
-                                11: "res_wood",
-                                12: "res_brick",
-                                13: "res_sheep",
-                                14: "res_wheat",
-                                15: "res_ore",
-                                16: "res_desert",
-                            }[res_val]))
+                            overlays.append((x, ch, RESOURCE_ATTRS[res_val]))
             else:
                 # Sheep: ensure light-green background shows by overlaying spaces with res_sheep
                 for yc in range(min_yc, max_yc + 1):
                     pyc = yc * 2 + 1
                     for x in range(min_x, max_x + 1):
                         pxc = x + 0.5
-                        if point_in_polygon(pxc, pyc, hp):
+                        if _point_in_polygon(pxc, pyc, hp):
                             overlays = char_overlays.setdefault(yc, [])
                             overlays.append((x, " ", "res_sheep"))
-                # Then scatter sheep marks
-                # Determine number of sheep marks based on area in char cells
-                area_chars = max(1, (max_x - min_x + 1) * (max_yc - min_yc + 1))
-                count = max(8, min(24, area_chars // 20))
-                rng = random.Random(tidx)
-                attempts = 0
-                placed: List[Tuple[int, int]] = []
-                while len(placed) < count and attempts < count * 10:
-                    attempts += 1
-                    yc = rng.randint(min_yc, max_yc)
-                    x = rng.randint(min_x, max_x)
-                    # Jitter bias inward: skip near outside by checking center inside polygon
-                    pxc = x + 0.5
-                    pyc = yc * 2 + 1
-                    if not point_in_polygon(pxc, pyc, hp):
-                        continue
-                    # Simple spacing: avoid placing next to an existing mark
-                    too_close = False
-                    for (px, py) in placed:
-                        if max(abs(px - x), abs(py - yc)) <= 1:
-                            too_close = True
-                            break
-                    if too_close:
-                        continue
-                    placed.append((x, yc))
+                for x, yc in _scatter_sheep(tidx, min_x, max_x, min_yc, max_yc, lambda px, py: _point_in_polygon(px, py, hp)):
                     overlays = char_overlays.setdefault(yc, [])
                     overlays.append((x, "o", "sheep_mark"))
-            # Vertices and edges map
-            for vi, (vx, vy) in enumerate(hp):
-                vid = (row, col, vi)
-                self.vertex_points[vid] = (vx, vy)
-            for ei in range(6):
-                x0, y0 = hp[ei]
-                x1, y1 = hp[(ei + 1) % 6]
-                self.edge_points[(row, col, ei)] = ((x0 + x1) / 2, (y0 + y1) / 2)
 
+        # Draw default hex edges in black on top of fills (1 char wide)
+        for _tidx, _res, hp in hexes:
+            # Use higher priority value so edges override resource fills
+            _draw_polyline(pixels, w, h, hp, val=18, thickness=0)
+        return pixels, char_overlays
+
+    def _dynamic_overlays(
+        self, layers: "_StaticLayers"
+    ) -> Tuple[Dict[int, List[Tuple[int, str, str]]], List[Tuple[int, List[Tuple[float, float]]]], List[Tuple[float, float]]]:
+        # Per-frame pieces: char overlays (numbers, robber, buildings), road segments and hover pixels
+        w = layers.width
+        h = layers.height
+        hex_radius = layers.hex_radius
+        hex_centers = layers.hex_centers
+        char_overlays: Dict[int, List[Tuple[int, str, str]]] = {}
+        road_segments: List[Tuple[int, List[Tuple[float, float]]]] = []
+        hover_pixels: List[Tuple[float, float]] = []
+
+        for tidx, (row, col) in self.tile_positions.items():
+            cx, cy = hex_centers[(row, col)]
             # Robber marker: overlay 'R' and suppress number
             robber_here = (tidx == self.robber_index)
             if robber_here:
@@ -352,7 +537,7 @@ class HalfBlockCanvas(urwid.WidgetWrap):
                     overlays.append((max(0, min(w - len(text), tx)), text, "number"))
 
             # Tile number overlay centered (skip desert 7)
-            num = tile.number
+            num = self.board.tiles[tidx].number
             if num != 7 and not robber_here:
                 text = str(num)
                 tx = int(round(cx - len(text) // 2))
@@ -361,66 +546,14 @@ class HalfBlockCanvas(urwid.WidgetWrap):
                     overlays = char_overlays.setdefault(ty_char, [])
                     overlays.append((max(0, min(w - len(text), tx)), text, "number"))
 
-        # Build canonical vertex clusters so shared intersections across tiles map to same key
-        centers: List[Tuple[int, int]] = []
-        for vid, (vx, vy) in self.vertex_points.items():
-            cx = int(round(vx))
-            cy = int(round(vy / 2))
-            assigned: Optional[Tuple[int, int]] = None
-            for (ux, uy) in centers:
-                if max(abs(cx - ux), abs(cy - uy)) <= 1:
-                    assigned = (ux, uy)
-                    break
-            if assigned is None:
-                centers.append((cx, cy))
-                assigned = (cx, cy)
-            self.vertex_char_key_map[vid] = assigned
-
-        # Build canonical edge clusters so shared edges across tiles map to same key
-        edge_centers: List[Tuple[int, int]] = []
-        for eid, (ex, ey) in self.edge_points.items():
-            cx = int(round(ex))
-            cy = int(round(ey / 2))
-            assigned_e: Optional[Tuple[int, int]] = None
-            for (ux, uy) in edge_centers:
-                if max(abs(cx - ux), abs(cy - uy)) <= 1:
-                    assigned_e = (ux, uy)
-                    break
-            if assigned_e is None:
-                edge_centers.append((cx, cy))
-                assigned_e = (cx, cy)
-            self.edge_char_key_map[eid] = assigned_e
-
-        # Draw default hex edges in black on top of fills (1 char wide)
-        for row, col in hex_centers.keys():
-            cx, cy = hex_centers[(row, col)]
-            hp = hex_points(cx, cy, hex_radius)
-            # Use higher priority value so edges override resource fills
-            draw_polyline(hp, val=18, thickness=0)
-
-        # Draw placed roads per player and color the edge border for that player
+        # Placed roads per player as edge segments
         for pid, roads in self.player_roads.items():
             for (r, c, ei) in roads:
                 cx, cy = hex_centers.get((r, c), (None, None))  # type: ignore[assignment]
                 if cx is None:
                     continue
-                hp = hex_points(cx, cy, hex_radius)
-                x0, y0 = hp[ei]
-                x1, y1 = hp[(ei + 1) % 6]
-                draw_polyline([(x0, y0), (x1, y1)], val=21, thickness=0)
-                # Mark char cells along this edge to use the player's road color
-                steps = int(max(abs(x1 - x0), abs(y1 - y0))) + 1
-                for s in range(steps + 1):
-                    t = s / max(1, steps)
-                    px = x0 + (x1 - x0) * t
-                    py = y0 + (y1 - y0) * t
-                    x_char = int(round(px))
-                    # Mark both adjacent char rows to cover half-block boundaries
-                    y_char_main = int(round(py / 2))
-                    y_char_alt = int(py // 2)
-                    for y_char in {y_char_main, y_char_alt}:
-                        if 0 <= x_char < w and 0 <= y_char < (h + 1) // 2:
-                            road_char_attrs[(x_char, y_char)] = f"p{pid}_road"
+                hp = _hex_points(cx, cy, hex_radius)
+                road_segments.append((pid, [hp[ei], hp[(ei + 1) % 6]]))
 
         # Draw placed settlements per player
         for pid, verts in self.player_settlements.items():
@@ -428,7 +561,7 @@ class HalfBlockCanvas(urwid.WidgetWrap):
                 cx, cy = hex_centers.get((r, c), (None, None))  # type: ignore[assignment]
                 if cx is None:
                     continue
-                hp = hex_points(cx, cy, hex_radius)
+                hp = _hex_points(cx, cy, hex_radius)
                 vx, vy = hp[vi]
                 vx_ch = int(round(vx))
                 vy_ch = int(round(vy / 2))
@@ -447,7 +580,7 @@ class HalfBlockCanvas(urwid.WidgetWrap):
                 cx, cy = hex_centers.get((r, c), (None, None))  # type: ignore[assignment]
                 if cx is None:
                     continue
-                hp = hex_points(cx, cy, hex_radius)
+                hp = _hex_points(cx, cy, hex_radius)
                 vx, vy = hp[vi]
                 vx_ch = int(round(vx))
                 vy_ch = int(round(vy / 2))
@@ -460,23 +593,76 @@ class HalfBlockCanvas(urwid.WidgetWrap):
                         overlays = char_overlays.setdefault(ty, [])
                         overlays.append((tx, glyph, f"p{pid}_city_bg"))
 
+        # Suggested spots while placing a settlement
+        if self.mode == "settlement":
+            for (r, c, vi) in self.hint_vertices:
+                cx, cy = hex_centers.get((r, c), (None, None))  # type: ignore[assignment]
+                if cx is None:
+                    continue
+                vx, vy = _hex_points(cx, cy, hex_radius)[vi]
+                tx = int(round(vx))
+                ty = int(round(vy / 2))
+                if 0 <= tx < w and 0 <= ty < (h + 1) // 2:
+                    char_overlays.setdefault(ty, []).append((tx, "*", "hint"))
+
         # Hover highlights
         if self.mode == "settlement" and self.hover_vertex is not None:
             vx, vy = self.vertex_points.get(self.hover_vertex, (None, None))  # type: ignore[assignment]
             if vx is not None:
                 for dx in range(-1, 2):
                     for dy in range(-1, 2):
-                        pset(vx + dx, vy + dy, 2)
+                        hover_pixels.append((vx + dx, vy + dy))
         if self.mode == "road" and self.hover_edge is not None:
             ex, ey = self.edge_points.get(self.hover_edge, (None, None))  # type: ignore[assignment]
             if ex is not None:
                 for dx in range(-2, 3):
-                    pset(ex + dx, ey, 2)
+                    hover_pixels.append((ex + dx, ey))
+        return char_overlays, road_segments, hover_pixels
+
+    def _render(self) -> List[List[Tuple[str, str]]]:
+        # Composite dynamic overlays (numbers/robber, pieces, hover) onto the cached static layers
+        layers = self._static_layers()
+        dynamic_overlays, road_segments, hover_pixels = self._dynamic_overlays(layers)
+        if self.backend == "numpy":
+            return half_block_numpy.compose(layers, dynamic_overlays, road_segments, hover_pixels)
+
+        w = layers.width
+        h = layers.height
+        pixels = [row[:] for row in layers.pixels]
+        char_overlays: Dict[int, List[Tuple[int, str, str]]] = {
+            yc: list(items) for yc, items in layers.char_overlays.items()
+        }
+        for yc, items in dynamic_overlays.items():
+            char_overlays.setdefault(yc, []).extend(items)
+        # Road color overrides per char cell (x_char, y_char) -> attr name
+        road_char_attrs: Dict[Tuple[int, int], str] = {}
+
+        # Draw placed roads per player and color the edge border for that player
+        for pid, segment in road_segments:
+            (x0, y0), (x1, y1) = segment
+            _draw_polyline(pixels, w, h, segment, val=21, thickness=0)
+            # Mark char cells along this edge to use the player's road color
+            steps = int(max(abs(x1 - x0), abs(y1 - y0))) + 1
+            for s in range(steps + 1):
+                t = s / max(1, steps)
+                px = x0 + (x1 - x0) * t
+                py = y0 + (y1 - y0) * t
+                x_char = int(round(px))
+                # Mark both adjacent char rows to cover half-block boundaries
+                y_char_main = int(round(py / 2))
+                y_char_alt = int(py // 2)
+                for y_char in {y_char_main, y_char_alt}:
+                    if 0 <= x_char < w and 0 <= y_char < (h + 1) // 2:
+                        road_char_attrs[(x_char, y_char)] = f"p{pid}_road"
+
+        for hx, hy in hover_pixels:
+            _pset(pixels, w, h, hx, hy, 2)
 
         # Convert pixels -> half-block lines with attributes
         # Build per-row arrays then compress to markup; map two vertical pixels to one char
         lines: List[List[Tuple[str, str]]] = []
         for y in range(0, h, 2):
+            yc = y // 2
             chars: List[str] = [" " for _ in range(w)]
             attrs: List[str] = ["board" for _ in range(w)]
             for x in range(0, w):
@@ -499,15 +685,8 @@ class HalfBlockCanvas(urwid.WidgetWrap):
                     cell_attr = "road"
                 elif v == 31:
                     cell_attr = "settlement"
-                elif v in (11, 12, 13, 14, 15, 16):
-                    cell_attr = {
-                        11: "res_wood",
-                        12: "res_brick",
-                        13: "res_sheep",
-                        14: "res_wheat",
-                        15: "res_ore",
-                        16: "res_desert",
-                    }[v]
+                elif v in RESOURCE_ATTRS:
+                    cell_attr = RESOURCE_ATTRS[v]
                 else:
                     cell_attr = "board"
                 # Apply per-player road color if present
@@ -534,7 +713,6 @@ class HalfBlockCanvas(urwid.WidgetWrap):
                     attrs[x] = cell_attr
                 chars[x] = ch
             # Apply overlays (textures and numbers); textures should not overwrite edges/roads
-            yc = y // 2
             if yc in char_overlays:
                 for (x0, text, attr_name) in char_overlays[yc]:
                     for i, tch in enumerate(text):
@@ -563,32 +741,70 @@ class HalfBlockCanvas(urwid.WidgetWrap):
                 parts.append((run_attr, "".join(run_text)))
             lines.append(parts)
 
-        text_widgets: List[urwid.Text] = []
-        for segments in lines:
-            # segments is list of (attr, text)
-            markup: List[Tuple[str, str]] = segments
-            text_widgets.append(urwid.Text(markup))
-        return urwid.ListBox(urwid.SimpleFocusListWalker(text_widgets))
-
-    def selectable(self) -> bool:
-        return True
+        return lines
+
+    def _redraw(self, invalidate: bool = True) -> None:
+        # Re-encode only character rows that changed since the last frame
+        lines = self._render()
+        if len(lines) != len(self._row_markup):
+            self._row_text = [b""] * len(lines)
+            self._row_attr = [[] for _ in lines]
+            self._row_cs = [[] for _ in lines]
+            self.dirty_rows = list(range(len(lines)))
+        else:
+            self.dirty_rows = [yc for yc, markup in enumerate(lines) if markup != self._row_markup[yc]]
+        for yc in self.dirty_rows:
+            self._row_text[yc], self._row_attr[yc], self._row_cs[yc] = _encode_row(lines[yc])
+        self._row_markup = lines
+        if self.dirty_rows:
+            self._version += 1
+            if invalidate:
+                self._invalidate()
+
+    def _text_canvas(self) -> urwid.TextCanvas:
+        # One TextCanvas per state version, shared by every render until something changes
+        cached = self._canvas_cache
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        canvas = urwid.TextCanvas(
+            list(self._row_text),
+            [list(a) for a in self._row_attr],
+            [list(c) for c in self._row_cs],
+            maxcol=self.pixel_width,
+            check_width=False,
+        )
+        self._canvas_cache = (self._version, canvas)
+        return canvas
+
+    def render(self, size, focus: bool = False) -> urwid.Canvas:  # type: ignore[no-untyped-def]
+        maxcol, maxrow = size
+        # Lay the board out for the box we were given (two pixel rows per char row)
+        pixel_size = (max(MIN_PIXEL_SIZE, maxcol), max(MIN_PIXEL_SIZE, maxrow * 2))
+        if pixel_size != (self.pixel_width, self.pixel_height):
+            self.pixel_width, self.pixel_height = pixel_size
+            self._redraw(invalidate=False)
+        # Wrap the shared TextCanvas; the wrapper (not the cached canvas) gets finalized
+        canvas = urwid.CompositeCanvas(self._text_canvas())
+        rows = len(self._row_text)
+        canvas.pad_trim_left_right(0, maxcol - self.pixel_width)
+        canvas.pad_trim_top_bottom(0, maxrow - rows)
+        return canvas
 
     def mouse_event(self, size, event, button, col, row, focus):  # type: ignore[no-untyped-def]
         if event not in ('mouse press', 'mouse drag'):
             return False
-        # Convert char coordinates to pixel coordinates (top-left of half-block cell)
-        px = col
-        py = row * 2
-        target_vertex = self._nearest(self.vertex_points, px, py)
-        target_edge = self._nearest(self.edge_points, px, py)
+        # Char cell -> precomputed nearest target; only the active mode is looked up
+        target_vertex = self.vertex_cells.get((col, row)) if self.mode == "settlement" else None
+        target_edge = self.edge_cells.get((col, row)) if self.mode == "road" else None
 
         changed = False
         if self.mode == "settlement" and target_vertex is not None:
+            # Dragging within the same hover target leaves every row clean; skip the frame
+            changed = changed or target_vertex != self.hover_vertex or event == 'mouse press'
             self.hover_vertex = target_vertex
-            changed = True
             if event == 'mouse press':
                 # Prevent overlap at shared vertex across adjacent tiles (block regardless of owner)
-                key_v = self._vertex_point_key(target_vertex)
+                key_v = topology.vertex_id(*target_vertex)
                 if key_v in self.occupied_vertices:
                     return False
                 pid = self.current_player_id
@@ -598,11 +814,11 @@ class HalfBlockCanvas(urwid.WidgetWrap):
                     verts.append(target_vertex)
                 self.on_place_settlement(target_vertex)
         if self.mode == "road" and target_edge is not None:
+            changed = changed or target_edge != self.hover_edge or event == 'mouse press'
             self.hover_edge = target_edge
-            changed = True
             if event == 'mouse press':
-                # Prevent overlap using canonicalized char-grid shared midpoint key
-                key = self._edge_midpoint_char_key(target_edge)
+                # Prevent overlap on the shared side of adjacent tiles
+                key = topology.edge_id(*target_edge)
                 if key in self.occupied_edges:
                     return False
                 pid = self.current_player_id
@@ -611,21 +827,6 @@ class HalfBlockCanvas(urwid.WidgetWrap):
                 roads.append(target_edge)
                 self.on_place_road(target_edge)
         if changed:
-            self._w = self._render()
+            self._redraw()
             return True
         return False
-
-    @staticmethod
-    def _nearest(points: Dict[Tuple[int, int, int], Tuple[float, float]], x: int, y: int):
-        best = None
-        best_d = 1e9
-        for pid, (px, py) in points.items():
-            d = (px - x) * (px - x) + (py - y) * (py - y)
-            if d < best_d:
-                best_d = d
-                best = pid
-        if best_d > 100:  # radius threshold
-            return None
-        return best
-
-
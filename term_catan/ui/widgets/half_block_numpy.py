@@ -0,0 +1,237 @@
+"""NumPy rasterizer backend for HalfBlockCanvas.
+
+Mirrors the pure-Python rasterizer in ``half_block_canvas`` pixel for pixel, but
+fills hexes, tests texture cells and maps half-block glyphs/attributes with
+array operations instead of per-pixel loops.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+import term_catan.ui.widgets.half_block_canvas as hbc
+
+
+Point = Tuple[float, float]
+
+# Glyph per (top lit, bottom lit) pair, indexed by top + 2 * bottom
+GLYPHS = np.array([" ", "▀", "▄", "█"])
+# Pixel values drawn as board edges or roads; textures never cover them
+EDGE_VALUES = (1, 18, 21)
+
+# Attribute names are interned to small ints so they can live in arrays
+ATTR_NAMES: List[str] = []
+_ATTR_INDEX: Dict[str, int] = {}
+
+
+def attr_index(name: str) -> int:
+    idx = _ATTR_INDEX.get(name)
+    if idx is None:
+        idx = len(ATTR_NAMES)
+        ATTR_NAMES.append(name)
+        _ATTR_INDEX[name] = idx
+    return idx
+
+
+def _value_attr(v: int) -> str:
+    if v == 2:
+        return "focus"
+    if v in (1, 18):
+        return "edge"
+    if v == 21:
+        return "road"
+    if v == 31:
+        return "settlement"
+    return hbc.RESOURCE_ATTRS.get(v, "board")
+
+
+@lru_cache(maxsize=None)
+def value_attrs() -> np.ndarray:
+    """Pixel value -> attr index lookup table."""
+    return np.array([attr_index(_value_attr(v)) for v in range(256)], dtype=np.int16)
+
+
+def points_in_polygon(px: np.ndarray, py: np.ndarray, points: List[Point]) -> np.ndarray:
+    """Vectorized even-odd test, same arithmetic as ``_point_in_polygon``."""
+    inside = np.zeros(np.broadcast(px, py).shape, dtype=bool)
+    n = len(points)
+    for i in range(n):
+        x0, y0 = points[i]
+        x1, y1 = points[(i + 1) % n]
+        crosses = (y0 > py) != (y1 > py)
+        xinters = (py - y0) * (x1 - x0) / (y1 - y0 + 1e-9) + x0
+        inside ^= crosses & (px < xinters)
+    return inside
+
+
+def fill_polygon(pixels: np.ndarray, points: List[Point], val: int) -> None:
+    """Scanline fill of a convex polygon, one half-plane span per pixel row."""
+    h, w = pixels.shape
+    min_y = int(min(p[1] for p in points))
+    max_y = int(max(p[1] for p in points))
+    ys = np.arange(max(min_y, 0), min(max_y + 1, h))
+    if ys.size == 0:
+        return
+    yy = ys[:, None].astype(float)
+    pts = np.asarray(points, dtype=float)
+    x0, y0 = pts[:, 0], pts[:, 1]
+    nxt = np.roll(pts, -1, axis=0)
+    x1, y1 = nxt[:, 0], nxt[:, 1]
+    crosses = (((y0 <= yy) & (yy < y1)) | ((y1 <= yy) & (yy < y0))) & (y1 != y0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xs = x0 + (yy - y0) / (y1 - y0) * (x1 - x0)
+    # Convex polygons cross each scanline exactly twice (or not at all)
+    hit = crosses.sum(axis=1) >= 2
+    x_start = np.rint(np.where(crosses, xs, np.inf).min(axis=1))
+    x_end = np.rint(np.where(crosses, xs, -np.inf).max(axis=1))
+    cols = np.arange(w)[None, :]
+    mask = hit[:, None] & (cols >= x_start[:, None]) & (cols <= x_end[:, None])
+    band = pixels[ys]
+    pixels[ys] = np.where(mask, np.maximum(band, val), band)
+
+
+def _segment_samples(x0: float, y0: float, x1: float, y1: float) -> Tuple[np.ndarray, np.ndarray]:
+    steps = int(max(abs(x1 - x0), abs(y1 - y0))) + 1
+    t = np.arange(steps + 1) / max(1, steps)
+    return x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
+
+
+def set_pixels(pixels: np.ndarray, xs: np.ndarray, ys: np.ndarray, val: int) -> None:
+    h, w = pixels.shape
+    ix = np.rint(xs).astype(np.intp)
+    iy = np.rint(ys).astype(np.intp)
+    ok = (ix >= 0) & (ix < w) & (iy >= 0) & (iy < h)
+    np.maximum.at(pixels, (iy[ok], ix[ok]), val)
+
+
+def draw_polyline(pixels: np.ndarray, points: List[Point], val: int, thickness: int = 0) -> None:
+    offsets = np.arange(-thickness, thickness + 1)
+    for i in range(len(points)):
+        x0, y0 = points[i]
+        x1, y1 = points[(i + 1) % len(points)]
+        px, py = _segment_samples(x0, y0, x1, y1)
+        if thickness:
+            px = (px[:, None, None] + offsets[:, None]).ravel()
+            py = (py[:, None, None] + offsets[None, :]).ravel()
+        set_pixels(pixels, px, py, val)
+
+
+def rasterize_static(
+    w: int, h: int, hexes: List[Tuple[int, str, List[Point]]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Terrain fills + outlines, and per-char-cell texture glyphs/attr indices."""
+    rows = (h + 1) // 2
+    pixels = np.zeros((h, w), dtype=np.int16)
+    tex_chars = np.full((rows, w), " ", dtype="<U1")
+    tex_attrs = np.full((rows, w), -1, dtype=np.int16)
+    for tidx, res, hp in hexes:
+        res_val = hbc.RESOURCE_VALUES.get(res, 16)
+        fill_polygon(pixels, hp, res_val)
+        min_x = max(0, int(min(p[0] for p in hp) - 1))
+        max_x = min(w - 1, int(max(p[0] for p in hp) + 1))
+        min_yc = max(0, int(max(0, int(min(p[1] for p in hp)) // 2) - 1))
+        max_yc = min((h - 1) // 2, int(min((h - 1) // 2, int(max(p[1] for p in hp) // 2) + 1)))
+        xs = np.arange(min_x, max_x + 1)
+        ycs = np.arange(min_yc, max_yc + 1)
+        inside = points_in_polygon(xs[None, :] + 0.5, (ycs * 2 + 1)[:, None], hp)
+        sub = (slice(min_yc, max_yc + 1), slice(min_x, max_x + 1))
+        if res != "sheep":
+            table = np.array([hbc._texture_char(res, k, 0) for k in range(4)])
+            glyphs = table[(xs[None, :] + ycs[:, None]) % 4]
+            tex_chars[sub] = np.where(inside, glyphs, tex_chars[sub])
+            tex_attrs[sub] = np.where(inside, attr_index(hbc.RESOURCE_ATTRS[res_val]), tex_attrs[sub])
+        else:
+            tex_chars[sub] = np.where(inside, " ", tex_chars[sub])
+            tex_attrs[sub] = np.where(inside, attr_index("res_sheep"), tex_attrs[sub])
+
+            def inside_cell(px: float, py: float) -> bool:
+                return bool(inside[(int(py) - 1) // 2 - min_yc, int(px) - min_x])
+
+            mark = attr_index("sheep_mark")
+            for x, yc in hbc._scatter_sheep(tidx, min_x, max_x, min_yc, max_yc, inside_cell):
+                tex_chars[yc, x] = "o"
+                tex_attrs[yc, x] = mark
+    for _tidx, _res, hp in hexes:
+        draw_polyline(pixels, hp, 18)
+    return pixels, tex_chars, tex_attrs
+
+
+def compose(
+    layers: "hbc._StaticLayers",
+    char_overlays: Dict[int, List[Tuple[int, str, str]]],
+    road_segments: List[Tuple[int, List[Point]]],
+    hover_pixels: List[Point],
+) -> List[List[Tuple[str, str]]]:
+    """Composite the per-frame pieces onto the static arrays and return row markup."""
+    w = layers.width
+    h = layers.height
+    rows = (h + 1) // 2
+    pixels = layers.pixels.copy()
+    road_attrs = np.full((rows, w), -1, dtype=np.int16)
+    for pid, segment in road_segments:
+        draw_polyline(pixels, segment, 21)
+        (x0, y0), (x1, y1) = segment
+        px, py = _segment_samples(x0, y0, x1, y1)
+        x_char = np.rint(px).astype(np.intp)
+        road = attr_index(f"p{pid}_road")
+        for y_char in (np.rint(py / 2).astype(np.intp), np.floor(py / 2).astype(np.intp)):
+            ok = (x_char >= 0) & (x_char < w) & (y_char >= 0) & (y_char < rows)
+            road_attrs[y_char[ok], x_char[ok]] = road
+    if hover_pixels:
+        hover = np.asarray(hover_pixels, dtype=float)
+        set_pixels(pixels, hover[:, 0], hover[:, 1], 2)
+
+    # Half-block conversion: two pixel rows per char row
+    if h % 2:
+        pixels = np.vstack([pixels, np.zeros((1, w), dtype=pixels.dtype)])
+    top = pixels[0::2]
+    bottom = pixels[1::2]
+    chars = GLYPHS[(top > 0).astype(np.intp) + 2 * (bottom > 0)]
+    v = np.maximum(top, bottom)
+    attrs = value_attrs()[v]
+    edge = np.isin(v, EDGE_VALUES)
+
+    # Per-player road colors; road pixels without a marked cell borrow a neighbour's color
+    colored = edge & (road_attrs >= 0)
+    attrs[colored] = road_attrs[colored]
+    for yc, x in np.argwhere((v == 21) & (road_attrs < 0)):
+        for dy in (-1, 0, 1):
+            found = -1
+            for dx in (-1, 0, 1):
+                if dx == 0 and dy == 0:
+                    continue
+                ny, nx = yc + dy, x + dx
+                if 0 <= ny < rows and 0 <= nx < w and road_attrs[ny, nx] >= 0:
+                    found = road_attrs[ny, nx]
+                    break
+            if found >= 0:
+                attrs[yc, x] = found
+                break
+
+    # Textures never overwrite edges/roads
+    textured = (layers.tex_attrs >= 0) & ~edge
+    chars[textured] = layers.tex_chars[textured]
+    attrs[textured] = layers.tex_attrs[textured]
+
+    for yc, items in char_overlays.items():
+        if not 0 <= yc < rows:
+            continue
+        for (x0, text, attr_name) in items:
+            idx = attr_index(attr_name)
+            skip_edges = attr_name.startswith("res_") or attr_name == "sheep_mark"
+            for i, tch in enumerate(text):
+                xi = x0 + i
+                if 0 <= xi < w and not (skip_edges and edge[yc, xi]):
+                    chars[yc, xi] = tch
+                    attrs[yc, xi] = idx
+
+    # Compress each row into (attr, text) runs
+    lines: List[List[Tuple[str, str]]] = []
+    for yc in range(rows):
+        row_attrs = attrs[yc]
+        text = "".join(chars[yc].tolist())
+        bounds = [0, *(np.flatnonzero(row_attrs[1:] != row_attrs[:-1]) + 1).tolist(), w]
+        lines.append([(ATTR_NAMES[row_attrs[s]], text[s:e]) for s, e in zip(bounds, bounds[1:])])
+    return lines
@@ -0,0 +1,98 @@
+"""Differential test: BatchedGame must step exactly like the Games it batches."""
+import random
+
+import numpy as np
+import pytest
+
+from term_catan.core.ai import SimpleAI
+from term_catan.core.batched import PHASE_ACTIONS, PHASE_ROBBER, PHASE_ROLL, BatchedGame
+from term_catan.core.game import Game
+from term_catan.core.movegen import NO_OWNER
+
+GAMES = 64
+TURNS = 300
+CHECK_EVERY = 10
+
+BUILDS = (
+    ("city", "city_spots", "build_city"),
+    ("settlement", "settlement_spots", "build_settlement"),
+    ("road", "road_spots", "build_road"),
+)
+
+
+def set_up(seed: int) -> Game:
+    game = Game(num_humans=0, num_ai=4, seed=seed)
+    ai = SimpleAI(game)
+    while game.state.phase == "setup":
+        ai.take_turn_if_ai()
+    return game
+
+
+def assert_same(batch: BatchedGame, games: list) -> None:
+    for i, game in enumerate(games):
+        batched = batch.to_game(i)
+        assert batched.to_dict() == game.to_dict(), f"game {i} state"
+        assert batched.rng.getstate() == game.rng.getstate(), f"game {i} dice"
+
+
+def test_batched_game_matches_game() -> None:
+    games = [set_up(seed) for seed in range(GAMES)]
+    batch = BatchedGame(games)
+    policy = random.Random(5)
+    assert_same(batch, games)
+
+    for turn in range(TURNS):
+        active = batch.winner() == NO_OWNER
+        if not active.any():
+            break
+
+        rolling = active & (batch.phase == PHASE_ROLL)
+        rolls, gains = batch.roll_and_distribute(rolling)
+        for i in np.flatnonzero(rolling):
+            roll, game_gains = games[i].roll_and_distribute()
+            assert roll == rolls[i]
+            for pid, cards in game_gains.items():
+                assert list(cards.values()) == gains[i, pid].tolist()
+
+        robbing = active & (batch.phase == PHASE_ROBBER)
+        tiles = np.array([policy.randrange(19) for _ in range(GAMES)])
+        batch.move_robber(tiles, robbing)
+        for i in np.flatnonzero(robbing):
+            games[i].move_robber(int(tiles[i]))
+
+        for piece, spots_name, build in BUILDS:
+            for _ in range(2):
+                spots = getattr(batch, spots_name)()
+                for i, game in enumerate(games):
+                    expected = getattr(game, spots_name)(game.state.current_player)
+                    assert np.flatnonzero(spots[i]).tolist() == sorted(expected), f"game {i} {piece} spots"
+                building = (
+                    active
+                    & (batch.phase == PHASE_ACTIONS)
+                    & batch.can_afford(piece)
+                    & (batch.pieces_left(piece) > 0)
+                    & spots.any(axis=1)
+                )
+                targets = np.array([
+                    policy.choice(np.flatnonzero(spots[i]).tolist()) if building[i] else 0 for i in range(GAMES)
+                ])
+                getattr(batch, build)(targets, building)
+                for i in np.flatnonzero(building):
+                    getattr(games[i], build)(int(targets[i]))
+
+        batch.end_turn(active)
+        for i in np.flatnonzero(active):
+            games[i].end_turn()
+        if turn % CHECK_EVERY == 0:
+            assert_same(batch, games)
+
+    assert_same(batch, games)
+
+
+def test_rejected_step_changes_nothing() -> None:
+    games = [set_up(seed) for seed in range(4)]
+    batch = BatchedGame(games)
+    before = [batch.to_game(i).to_dict() for i in range(len(games))]
+    with pytest.raises(ValueError):
+        batch.build_city(np.zeros(len(games), dtype=int))
+    assert [batch.to_game(i).to_dict() for i in range(len(games))] == before
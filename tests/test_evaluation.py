@@ -0,0 +1,37 @@
+"""The pure-Python board evaluator must agree with the NumPy one, and the rules must not need NumPy."""
+import random
+import subprocess
+import sys
+
+from term_catan.core import evaluation, evaluation_python
+from term_catan.core.game import Game
+from term_catan.core.topology import NUM_TILES, NUM_VERTICES
+
+
+def test_python_evaluator_matches_numpy() -> None:
+    rng = random.Random(7)
+    for seed in range(20):
+        state = Game(num_humans=0, num_ai=4, seed=seed).state
+        fast = evaluation.BoardEvaluator.build(state)
+        slow = evaluation_python.BoardEvaluator.build(state)
+        for _ in range(30):
+            assert [fast.value(v) for v in range(NUM_VERTICES)] == [slow.value(v) for v in range(NUM_VERTICES)]
+            assert [fast.yields(v) for v in range(NUM_VERTICES)] == [slow.yields(v) for v in range(NUM_VERTICES)]
+            candidates = rng.sample(range(NUM_VERTICES), 20)
+            assert fast.best_spots(candidates, 5) == slow.best_spots(candidates, 5)
+            robber = rng.randrange(NUM_TILES)
+            fast.move_robber(robber)
+            slow.move_robber(robber)
+            fast, slow = fast.clone(), slow.clone()
+
+
+def test_rules_run_without_numpy() -> None:
+    script = (
+        "import sys; sys.modules['numpy'] = None\n"
+        "import term_catan.server\n"
+        "from term_catan import sim\n"
+        "from term_catan.core.game import Game\n"
+        "assert Game(num_humans=0, num_ai=4).board_evaluator().__module__ == 'term_catan.core.evaluation_python'\n"
+        "assert sim.play_game(3, max_turns=60).turns > 0\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)